@@ -0,0 +1,14 @@
+#!/bin/sh
+# Production entry point of the backend container: prepare the database,
+# then serve the app with gunicorn (see task_manager/gunicorn.conf.py).
+# SERVER_INTERFACE=asgi runs the ASGI application on uvicorn workers.
+set -e
+
+sh /app/setup_db.sh
+
+cd /app/task_manager
+if [ "$SERVER_INTERFACE" = "asgi" ]; then
+    export GUNICORN_WORKER_CLASS="${GUNICORN_WORKER_CLASS:-uvicorn.workers.UvicornWorker}"
+    exec poetry run gunicorn task_manager.asgi:application
+fi
+exec poetry run gunicorn task_manager.wsgi:application
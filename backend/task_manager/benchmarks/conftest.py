@@ -0,0 +1,104 @@
+import json
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from task_manager.throttling import AtomicRateThrottleMixin
+
+from .utils import env_int, regressions, seed_tasks
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+
+# Results of the previous accepted run. A new run fails when its p50 or p95
+# latency exceeds the baseline by more than BENCHMARK_THRESHOLD (relative)
+# plus BENCHMARK_SLACK_MS, or when it issues more queries.
+BASELINE_PATH = Path(
+    os.environ.get("BENCHMARK_BASELINE", BENCHMARK_DIR / "baseline.json")
+)
+LAST_RUN_PATH = BENCHMARK_DIR / "last_run.json"
+THRESHOLD = float(os.environ.get("BENCHMARK_THRESHOLD", 0.5))
+SLACK_MS = float(os.environ.get("BENCHMARK_SLACK_MS", 5))
+UPDATE_BASELINE = bool(os.environ.get("BENCHMARK_UPDATE_BASELINE"))
+
+# Benchmark name -> measurements (latencies, queries, throughput)
+RESULTS: dict[str, dict[str, float]] = {}
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.environ.get("RUN_BENCHMARKS"):
+        return
+    skip = pytest.mark.skip(reason="set RUN_BENCHMARKS=1 to run benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not RESULTS:
+        return
+    terminalreporter.section("benchmark results")
+    for name, result in RESULTS.items():
+        stats = "  ".join(f"{key}={value}" for key, value in result.items())
+        terminalreporter.write_line(f"{name:<56} {stats}")
+
+
+def pytest_sessionfinish(session):
+    if not RESULTS:
+        return
+    LAST_RUN_PATH.write_text(json.dumps(RESULTS, indent=2) + "\n")
+    if UPDATE_BASELINE or not BASELINE_PATH.exists():
+        baseline = load_baseline()
+        baseline.update(RESULTS)
+        BASELINE_PATH.write_text(
+            json.dumps(baseline, indent=2, sort_keys=True) + "\n"
+        )
+
+
+def load_baseline():
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text())
+
+
+@pytest.fixture(scope="session")
+def baseline():
+    return {} if UPDATE_BASELINE else load_baseline()
+
+
+@pytest.fixture
+def record(baseline):
+    """
+    Store a named result for the summary and the baseline file, failing
+    the test if it regressed against the stored baseline.
+    """
+
+    def record(name, result):
+        RESULTS[name] = result
+        if name in baseline:
+            problems = regressions(result, baseline[name], THRESHOLD, SLACK_MS)
+            if problems:
+                pytest.fail(f"{name} regressed: {'; '.join(problems)}")
+
+    return record
+
+
+@pytest.fixture(scope="session")
+def seeded_users(django_db_setup, django_db_blocker):
+    """
+    Seed ``BENCHMARK_TASKS`` tasks over ``BENCHMARK_USERS`` users once per
+    run. Each benchmark runs in a transaction, so its writes are undone.
+    """
+    with django_db_blocker.unblock():
+        return seed_tasks(
+            env_int("BENCHMARK_TASKS", 10000), env_int("BENCHMARK_USERS", 100)
+        )
+
+
+@pytest.fixture(autouse=True)
+def no_throttling():
+    with mock.patch.object(
+        AtomicRateThrottleMixin, "allow_request", return_value=True
+    ):
+        yield
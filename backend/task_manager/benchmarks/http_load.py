@@ -0,0 +1,84 @@
+"""
+Load a running server with concurrent GET requests and print requests/s
+and latency percentiles. Used for the throughput numbers in the README:
+
+    python -m benchmarks.http_load http://localhost:8000/api/tasks/ \\
+        --token <access token> --concurrency 16 --duration 20
+"""
+
+import argparse
+import http.client
+import json
+import math
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+def worker(url, headers, deadline, latencies, errors):
+    parts = urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    connection = http.client.HTTPConnection(parts.netloc, timeout=30)
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            errors.append(None)
+            connection.close()
+            continue
+        if response.status >= 400:
+            errors.append(response.status)
+        else:
+            latencies.append(time.perf_counter() - started)
+        if response.getheader("Connection", "").lower() == "close":
+            connection.close()
+
+
+def percentile(ordered, pct):
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("url")
+    parser.add_argument("--token", help="JWT access token")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=20)
+    args = parser.parse_args()
+
+    headers = {}
+    if args.token:
+        headers["Authorization"] = f"Bearer {args.token}"
+    latencies, errors = [], []
+    started = time.perf_counter()
+    deadline = started + args.duration
+    threads = [
+        threading.Thread(
+            target=worker,
+            args=(args.url, headers, deadline, latencies, errors),
+        )
+        for _ in range(args.concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    result = {"requests": len(ordered), "errors": len(errors)}
+    if ordered:
+        result.update(
+            req_per_sec=round(len(ordered) / elapsed, 1),
+            p50_ms=round(percentile(ordered, 50) * 1000, 1),
+            p99_ms=round(percentile(ordered, 99) * 1000, 1),
+        )
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
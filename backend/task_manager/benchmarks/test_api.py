@@ -0,0 +1,148 @@
+import json
+from itertools import cycle
+
+import pytest
+from django.contrib.auth.models import User
+from django.test import Client
+
+from tasks.models import Task
+
+from .utils import bearer, env_int, measure
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+REQUESTS = env_int("BENCHMARK_REQUESTS", 200)
+# Token requests hash a password each, so far fewer are sent.
+TOKEN_REQUESTS = env_int("BENCHMARK_TOKEN_REQUESTS", 20)
+
+LIST_QUERIES = [
+    "",
+    "?page=50",
+    "?status=pending",
+    "?status=completed",
+    "?due_date=2025-06-01",
+    "?due_date__gte=2025-06-01&due_date__lte=2025-06-30",
+    "?overdue=true",
+    "?ordering=due_date",
+    "?ordering=-due_date",
+    "?status=in_progress&ordering=due_date",
+    "?pagination=cursor",
+    "?pagination=cursor&ordering=-due_date",
+]
+
+
+@pytest.fixture
+def client(seeded_users):
+    return Client(headers=bearer(seeded_users[0]))
+
+
+@pytest.fixture
+def task_ids(seeded_users):
+    return iter(Task.objects.order_by("id").values_list("id", flat=True))
+
+
+def send_json(method, url, data):
+    return method(url, json.dumps(data), content_type="application/json")
+
+
+@pytest.mark.parametrize("query", LIST_QUERIES)
+def test_list(client, record, query):
+    url = f"/api/tasks/{query}"
+    record(f"GET {url}", measure(lambda: client.get(url), REQUESTS))
+
+
+def test_retrieve(client, record, task_ids):
+    ids = cycle(list(task_ids)[:1000])
+    result = measure(lambda: client.get(f"/api/tasks/{next(ids)}/"), REQUESTS)
+    record("GET /api/tasks/{id}/", result)
+
+
+def test_create(client, record, seeded_users):
+    data = {
+        "title": "Benchmark task",
+        "description": "Created by the benchmark",
+        "due_date": "2025-12-31",
+        "assigned_to": seeded_users[1].id,
+    }
+    result = measure(
+        lambda: send_json(client.post, "/api/tasks/", data), REQUESTS
+    )
+    record("POST /api/tasks/", result)
+
+
+def test_partial_update(client, record, task_ids):
+    def request():
+        url = f"/api/tasks/{next(task_ids)}/"
+        return send_json(client.patch, url, {"status": "completed"})
+
+    record("PATCH /api/tasks/{id}/", measure(request, REQUESTS))
+
+
+def test_update(client, record, task_ids, seeded_users):
+    data = {
+        "title": "Updated task",
+        "description": "Updated by the benchmark",
+        "due_date": "2026-01-31",
+        "status": "in_progress",
+        "assigned_to": seeded_users[2].id,
+    }
+
+    def request():
+        return send_json(client.put, f"/api/tasks/{next(task_ids)}/", data)
+
+    record("PUT /api/tasks/{id}/", measure(request, REQUESTS))
+
+
+def test_destroy(client, record, task_ids):
+    result = measure(
+        lambda: client.delete(f"/api/tasks/{next(task_ids)}/"), REQUESTS
+    )
+    record("DELETE /api/tasks/{id}/", result)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "?from=2025-06-01&to=2025-06-07",
+        "?from=2025-01-01&to=2025-12-31&bucket=month",
+    ],
+)
+def test_agenda(client, record, query):
+    url = f"/api/tasks/agenda/{query}"
+
+    def request():
+        response = client.get(url)
+        b"".join(response.streaming_content)
+        return response
+
+    record(f"GET {url}", measure(request, REQUESTS))
+
+
+def test_users(client, record):
+    result = measure(lambda: client.get("/api/users/"), REQUESTS)
+    record("GET /api/users/", result)
+
+
+def test_users_search(client, record):
+    url = "/api/users/?search=bench1"
+    record(f"GET {url}", measure(lambda: client.get(url), REQUESTS))
+
+
+def test_users_directory(client, record):
+    url = "/api/users/directory/"
+    etag = client.get(url)["ETag"]
+    record(f"GET {url}", measure(lambda: client.get(url), REQUESTS))
+    result = measure(
+        lambda: client.get(url, headers={"If-None-Match": etag}), REQUESTS
+    )
+    record(f"GET {url} (If-None-Match)", result)
+
+
+def test_token(record, seeded_users):
+    User.objects.create_user(username="bench-login", password="bench-pass")
+    client = Client()
+    data = {"username": "bench-login", "password": "bench-pass"}
+    result = measure(
+        lambda: send_json(client.post, "/api/token/", data), TOKEN_REQUESTS
+    )
+    record("POST /api/token/", result)
@@ -0,0 +1,88 @@
+import os
+from datetime import date, timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+
+from tasks.models import Task
+
+from .utils import STATUSES, bearer, env_int, measure
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+REQUESTS = env_int("BENCHMARK_REQUESTS", 200)
+# Tasks of the measured user; the rest of the table grows around them.
+USER_TASKS = env_int("BENCHMARK_ASSIGNEE_TASKS", 50)
+# Tasks added for other users before each round, in increasing order.
+SCALES = [
+    int(scale)
+    for scale in os.environ.get(
+        "BENCHMARK_ASSIGNEE_SCALES", "0,100000,1000000"
+    ).split(",")
+]
+
+URLS = [
+    "/api/tasks/mine/",
+    "/api/tasks/mine/?status=pending&ordering=due_date",
+    "/api/users/{id}/tasks/?pagination=cursor",
+]
+
+
+@pytest.fixture(scope="module")
+def assignee(seeded_users, django_db_blocker):
+    """
+    A user with ``USER_TASKS`` tasks, and a function that grows the table
+    with other users' tasks to a given number of extra rows.
+    """
+    start = date(2025, 1, 1)
+    with django_db_blocker.unblock():
+        first_id = Task.objects.order_by("-id").values_list("id", flat=True)[0]
+        user = User.objects.create_user(username="bench-assignee")
+        Task.objects.bulk_create(
+            Task(
+                title=f"Mine {i}",
+                due_date=start + timedelta(days=i),
+                status=STATUSES[i % len(STATUSES)],
+                assigned_to=user,
+            )
+            for i in range(USER_TASKS)
+        )
+    added = 0
+
+    def grow(scale):
+        nonlocal added
+        with django_db_blocker.unblock():
+            for offset in range(added, scale, 5000):
+                Task.objects.bulk_create(
+                    Task(
+                        title=f"Other {i}",
+                        due_date=start + timedelta(days=i % 365),
+                        status=STATUSES[i % len(STATUSES)],
+                        assigned_to=seeded_users[i % len(seeded_users)],
+                    )
+                    for i in range(offset, min(offset + 5000, scale))
+                )
+            added = max(added, scale)
+
+    yield user, grow
+    with django_db_blocker.unblock():
+        # A queryset delete() would load every row to send post_delete.
+        with connection.cursor() as cursor:
+            cursor.execute("DELETE FROM tasks_task WHERE id > %s", [first_id])
+        user.delete()
+
+
+@pytest.mark.parametrize("scale", SCALES)
+def test_assignee_listing(assignee, record, scale):
+    """Per-user listings should cost the same at every table size."""
+    user, grow = assignee
+    grow(scale)
+    client = Client(headers=bearer(user))
+    for url in URLS:
+        url = url.format(id=user.id)
+        record(
+            f"GET {url} (+{scale} tasks)",
+            measure(lambda: client.get(url), REQUESTS),
+        )
@@ -0,0 +1,49 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, Client
+
+from tasks.models import Task
+
+from .utils import bearer, env_int, run_async, run_sync
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+REQUESTS = env_int("BENCHMARK_REQUESTS", 200)
+CONCURRENCY = env_int("BENCHMARK_CONCURRENCY", 20)
+
+
+@pytest.fixture
+def headers(seeded_users):
+    return bearer(seeded_users[0])
+
+
+@pytest.mark.parametrize(
+    "path", ["/api/tasks/?status=pending", "/api/tasks/{id}/"]
+)
+def test_async_vs_wsgi(headers, record, path):
+    path = path.format(id=Task.objects.values_list("id", flat=True).last())
+    async_path = path.replace("/api/", "/api/async/")
+    client, async_client = Client(), AsyncClient()
+
+    def wsgi():
+        return client.get(path, headers=headers)
+
+    def asgi(url):
+        async def request():
+            return await async_client.get(url, headers=headers)
+
+        return request
+
+    # Warm up caches and the token cache on both paths.
+    wsgi()
+    async_to_sync(asgi(async_path))()
+
+    record(f"wsgi drf {path}", run_sync(wsgi, REQUESTS))
+    record(
+        f"asgi drf {path}",
+        async_to_sync(run_async)(asgi(path), REQUESTS, CONCURRENCY),
+    )
+    record(
+        f"asgi native {async_path}",
+        async_to_sync(run_async)(asgi(async_path), REQUESTS, CONCURRENCY),
+    )
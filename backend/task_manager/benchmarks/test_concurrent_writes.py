@@ -0,0 +1,118 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from .utils import env_int, summarize
+
+pytestmark = pytest.mark.benchmark
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+PROCESSES = env_int("BENCHMARK_WRITERS", 8)
+WRITES = env_int("BENCHMARK_WRITES", 100)
+
+# Each writer process inserts tasks in short transactions that read before
+# they write, like the API's create path, and reports the latency of every
+# transaction and how many failed with "database is locked".
+WRITE_WORKER = """
+import json, os, sys, time
+import django
+from django.conf import settings
+
+if os.environ.get("BENCHMARK_SQLITE_LEGACY"):
+    # SQLite as configured before: rollback journal, deferred transactions.
+    settings.DATABASES["default"]["OPTIONS"] = {}
+django.setup()
+
+from django.contrib.auth.models import User
+from django.db import OperationalError, transaction
+from tasks.models import Task
+
+latencies, errors = [], 0
+for i in range(int(sys.argv[1])):
+    started = time.perf_counter()
+    try:
+        with transaction.atomic():
+            user = User.objects.get(username="writer")
+            Task.objects.create(
+                title=f"Task {i}", due_date="2025-12-31", assigned_to=user
+            )
+    except OperationalError:
+        errors += 1
+        continue
+    latencies.append(time.perf_counter() - started)
+print(json.dumps({"latencies": latencies, "errors": errors}))
+"""
+
+SETUP = (
+    "from django.contrib.auth.models import User;"
+    "User.objects.get_or_create(username='writer')"
+)
+
+
+def manage(env, *args):
+    subprocess.run(
+        [sys.executable, "manage.py", *args],
+        cwd=BASE_DIR,
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+
+
+def run_writers(env):
+    manage(env, "migrate", "--verbosity", "0")
+    manage(env, "shell", "-c", SETUP)
+    # The wall clock includes process start-up, which is the same for
+    # every backend.
+    started = time.perf_counter()
+    workers = [
+        subprocess.Popen(
+            [sys.executable, "-c", WRITE_WORKER, str(WRITES)],
+            cwd=BASE_DIR,
+            env=env,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        for _ in range(PROCESSES)
+    ]
+    outputs = [json.loads(worker.communicate()[0]) for worker in workers]
+    elapsed = time.perf_counter() - started
+    latencies = [value for output in outputs for value in output["latencies"]]
+    result = summarize(latencies, elapsed)
+    result["errors"] = sum(output["errors"] for output in outputs)
+    return result
+
+
+@pytest.mark.parametrize("mode", ["sqlite", "sqlite-legacy"])
+def test_sqlite_concurrent_writes(record, tmp_path, mode):
+    env = {
+        **os.environ,
+        "DJANGO_DB_ENGINE": "sqlite",
+        "DJANGO_SQLITE_PATH": str(tmp_path / "writes.sqlite3"),
+    }
+    if mode == "sqlite-legacy":
+        env["BENCHMARK_SQLITE_LEGACY"] = "1"
+    result = run_writers(env)
+    record(f"concurrent writes {mode}", result)
+    if mode == "sqlite":
+        assert result["errors"] == 0
+
+
+@pytest.mark.skipif(
+    not os.environ.get("BENCHMARK_POSTGRES_DB"),
+    reason="set BENCHMARK_POSTGRES_DB to an empty PostgreSQL database",
+)
+def test_postgresql_concurrent_writes(record):
+    env = {
+        **os.environ,
+        "DJANGO_DB_ENGINE": "postgresql",
+        "POSTGRES_DB": os.environ["BENCHMARK_POSTGRES_DB"],
+    }
+    result = run_writers(env)
+    record("concurrent writes postgresql", result)
+    assert result["errors"] == 0
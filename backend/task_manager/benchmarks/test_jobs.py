@@ -0,0 +1,75 @@
+import json
+
+import pytest
+from django.contrib.auth.models import User
+from django.test import Client, TestCase, override_settings
+
+from tasks.models import Task
+
+from .utils import bearer, env_int, measure
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+REQUESTS = env_int("BENCHMARK_REQUESTS", 200)
+
+
+@pytest.fixture
+def client(seeded_users):
+    # Assignees with an address get notification emails.
+    User.objects.filter(pk__in=[user.pk for user in seeded_users]).update(
+        email="bench@example.com"
+    )
+    return Client(headers=bearer(seeded_users[0]))
+
+
+def committed(request):
+    """
+    Run ``request()`` and then its on-commit callbacks, which the test
+    transaction would otherwise hold back, so their cost is measured.
+    """
+
+    def run():
+        with TestCase.captureOnCommitCallbacks(execute=True):
+            return request()
+
+    return run
+
+
+@pytest.mark.parametrize("eager", [True, False], ids=["inline", "queued"])
+def test_write_side_effects(client, record, seeded_users, eager):
+    """
+    Writes with their notification and stats recalculation run inline
+    (``JOBS_EAGER``) versus queued for the worker.
+    """
+    data = json.dumps(
+        {
+            "title": "Benchmark task",
+            "due_date": "2025-12-31",
+            "assigned_to": seeded_users[1].id,
+        }
+    )
+    mode = "inline" if eager else "queued"
+    with override_settings(JOBS_EAGER=eager):
+        result = measure(
+            committed(
+                lambda: client.post(
+                    "/api/tasks/", data, content_type="application/json"
+                )
+            ),
+            REQUESTS,
+        )
+    record(f"POST /api/tasks/ (jobs {mode})", result)
+
+    ids = iter(Task.objects.order_by("id").values_list("id", flat=True))
+    with override_settings(JOBS_EAGER=eager):
+        result = measure(
+            committed(
+                lambda: client.patch(
+                    f"/api/tasks/{next(ids)}/",
+                    json.dumps({"assigned_to": seeded_users[2].id}),
+                    content_type="application/json",
+                )
+            ),
+            REQUESTS,
+        )
+    record(f"PATCH /api/tasks/{{id}}/ reassign (jobs {mode})", result)
@@ -0,0 +1,29 @@
+import time
+
+import pytest
+
+from tasks.models import Task
+from tasks.overdue import Sweeper
+
+from .utils import env_int, summarize
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+# Full sweeps timed; each first marks every open past-due task stale.
+SWEEPS = env_int("BENCHMARK_SWEEPS", 5)
+
+
+@pytest.mark.parametrize("batch_size", [100, 1000])
+def test_sweep_overdue(seeded_users, record, batch_size):
+    """Flag every overdue task of the seeded table, ``batch_size`` a time."""
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(SWEEPS):
+        stale = Task.objects.filter(is_overdue=True).update(is_overdue=False)
+        begin = time.perf_counter()
+        metrics = Sweeper(batch_size=batch_size).run()
+        latencies.append(time.perf_counter() - begin)
+        assert metrics["flagged"] == stale
+    result = summarize(latencies, time.perf_counter() - started)
+    result["rows_per_second"] = round(stale / (sum(latencies) / SWEEPS), 1)
+    record(f"sweep_overdue --batch-size {batch_size} ({stale} tasks)", result)
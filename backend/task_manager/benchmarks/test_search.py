@@ -0,0 +1,90 @@
+import random
+import string
+from datetime import date, timedelta
+from itertools import accumulate
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.test import Client
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import filters
+
+from tasks.models import Task
+from tasks.views import TaskViewSet
+
+from .utils import STATUSES, bearer, env_int, measure
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+REQUESTS = env_int("BENCHMARK_SEARCH_REQUESTS", 50)
+# Tasks added on top of the shared benchmark data, with titles and
+# descriptions drawn from a Zipf-distributed vocabulary.
+SEARCH_TASKS = env_int("BENCHMARK_SEARCH_TASKS", 1_000_000)
+VOCABULARY = 20000
+
+rng = random.Random(0)
+WORDS = [
+    "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9)))
+    for _ in range(VOCABULARY)
+]
+CUM_WEIGHTS = list(accumulate(1 / rank for rank in range(1, VOCABULARY + 1)))
+
+# A frequent word, a medium one, a rare one and a two-word query.
+QUERIES = [WORDS[5], WORDS[300], WORDS[15000], f"{WORDS[5]} {WORDS[300]}"]
+
+
+def text(words):
+    return " ".join(rng.choices(WORDS, cum_weights=CUM_WEIGHTS, k=words))
+
+
+@pytest.fixture(scope="module")
+def search_corpus(seeded_users, django_db_blocker):
+    start = date(2025, 1, 1)
+    with django_db_blocker.unblock():
+        first_id = Task.objects.order_by("-id").values_list("id", flat=True)[0]
+        for offset in range(0, SEARCH_TASKS, 5000):
+            Task.objects.bulk_create(
+                Task(
+                    title=text(4).capitalize(),
+                    description=text(15),
+                    due_date=start + timedelta(days=i % 365),
+                    status=STATUSES[i % len(STATUSES)],
+                    assigned_to=seeded_users[i % len(seeded_users)],
+                )
+                for i in range(offset, min(offset + 5000, SEARCH_TASKS))
+            )
+    yield
+    with django_db_blocker.unblock():
+        # A queryset delete() would load every row to send post_delete.
+        with connection.cursor() as cursor:
+            cursor.execute("DELETE FROM tasks_task WHERE id > %s", [first_id])
+
+
+@pytest.fixture
+def client(seeded_users, search_corpus):
+    return Client(headers=bearer(seeded_users[0]))
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_full_text_search(client, record, query):
+    url = f"/api/tasks/?search={query}"
+    record(f"GET {url}", measure(lambda: client.get(url), REQUESTS))
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_icontains_search(client, record, query):
+    """The same request served by DRF's SearchFilter, for comparison."""
+    url = f"/api/tasks/?search={query}"
+    with mock.patch.multiple(
+        TaskViewSet,
+        filter_backends=[
+            DjangoFilterBackend,
+            filters.SearchFilter,
+            filters.OrderingFilter,
+        ],
+        search_fields=["title", "description"],
+        create=True,
+    ):
+        result = measure(lambda: client.get(url), REQUESTS)
+    record(f"GET {url} (icontains)", result)
@@ -0,0 +1,54 @@
+import time
+
+import pytest
+from django.test import Client
+
+from tasks.models import Task
+from tasks.serializers import TaskReadSerializer, TaskSerializer
+
+from .utils import bearer, env_int, measure, summarize
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+ROWS = 1000
+REPEAT = env_int("BENCHMARK_SERIALIZE_REPEAT", 50)
+LIST_REQUESTS = env_int("BENCHMARK_REQUESTS", 200)
+
+SERIALIZERS = {
+    "TaskSerializer": lambda tasks: TaskSerializer(tasks, many=True),
+    "TaskReadSerializer": lambda tasks: TaskReadSerializer(tasks, many=True),
+    "TaskReadSerializer fields=id,title,status": lambda tasks: (
+        TaskReadSerializer(tasks, many=True, fields={"id", "title", "status"})
+    ),
+}
+
+
+@pytest.fixture
+def tasks(seeded_users):
+    return [*Task.objects.select_related("assigned_to")[:ROWS]]
+
+
+@pytest.mark.parametrize("name", SERIALIZERS)
+def test_serialize_1k_rows(tasks, record, name):
+    """Time to serialize 1000 loaded tasks, without the database."""
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        begin = time.perf_counter()
+        SERIALIZERS[name](tasks).data
+        latencies.append(time.perf_counter() - begin)
+    record(
+        f"serialize {ROWS} tasks ({name})",
+        summarize(latencies, time.perf_counter() - started),
+    )
+
+
+@pytest.mark.parametrize(
+    "query", ["", "&fields=id,title,status", "&exclude=description"]
+)
+def test_list_fields(seeded_users, record, query):
+    client = Client(headers=bearer(seeded_users[0]))
+    # Only cursor pagination honours ?page_size= (up to TASKS_MAX_PAGE_SIZE).
+    url = f"/api/tasks/?pagination=cursor&page_size=100{query}"
+    assert len(client.get(url).json()["results"]) == 100
+    record(f"GET {url}", measure(lambda: client.get(url), LIST_REQUESTS))
@@ -0,0 +1,131 @@
+import asyncio
+import math
+import os
+import time
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from tasks.models import Task
+
+STATUSES = [value for value, _ in Task.STATUS_CHOICES]
+
+
+def env_int(name, default):
+    return int(os.environ.get(name, default))
+
+
+def seed_tasks(count, users=10, batch_size=5000):
+    """
+    Insert ``count`` tasks spread over ``users`` users and return the users.
+    """
+    User.objects.bulk_create(
+        User(username=f"bench{i}", password="!") for i in range(users)
+    )
+    owners = list(
+        User.objects.filter(username__startswith="bench").order_by("id")
+    )
+    start = date(2025, 1, 1)
+    for offset in range(0, count, batch_size):
+        tasks = [
+            Task(
+                title=f"Task {i}",
+                description=f"Benchmark task {i}",
+                due_date=start + timedelta(days=i % 365),
+                status=STATUSES[i % len(STATUSES)],
+                assigned_to=owners[i % len(owners)],
+            )
+            for i in range(offset, min(offset + batch_size, count))
+        ]
+        for task in tasks:
+            task.set_overdue()
+        Task.objects.bulk_create(tasks)
+    return owners
+
+
+def bearer(user):
+    token = RefreshToken.for_user(user).access_token
+    return {"Authorization": f"Bearer {token}"}
+
+
+def percentile(ordered, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(latencies, elapsed):
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "req_per_sec": round(len(ordered) / elapsed, 1),
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+    }
+
+
+def count_queries(request):
+    """Number of SQL queries one call of ``request()`` runs."""
+    with CaptureQueriesContext(connection) as context:
+        response = request()
+    assert response.status_code < 400, response.content
+    return len(context.captured_queries)
+
+
+def measure(request, count):
+    """Latency summary of ``count`` calls plus queries per call."""
+    request()  # warm-up
+    result = run_sync(request, count)
+    result["queries"] = count_queries(request)
+    return result
+
+
+def regressions(result, baseline, threshold, slack_ms):
+    """
+    Describe how ``result`` is worse than ``baseline``, if it is. Latency
+    may grow by ``threshold`` (relative) plus ``slack_ms`` before it
+    counts, which keeps millisecond-scale timings from flapping.
+    """
+    problems = []
+    for key in ("p50_ms", "p95_ms"):
+        limit = baseline[key] * (1 + threshold) + slack_ms
+        if result[key] > limit:
+            problems.append(f"{key} {result[key]} vs {baseline[key]}")
+    if result.get("queries", 0) > baseline.get("queries", 0):
+        problems.append(
+            f"{result['queries']} queries vs {baseline['queries']}"
+        )
+    return problems
+
+
+def run_sync(request, count):
+    """Call ``request()`` ``count`` times back to back."""
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(count):
+        begin = time.perf_counter()
+        response = request()
+        latencies.append(time.perf_counter() - begin)
+        assert response.status_code < 400, response.content
+    return summarize(latencies, time.perf_counter() - started)
+
+
+async def run_async(request, count, concurrency):
+    """Await ``request()`` ``count`` times, ``concurrency`` at a time."""
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            begin = time.perf_counter()
+            response = await request()
+            latencies.append(time.perf_counter() - begin)
+            assert response.status_code < 400, response.content
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(count)))
+    return summarize(latencies, time.perf_counter() - started)
@@ -0,0 +1,29 @@
+# Gunicorn settings for the production container, tunable through the
+# environment. Run from this directory:
+#
+#   gunicorn task_manager.wsgi:application      # WSGI, threaded workers
+#   GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker \
+#       gunicorn task_manager.asgi:application  # ASGI
+import multiprocessing
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(
+    os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1)
+)
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+# Threads per worker; only used by the gthread worker class.
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+# Recycle workers now and then to contain slow memory growth.
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 10000))
+max_requests_jitter = max_requests // 10
+# Set GUNICORN_ACCESS_LOG to an empty value to turn the access log off.
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG", "-") or None
+
+
+def post_worker_init(worker):
+    from task_manager.warmup import warm_up
+
+    warm_up()
@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from swaggers.schema import generate_schema
+
+
+class Command(BaseCommand):
+    help = (
+        "Write the OpenAPI document served at /swagger.json to "
+        "API_SCHEMA_FILE. With --check, only report whether the committed "
+        "file is out of date with the code."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Fail if the schema file differs from the generated one.",
+        )
+
+    def handle(self, *args, **options):
+        path = settings.API_SCHEMA_FILE
+        content = generate_schema()
+        current = path.read_bytes() if path.exists() else None
+        if options["check"]:
+            if current != content:
+                raise CommandError(
+                    f"{path} is out of date; run "
+                    "'python manage.py generate_schema' and commit it."
+                )
+            self.stdout.write(f"{path} is up to date.")
+            return
+        if current == content:
+            self.stdout.write(f"{path} is up to date.")
+            return
+        path.write_bytes(content)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {path}."))
@@ -0,0 +1,66 @@
+import hashlib
+import json
+from functools import lru_cache
+
+from django.conf import settings
+from drf_yasg import openapi
+from drf_yasg.codecs import OpenAPICodecJson, yaml_sane_dump
+from drf_yasg.generators import OpenAPISchemaGenerator
+
+from .task_swagger import api_info
+
+
+def generate_schema():
+    """
+    Introspect the API and return its OpenAPI document as pretty-printed
+    JSON bytes. The output is deterministic, so it can be committed.
+    """
+    schema = OpenAPISchemaGenerator(api_info).get_schema(
+        request=None, public=True
+    )
+    return OpenAPICodecJson(validators=[], pretty=True).encode(schema)
+
+
+class StaticSchema:
+    """The OpenAPI document encoded once, as JSON and YAML, with ETags."""
+
+    def __init__(self, content):
+        document = json.loads(content)
+        self.representations = {
+            "json": (content, "application/json"),
+            "yaml": (
+                yaml_sane_dump(document, binary=True),
+                "application/yaml",
+            ),
+        }
+        self.etags = {
+            name: make_etag(body)
+            for name, (body, _) in self.representations.items()
+        }
+        # All the Swagger UI and ReDoc pages need: they fetch the document
+        # itself from SWAGGER_SETTINGS["SPEC_URL"].
+        self.ui_document = openapi.Swagger(
+            info=openapi.Info(
+                title=document["info"]["title"],
+                default_version=document["info"]["version"],
+            ),
+            _prefix="/",
+            paths=openapi.Paths({}),
+        )
+
+
+def make_etag(content):
+    return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+@lru_cache(maxsize=None)
+def get_schema():
+    """
+    Return the process-wide ``StaticSchema``. It is read from
+    ``API_SCHEMA_FILE`` (written by ``manage.py generate_schema``); under
+    DEBUG, or when the file is missing, it is generated once instead.
+    """
+    path = settings.API_SCHEMA_FILE
+    if settings.DEBUG or not path.exists():
+        return StaticSchema(generate_schema())
+    return StaticSchema(path.read_bytes())
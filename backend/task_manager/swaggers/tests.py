@@ -0,0 +1,90 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, override_settings
+from drf_yasg.generators import OpenAPISchemaGenerator
+
+from .schema import generate_schema, get_schema
+
+
+class SchemaFileTests(SimpleTestCase):
+    def test_committed_schema_matches_code(self):
+        # Fails after an API change until "manage.py generate_schema" is
+        # run and the updated swaggers/schema.json is committed.
+        call_command("generate_schema", "--check", stdout=mock.Mock())
+
+    def test_check_fails_on_drift(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "schema.json"
+            path.write_text("{}\n")
+            with override_settings(API_SCHEMA_FILE=path):
+                with self.assertRaises(CommandError):
+                    call_command(
+                        "generate_schema", "--check", stdout=mock.Mock()
+                    )
+                call_command("generate_schema", stdout=mock.Mock())
+                self.assertEqual(path.read_bytes(), generate_schema())
+
+
+class SchemaViewTests(SimpleTestCase):
+    def setUp(self):
+        # Anonymous requests are throttled.
+        cache.clear()
+        get_schema.cache_clear()
+        self.addCleanup(get_schema.cache_clear)
+
+    def test_schema_is_generated_once(self):
+        with (
+            mock.patch(
+                "drf_yasg.generators.OpenAPISchemaGenerator.get_schema",
+                wraps=OpenAPISchemaGenerator.get_schema,
+                autospec=True,
+            ) as generate,
+            override_settings(DEBUG=True),
+        ):
+            for url in ("/swagger.json", "/swagger.yaml", "/swagger/"):
+                self.client.get(url)
+                self.client.get(url)
+        generate.assert_called_once()
+
+    def test_schema_is_served_from_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "schema.json"
+            path.write_bytes(generate_schema())
+            with (
+                override_settings(API_SCHEMA_FILE=path),
+                mock.patch("swaggers.schema.generate_schema") as generate,
+            ):
+                response = self.client.get("/swagger.json")
+        generate.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertIn("/tasks/", json.loads(response.content)["paths"])
+
+    def test_etag_revalidation(self):
+        response = self.client.get("/swagger.json")
+        etag = response["ETag"]
+        self.assertEqual(response["Cache-Control"], "public, no-cache")
+
+        response = self.client.get("/swagger.json", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+        response = self.client.get("/swagger.yaml", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/yaml")
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_ui_pages_load_precomputed_schema(self):
+        for url in ("/swagger/", "/redoc/"):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertContains(response, "/swagger.json")
+
+        response = self.client.get("/swagger/", {"format": "openapi"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["ETag"], get_schema().etags["json"])
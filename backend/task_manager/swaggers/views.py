@@ -0,0 +1,34 @@
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from rest_framework.response import Response
+
+from .schema import get_schema
+from .task_swagger import task_schema_view
+
+
+class PrecomputedSchemaView(task_schema_view):
+    """
+    Schema view that serves the precomputed document from memory, with an
+    ETag, instead of introspecting every view on each request.
+    """
+
+    def get(self, request, version="", format=None):
+        schema = get_schema()
+        renderer = request.accepted_renderer
+        if renderer.media_type == "text/html":
+            return Response(schema.ui_document)
+        return schema_response(
+            request, schema, "yaml" if renderer.format == ".yaml" else "json"
+        )
+
+
+def schema_response(request, schema, name):
+    etag = schema.etags[name]
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        content, content_type = schema.representations[name]
+        response = HttpResponse(content, content_type=content_type)
+    response["ETag"] = etag
+    # Public, but revalidated so a deploy is picked up straight away.
+    response["Cache-Control"] = "public, no-cache"
+    return response
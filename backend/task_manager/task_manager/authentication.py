@@ -0,0 +1,236 @@
+import hmac
+import threading
+import time
+from collections import OrderedDict
+
+import jwt
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import (
+    AuthenticationFailed,
+    InvalidToken,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from .metrics import timed
+
+
+class AuthenticatedUser:
+    """
+    Minimal stand-in for ``User`` kept in the token cache.
+
+    It carries what views and permissions read from ``request.user`` (id,
+    username, staff flags) without holding an ORM instance, password hash
+    included, in a process-wide cache.
+    """
+
+    is_authenticated = True
+    is_anonymous = False
+    is_active = True
+
+    def __init__(self, user):
+        self.id = self.pk = user.pk
+        self.username = user.get_username()
+        self.is_staff = user.is_staff
+        self.is_superuser = user.is_superuser
+
+    def __str__(self):
+        return self.username
+
+    def __eq__(self, other):
+        return getattr(other, "pk", None) == self.pk
+
+    def __hash__(self):
+        return hash(self.pk)
+
+    def get_username(self):
+        return self.username
+
+
+class TokenCache:
+    """
+    Thread-safe LRU of verified tokens keyed by their ``jti`` claim.
+
+    An entry lives until the token's ``exp`` or ``AUTH_TOKEN_CACHE_TTL``
+    seconds, whichever comes first; the TTL bounds how long another worker
+    process can keep honouring a user deactivated elsewhere.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._jtis_by_user = {}
+        self._lock = threading.Lock()
+
+    def get(self, jti, raw_token):
+        with self._lock:
+            entry = self._entries.get(jti)
+            if entry is None:
+                return None
+            if entry["expires_at"] <= time.time() or not hmac.compare_digest(
+                entry["raw_token"], raw_token
+            ):
+                self._discard(jti)
+                return None
+            self._entries.move_to_end(jti)
+            return entry
+
+    def put(self, jti, raw_token, token, user):
+        expires_at = min(
+            token["exp"],
+            time.time() + settings.AUTH_TOKEN_CACHE_TTL,
+        )
+        entry = {
+            "raw_token": raw_token,
+            "token": token,
+            "user": user,
+            "expires_at": expires_at,
+        }
+        with self._lock:
+            self._discard(jti)
+            self._entries[jti] = entry
+            self._jtis_by_user.setdefault(user.pk, set()).add(jti)
+            while len(self._entries) > settings.AUTH_TOKEN_CACHE_SIZE:
+                self._discard(next(iter(self._entries)))
+        return entry
+
+    def invalidate_user(self, user_id):
+        with self._lock:
+            for jti in self._jtis_by_user.pop(user_id, ()):
+                self._entries.pop(jti, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._jtis_by_user.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _discard(self, jti):
+        entry = self._entries.pop(jti, None)
+        if entry is not None:
+            jtis = self._jtis_by_user.get(entry["user"].pk)
+            if jtis is not None:
+                jtis.discard(jti)
+                if not jtis:
+                    del self._jtis_by_user[entry["user"].pk]
+
+
+token_cache = TokenCache()
+
+
+def invalidate_user(user_id):
+    """Drop cached tokens of a user, e.g. after deactivation."""
+    token_cache.invalidate_user(user_id)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    ``JWTAuthentication`` that verifies a token and loads its user once,
+    then serves repeat requests carrying the same token from
+    ``token_cache``.
+
+    Cached requests skip both the signature check and the ``auth_user``
+    query; ``request.user`` is an ``AuthenticatedUser``, which is enough for
+    views that only need the user's id.
+    """
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        with timed("auth"):
+            return self.authenticate_token(raw_token)
+
+    def authenticate_token(self, raw_token):
+        jti = _unverified_jti(raw_token)
+        entry = token_cache.get(jti, raw_token) if jti else None
+        if entry is None:
+            token = self.get_validated_token(raw_token)
+            user = AuthenticatedUser(self.get_user(token))
+            if not jti:
+                return user, token
+            entry = token_cache.put(jti, raw_token, token, user)
+        return entry["user"], entry["token"]
+
+    async def aauthenticate(self, request):
+        """
+        ``authenticate()`` for async views. A cache hit never leaves the
+        event loop; a miss loads the user with the async ORM.
+        """
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        with timed("auth"):
+            return await self.aauthenticate_token(raw_token)
+
+    async def aauthenticate_token(self, raw_token):
+        jti = _unverified_jti(raw_token)
+        entry = token_cache.get(jti, raw_token) if jti else None
+        if entry is None:
+            token = self.get_validated_token(raw_token)
+            user = AuthenticatedUser(await self.aget_user(token))
+            if not jti:
+                return user, token
+            entry = token_cache.put(jti, raw_token, token, user)
+        return entry["user"], entry["token"]
+
+    async def aget_user(self, validated_token):
+        """Async counterpart of ``get_user()``."""
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            )
+
+        try:
+            user = await self.user_model.objects.aget(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(
+                _("User not found"), code="user_not_found"
+            )
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(
+                _("User is inactive"), code="user_inactive"
+            )
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."),
+                    code="password_changed",
+                )
+
+        return user
+
+
+def _unverified_jti(raw_token):
+    """
+    Read the ``jti`` claim without verifying the token. Only used as a
+    cache key: a hit must also match the exact token bytes that were
+    verified when the entry was stored.
+    """
+    try:
+        claims = jwt.decode(raw_token, options={"verify_signature": False})
+    except jwt.InvalidTokenError:
+        return None
+    jti = claims.get(api_settings.JTI_CLAIM)
+    return jti if isinstance(jti, str) else None
@@ -0,0 +1,58 @@
+import os
+import pickle
+import time
+import zlib
+from contextlib import contextmanager
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.files import locks
+
+
+class LockingFileBasedCache(FileBasedCache):
+    """
+    File-based cache whose ``add()`` and ``incr()`` are atomic across
+    processes sharing the cache directory.
+
+    Django's ``FileBasedCache`` implements both as a separate read and
+    write, so two workers can hand out the same counter value. Here the
+    read-modify-write runs under an exclusive lock on one of a fixed set of
+    lock files, and ``incr()`` keeps the key's original expiry instead of
+    resetting it to the default timeout.
+    """
+
+    lock_stripes = 64
+
+    @contextmanager
+    def _locked(self, fname):
+        self._createdir()
+        stripe = int(os.path.basename(fname)[:8], 16) % self.lock_stripes
+        path = os.path.join(self._dir, f"stripe-{stripe}.lock")
+        with open(path, "ab") as lock_file:
+            locks.lock(lock_file, locks.LOCK_EX)
+            try:
+                yield
+            finally:
+                locks.unlock(lock_file)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        with self._locked(self._key_to_file(key, version)):
+            return super().add(key, value, timeout, version)
+
+    def incr(self, key, delta=1, version=None):
+        fname = self._key_to_file(key, version)
+        with self._locked(fname):
+            try:
+                with open(fname, "rb") as f:
+                    expiry = pickle.load(f)
+                    value = pickle.loads(zlib.decompress(f.read()))
+            except FileNotFoundError:
+                raise ValueError("Key '%s' not found" % key)
+            now = time.time()
+            if expiry is not None and expiry < now:
+                self._delete(fname)
+                raise ValueError("Key '%s' not found" % key)
+            new_value = value + delta
+            timeout = None if expiry is None else expiry - now
+            self.set(key, new_value, timeout, version)
+            return new_value
@@ -0,0 +1,168 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Upper bounds (ms) of the latency histogram buckets; slower requests land
+# in a final overflow bucket.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_current = ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    """Timings collected for the request being served."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.timings = {"db": 0.0}
+        self._active = set()
+
+    def add(self, name, seconds):
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Execute wrapper installed on every database connection; counts and
+    times queries for the request in the current context, if any.
+    """
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.add("db", time.perf_counter() - started)
+
+
+def install_query_recorder(connection, **kwargs):
+    """
+    Add ``record_query`` to a connection (a ``connection_created``
+    receiver). It goes first so that ``connection.execute_wrapper()``
+    blocks opened later still pop their own wrapper.
+    """
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, record_query)
+
+
+def start_request():
+    metrics = RequestMetrics()
+    return metrics, _current.set(metrics)
+
+
+def end_request(token):
+    _current.reset(token)
+
+
+@contextmanager
+def timed(name):
+    """
+    Add the time spent in the block to the current request's ``name``
+    timing. Nested blocks with the same name are counted once, and outside
+    a request this does nothing.
+    """
+    metrics = _current.get()
+    if metrics is None or name in metrics._active:
+        yield
+        return
+    metrics._active.add(name)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics._active.discard(name)
+        metrics.add(name, time.perf_counter() - started)
+
+
+class RouteStats:
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.queries = 0
+        self.max_queries = 0
+        self.timings_ms = {}
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, status_code, duration_ms, queries, timings_ms):
+        self.count += 1
+        self.errors += status_code >= 500
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.queries += queries
+        self.max_queries = max(self.max_queries, queries)
+        for name, value in timings_ms.items():
+            self.timings_ms[name] = self.timings_ms.get(name, 0.0) + value
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+
+    def percentile(self, pct):
+        """Upper bound of the bucket holding the ``pct`` percentile."""
+        rank = pct / 100 * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets):
+            seen += count
+            if seen >= rank:
+                return bound
+        return round(self.max_ms, 3)
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.count, 3),
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "avg_queries": round(self.queries / self.count, 2),
+            "max_queries": self.max_queries,
+            "avg_timings_ms": {
+                name: round(value / self.count, 3)
+                for name, value in sorted(self.timings_ms.items())
+            },
+            "histogram_ms": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets)
+                },
+                "overflow": self.buckets[-1],
+            },
+        }
+
+
+class MetricsRegistry:
+    """Per-route request statistics of this worker process."""
+
+    def __init__(self):
+        self._routes = {}
+        self._lock = threading.Lock()
+
+    def add(self, route, status_code, duration_ms, queries, timings_ms):
+        with self._lock:
+            stats = self._routes.get(route)
+            if stats is None:
+                stats = self._routes[route] = RouteStats()
+            stats.add(status_code, duration_ms, queries, timings_ms)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                route: stats.snapshot()
+                for route, stats in sorted(self._routes.items())
+            }
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+
+
+registry = MetricsRegistry()
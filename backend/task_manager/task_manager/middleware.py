@@ -0,0 +1,112 @@
+import json
+import logging
+import random
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from .metrics import (
+    end_request,
+    install_query_recorder,
+    registry,
+    start_request,
+)
+
+logger = logging.getLogger("task_manager.requests")
+
+
+class RequestMetricsMiddleware:
+    """
+    Measure every request: total time, number and time of SQL queries,
+    and the ``auth``/``serialize`` sections marked with ``metrics.timed()``.
+    Queries are attributed through a context variable, so they are counted
+    also when the async ORM runs them in a worker thread.
+
+    Results go to the per-route ``metrics.registry``, to a
+    ``Server-Timing`` response header and, for sampled or slow requests, to
+    a JSON line on the ``task_manager.requests`` logger. The body of a
+    streaming response is produced after the middleware returns and is not
+    included.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        connection_created.connect(
+            install_query_recorder, dispatch_uid="request_metrics"
+        )
+        for connection in connections.all(initialized_only=True):
+            install_query_recorder(connection)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        metrics, token = start_request()
+        try:
+            response = self.get_response(request)
+        finally:
+            end_request(token)
+        self.finish(request, response, metrics)
+        return response
+
+    async def __acall__(self, request):
+        metrics, token = start_request()
+        try:
+            response = await self.get_response(request)
+        finally:
+            end_request(token)
+        self.finish(request, response, metrics)
+        return response
+
+    def finish(self, request, response, metrics):
+        duration_ms = metrics.elapsed() * 1000
+        timings_ms = {
+            name: seconds * 1000 for name, seconds in metrics.timings.items()
+        }
+        match = request.resolver_match
+        view_name = match.view_name if match else "<unmatched>"
+        route = f"{request.method} {view_name}"
+        registry.add(
+            route,
+            response.status_code,
+            duration_ms,
+            metrics.queries,
+            timings_ms,
+        )
+
+        if settings.REQUEST_METRICS_SERVER_TIMING:
+            entries = [f"total;dur={duration_ms:.3f}"]
+            for name, value in timings_ms.items():
+                entry = f"{name};dur={value:.3f}"
+                if name == "db":
+                    entry += f';desc="{metrics.queries} queries"'
+                entries.append(entry)
+            if response.has_header("Server-Timing"):
+                entries.insert(0, response["Server-Timing"])
+            response["Server-Timing"] = ", ".join(entries)
+
+        slow = duration_ms >= settings.REQUEST_METRICS_SLOW_MS
+        if slow or random.random() < settings.REQUEST_METRICS_SAMPLE_RATE:
+            record = {
+                "method": request.method,
+                "path": request.path,
+                "route": view_name,
+                "status": response.status_code,
+                "duration_ms": round(duration_ms, 3),
+                "queries": metrics.queries,
+                **{
+                    f"{name}_ms": round(value, 3)
+                    for name, value in timings_ms.items()
+                },
+                "slow": slow,
+            }
+            logger.log(
+                logging.WARNING if slow else logging.INFO, json.dumps(record)
+            )
@@ -10,8 +10,12 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
+import tempfile
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -19,15 +23,26 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.1/howto/deployment/checklist/
 
-# SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = (
-    "django-insecure-xgc04dlp%sh9n9qh1=y4@80a_!9&siqli&b4&vz-0n4hgbma63"
-)
-
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+# DJANGO_DEBUG=0 turns it off (the production container does).
+DEBUG = os.environ.get("DJANGO_DEBUG", "1") == "1"
 
-ALLOWED_HOSTS = ["localhost", "127.0.0.1", "backend", "frontend"]
+# SECURITY WARNING: keep the secret key used in production secret!
+# The committed development key signs access tokens too, so it is only
+# accepted with DEBUG on.
+SECRET_KEY = os.environ.get("DJANGO_SECRET_KEY", "")
+if not SECRET_KEY:
+    if not DEBUG:
+        raise ImproperlyConfigured(
+            "Set DJANGO_SECRET_KEY when DJANGO_DEBUG is off."
+        )
+    SECRET_KEY = (
+        "django-insecure-xgc04dlp%sh9n9qh1=y4@80a_!9&siqli&b4&vz-0n4hgbma63"
+    )
+
+ALLOWED_HOSTS = os.environ.get(
+    "DJANGO_ALLOWED_HOSTS", "localhost,127.0.0.1,backend,frontend"
+).split(",")
 
 
 # Application definition
@@ -44,12 +59,16 @@ INSTALLED_APPS = [
     "rest_framework_simplejwt",
     "django_filters",
     "corsheaders",
+    "swaggers",
     "tasks",
+    "users",
 ]
 
 MIDDLEWARE = [
+    "task_manager.middleware.RequestMetricsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -82,10 +101,98 @@ WSGI_APPLICATION = "task_manager.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
-DATABASES = {
+#
+# DJANGO_DB_ENGINE selects "sqlite" (default, a file next to manage.py or
+# DJANGO_SQLITE_PATH) or "postgresql" (configured by the POSTGRES_*
+# variables). Connections are kept for DJANGO_DB_CONN_MAX_AGE seconds and
+# checked before reuse, except under ASGI (SERVER_INTERFACE=asgi): there
+# each request may run in a different thread, so persistent connections
+# would pile up instead of being reused and are disabled. To pool
+# PostgreSQL connections, put PgBouncer in front of it.
+
+DB_ENGINE = os.environ.get("DJANGO_DB_ENGINE", "sqlite")
+
+DB_CONN_MAX_AGE = (
+    0
+    if os.environ.get("SERVER_INTERFACE") == "asgi"
+    else int(os.environ.get("DJANGO_DB_CONN_MAX_AGE", 60))
+)
+
+if DB_ENGINE == "postgresql":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.environ.get("POSTGRES_DB", "task_manager"),
+            "USER": os.environ.get("POSTGRES_USER", "postgres"),
+            "PASSWORD": os.environ.get("POSTGRES_PASSWORD", ""),
+            "HOST": os.environ.get("POSTGRES_HOST", "localhost"),
+            "PORT": os.environ.get("POSTGRES_PORT", "5432"),
+            "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {},
+        }
+    }
+    # Behind PgBouncer in transaction mode, cursors cannot outlive a
+    # transaction; iterator()-based exports then fetch in chunks instead.
+    if os.environ.get("DJANGO_DB_DISABLE_SERVER_SIDE_CURSORS"):
+        DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = True
+elif DB_ENGINE == "sqlite":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": os.environ.get(
+                "DJANGO_SQLITE_PATH", BASE_DIR / "db.sqlite3"
+            ),
+            "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {
+                # WAL lets readers run alongside the single writer.
+                "init_command": (
+                    "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;"
+                ),
+                # Take the write lock when a transaction starts, so that
+                # concurrent transactions wait for it (up to the timeout)
+                # instead of failing with "database is locked" when a read
+                # lock cannot be upgraded.
+                "transaction_mode": "IMMEDIATE",
+                "timeout": int(os.environ.get("DJANGO_SQLITE_TIMEOUT", 20)),
+            },
+        }
+    }
+else:
+    raise ImproperlyConfigured(
+        f"Unknown DJANGO_DB_ENGINE {DB_ENGINE!r}; use sqlite or postgresql."
+    )
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+#
+# Throttle counters and cached task data live here. LocMem is private to
+# each process, so any deployment with more than one worker must select a
+# shared backend: "file" (a directory all workers can reach, no extra
+# services) or "redis" (requires the redis package).
+
+CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "task_manager.cache_backends.LockingFileBasedCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+}
+
+CACHE_DEFAULT_LOCATIONS = {
+    "locmem": "task-manager",
+    "file": os.path.join(tempfile.gettempdir(), "task_manager_cache"),
+    "redis": "redis://localhost:6379/0",
+}
+
+CACHE_BACKEND = os.environ.get("DJANGO_CACHE_BACKEND", "locmem")
+
+CACHES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND],
+        "LOCATION": os.environ.get(
+            "DJANGO_CACHE_LOCATION", CACHE_DEFAULT_LOCATIONS[CACHE_BACKEND]
+        ),
     }
 }
 
@@ -137,6 +244,24 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 
+# Filled by "manage.py collectstatic" and served by WhiteNoise. Outside
+# DEBUG the files are compressed and get content-hashed names, so they can
+# be cached by clients for good.
+STATIC_ROOT = BASE_DIR / "staticfiles"
+
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": (
+            "django.contrib.staticfiles.storage.StaticFilesStorage"
+            if DEBUG
+            else "whitenoise.storage.CompressedManifestStaticFilesStorage"
+        ),
+    },
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
@@ -144,7 +269,7 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "task_manager.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend"
@@ -154,12 +279,130 @@ REST_FRAMEWORK = {
     ),
     "PAGE_SIZE": 5,
     "DEFAULT_THROTTLE_CLASSES": [
-        "rest_framework.throttling.AnonRateThrottle",
-        "rest_framework.throttling.UserRateThrottle",
+        "task_manager.throttling.AtomicAnonRateThrottle",
+        "task_manager.throttling.AtomicUserRateThrottle",
     ],
     "DEFAULT_THROTTLE_RATES": {
-        "anon": "5/sec",
-        "user": "20/min",
+        "anon": os.environ.get("DJANGO_THROTTLE_ANON_RATE", "5/sec"),
+        "user": os.environ.get("DJANGO_THROTTLE_USER_RATE", "20/min"),
+    },
+}
+
+# Upper bound for ``?page_size=`` on cursor-paginated task listings.
+TASKS_MAX_PAGE_SIZE = 100
+
+# Largest batch accepted by the /api/tasks/bulk/ endpoints.
+TASKS_BULK_MAX_ITEMS = 1000
+
+# Rows fetched per database round trip by /api/tasks/export/.
+TASKS_EXPORT_CHUNK_SIZE = 2000
+
+# /api/tasks/stats/: default "due soon" window in days, the largest window a
+# client may ask for, and how long computed counts stay cached (any task
+# write invalidates them earlier).
+TASKS_DUE_SOON_DAYS = 7
+TASKS_MAX_DUE_SOON_DAYS = 365
+TASKS_STATS_CACHE_TIMEOUT = 300
+
+# "manage.py sweep_overdue": tasks updated per transaction, and seconds
+# between sweeps with --loop. Tasks whose due date passes without a write
+# are only counted as overdue (?overdue=, /api/tasks/stats/) once swept.
+TASKS_OVERDUE_BATCH_SIZE = 1000
+TASKS_OVERDUE_SWEEP_SECONDS = 300
+
+# Widest date range, in days, that /api/tasks/agenda/ returns at once.
+TASKS_AGENDA_MAX_DAYS = 366
+
+# /api/tasks/changes/: rows per page, and how many seconds a write must be
+# old before it is reported, so transactions that commit late (with an
+# earlier updated_at) are never skipped by a client's cursor. Tombstones of
+# deleted tasks are kept TASKS_TOMBSTONE_RETENTION_DAYS; older cursors get
+# 410 Gone and must sync from scratch.
+TASKS_CHANGES_PAGE_SIZE = 500
+TASKS_CHANGES_SETTLE_SECONDS = 5
+TASKS_TOMBSTONE_RETENTION_DAYS = 30
+
+# /api/events/ (Server-Sent Events, ASGI only). The in-process broker only
+# reaches streams in the worker that made the write; with several workers
+# use "tasks.events.RedisBroker" (requires the redis package). A stream
+# whose client falls TASK_EVENTS_QUEUE_SIZE events behind is closed with an
+# "overflow" event. EventSource clients authenticate with a single-use
+# ticket from /api/events/ticket/, valid TASK_EVENTS_TICKET_SECONDS and
+# kept in the cache, which must be shared when there are several workers.
+TASK_EVENTS_BROKER = os.environ.get(
+    "DJANGO_TASK_EVENTS_BROKER", "tasks.events.InProcessBroker"
+)
+TASK_EVENTS_REDIS_URL = os.environ.get(
+    "DJANGO_TASK_EVENTS_REDIS_URL", "redis://localhost:6379/0"
+)
+TASK_EVENTS_QUEUE_SIZE = 100
+TASK_EVENTS_KEEPALIVE_SECONDS = 15
+TASK_EVENTS_RETRY_MS = 5000
+TASK_EVENTS_TICKET_SECONDS = 30
+
+# Background jobs (tasks.jobs), queued in the database on commit and run
+# by "manage.py run_worker": jobs claimed per batch, seconds between polls
+# of an empty queue, seconds a claim lasts before another worker may take
+# the job over, and attempts before a job is marked failed, retried after
+# exponential backoff from JOBS_RETRY_BASE_SECONDS up to
+# JOBS_RETRY_MAX_SECONDS. DJANGO_JOBS_EAGER=1 runs jobs right after the
+# commit in the request instead, with no worker.
+JOBS_EAGER = os.environ.get("DJANGO_JOBS_EAGER", "0") == "1"
+JOBS_WORKER_THREADS = 2
+JOBS_BATCH_SIZE = 100
+JOBS_POLL_SECONDS = 1.0
+JOBS_LEASE_SECONDS = 300
+JOBS_MAX_ATTEMPTS = 5
+JOBS_RETRY_BASE_SECONDS = 10
+JOBS_RETRY_MAX_SECONDS = 3600
+
+# Assignment notifications sent by the "notify" job. The console backend
+# prints them; set DJANGO_EMAIL_BACKEND (and Django's EMAIL_* settings) to
+# deliver them.
+EMAIL_BACKEND = os.environ.get(
+    "DJANGO_EMAIL_BACKEND", "django.core.mail.backends.console.EmailBackend"
+)
+DEFAULT_FROM_EMAIL = os.environ.get(
+    "DJANGO_DEFAULT_FROM_EMAIL", "tasks@localhost"
+)
+
+# Seconds to keep serialized task list/detail responses in the cache, keyed
+# by user and query and invalidated by any task write. 0 disables it.
+TASKS_RESPONSE_CACHE_TIMEOUT = 0
+
+# /api/users/: rows per page (``?page_size=`` may ask for up to
+# USERS_MAX_PAGE_SIZE), and seconds the /api/users/directory/ listing stays
+# cached (any user write invalidates it earlier).
+USERS_PAGE_SIZE = 50
+USERS_MAX_PAGE_SIZE = 500
+USERS_DIRECTORY_CACHE_TIMEOUT = 3600
+
+# Verified access tokens remembered per worker process by
+# CachedJWTAuthentication, and for how many seconds at most (tokens also
+# drop out at their own expiry, or when their user is saved or deleted).
+AUTH_TOKEN_CACHE_SIZE = 10000
+AUTH_TOKEN_CACHE_TTL = 300
+
+# RequestMetricsMiddleware: send Server-Timing headers, log a JSON line for
+# this fraction of requests, and always log requests slower than
+# REQUEST_METRICS_SLOW_MS (as warnings). Per-route histograms are served at
+# /api/metrics/ to staff users.
+REQUEST_METRICS_SERVER_TIMING = True
+REQUEST_METRICS_SAMPLE_RATE = 0.01
+REQUEST_METRICS_SLOW_MS = 500
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "task_manager.requests": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": False,
+        },
     },
 }
 
@@ -171,9 +414,20 @@ SWAGGER_SETTINGS = {
             "in": "header",
             "description": "Enter JWT token as: Bearer <your_access_token>",
         }
-    }
+    },
+    # Swagger UI and ReDoc load the precomputed document.
+    "SPEC_URL": ("schema-json", {"format": ".json"}),
+}
+
+REDOC_SETTINGS = {
+    "SPEC_URL": ("schema-json", {"format": ".json"}),
 }
 
+# OpenAPI document written by "manage.py generate_schema" and served from
+# memory by swaggers.views.PrecomputedSchemaView. Under DEBUG it is generated
+# at startup instead, so edits show up without regenerating the file.
+API_SCHEMA_FILE = BASE_DIR / "swaggers" / "schema.json"
+
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",
     "http://frontend:5173",  # Docker
@@ -0,0 +1,76 @@
+from rest_framework import throttling
+
+
+class AtomicRateThrottleMixin:
+    """
+    Count requests with atomic cache increments instead of DRF's history
+    list.
+
+    ``SimpleRateThrottle`` reads the list of recent request times, appends
+    to it in Python and writes it back, so concurrent workers overwrite each
+    other's hits and a shared limit is exceeded. Here each fixed window is a
+    single integer bumped with ``cache.incr()``, which is atomic on Redis,
+    LocMem and ``LockingFileBasedCache``. The limit is applied to a sliding
+    window estimated from the current and the previous fixed window.
+    """
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window, offset = divmod(self.now, self.duration)
+        current_key = f"{self.key}:{int(window)}"
+        previous = self.cache.get(f"{self.key}:{int(window) - 1}", 0)
+        weight = 1 - offset / self.duration
+
+        count = self._incr(current_key)
+        if previous * weight + count <= self.num_requests:
+            return self.throttle_success()
+
+        # Rejected requests do not use up the allowance.
+        self.cache.decr(current_key)
+        self.wait_seconds = self._wait(previous, count - 1, offset)
+        return self.throttle_failure()
+
+    def throttle_success(self):
+        return True
+
+    def wait(self):
+        return self.wait_seconds
+
+    def _incr(self, key):
+        # Keep each window long enough to serve as the next one's previous.
+        timeout = 2 * self.duration
+        self.cache.add(key, 0, timeout=timeout)
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            # Expired between add() and incr(); start the window again.
+            self.cache.add(key, 0, timeout=timeout)
+            return self.cache.incr(key)
+
+    def _wait(self, previous, count, offset):
+        """Seconds until the sliding window has room for one more request."""
+        remaining = self.duration - offset
+        room = self.num_requests - count - 1
+        if room < 0 or not previous:
+            return remaining
+        wait = self.duration * (1 - room / previous) - offset
+        return min(max(wait, 0), remaining)
+
+
+class AtomicAnonRateThrottle(
+    AtomicRateThrottleMixin, throttling.AnonRateThrottle
+):
+    pass
+
+
+class AtomicUserRateThrottle(
+    AtomicRateThrottleMixin, throttling.UserRateThrottle
+):
+    pass
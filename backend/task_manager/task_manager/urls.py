@@ -1,10 +1,11 @@
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
 )
-from swaggers.task_swagger import task_schema_view
+from swaggers.views import PrecomputedSchemaView
+from .views import MetricsView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -16,15 +17,21 @@ urlpatterns = [
     path(
         "api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"
     ),
+    path("api/metrics/", MetricsView.as_view(), name="metrics"),
     # Swagger and ReDoc documentation
+    re_path(
+        r"^swagger(?P<format>\.json|\.yaml)$",
+        PrecomputedSchemaView.without_ui(cache_timeout=0),
+        name="schema-json",
+    ),
     path(
         "swagger/",
-        task_schema_view.with_ui("swagger", cache_timeout=0),
+        PrecomputedSchemaView.with_ui("swagger", cache_timeout=0),
         name="schema-swagger-ui",
     ),
     path(
         "redoc/",
-        task_schema_view.with_ui("redoc", cache_timeout=0),
+        PrecomputedSchemaView.with_ui("redoc", cache_timeout=0),
         name="schema-redoc",
     ),
 ]
@@ -0,0 +1,26 @@
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.throttling import BaseThrottle
+from rest_framework.views import APIView
+
+from .authentication import CachedJWTAuthentication
+from .metrics import registry
+
+
+class MetricsView(APIView):
+    """
+    Request statistics per route collected by ``RequestMetricsMiddleware``
+    in the worker process that answers. ``DELETE`` clears them.
+    """
+
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsAdminUser]
+    throttle_classes: list[type[BaseThrottle]] = []
+
+    def get(self, request):
+        return Response(registry.snapshot())
+
+    def delete(self, request):
+        registry.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
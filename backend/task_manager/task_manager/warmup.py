@@ -0,0 +1,20 @@
+from django.urls import get_resolver
+
+
+def warm_up():
+    """
+    Do the one-time work of a worker's first requests before it accepts
+    traffic: import every view and build the URL resolver, build the
+    serializers' fields and load the OpenAPI schema. The database
+    connection is not opened here: connections are per thread, and
+    requests run in other threads than the one gunicorn warms up in.
+    """
+    from swaggers.schema import get_schema
+    from tasks.serializers import TaskSerializer
+    from users.serializers import UserSerializer
+
+    get_resolver().reverse_dict
+    for serializer_class in (TaskSerializer, UserSerializer):
+        serializer_class().fields
+
+    get_schema()
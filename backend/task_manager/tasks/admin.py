@@ -1,5 +1,6 @@
 from django.contrib import admin
 from .models import Task
+from .search import search_tasks
 
 
 @admin.register(Task)
@@ -7,4 +8,19 @@ class TaskAdmin(admin.ModelAdmin):
     list_display = ("title", "assigned_to", "status", "due_date", "created_at")
     list_filter = ("status", "due_date")
     search_fields = ("title", "assigned_to__username")
+    search_help_text = "Words in the title or description, or an assignee."
     ordering = ("due_date",)
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Match titles and descriptions through the full-text index instead
+        of ``icontains`` table scans; assignees are still matched by name.
+        """
+        if not search_term:
+            return queryset, False
+        matches = search_tasks(queryset, search_term).values("pk")
+        return (
+            queryset.filter(pk__in=matches)
+            | queryset.filter(assigned_to__username__icontains=search_term),
+            False,
+        )
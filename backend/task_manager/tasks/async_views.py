@@ -0,0 +1,261 @@
+import asyncio
+import json
+from functools import partial, wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db.models import F
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+from django_filters.utils import translate_validation
+from rest_framework import exceptions, status
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from task_manager.authentication import (
+    AuthenticatedUser,
+    CachedJWTAuthentication,
+)
+from task_manager.throttling import (
+    AtomicAnonRateThrottle,
+    AtomicUserRateThrottle,
+)
+from . import events
+from .filters import TaskFilter
+from .models import Task
+from .search import search_tasks
+from .serializers import TaskSerializer, _int_values
+from .views import EXPORT_FIELDS, _export_values
+
+# Async-native counterparts of the TaskViewSet list, retrieve and create
+# actions, served under /api/async/tasks/. They answer with the same JSON
+# as the DRF views but never hand the request to a worker thread: tokens
+# are checked against CachedJWTAuthentication's in-memory cache, rows are
+# read with the async ORM and serialized as plain dicts. Only the throttle
+# counters are bumped in a thread.
+
+THROTTLE_CLASSES = [AtomicUserRateThrottle, AtomicAnonRateThrottle]
+
+ORDERING_FIELDS = {"due_date", "-due_date"}
+
+authentication = CachedJWTAuthentication()
+
+
+class StreamingUnavailable(exceptions.APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Event streams are only served by the ASGI application."
+    default_code = "streaming_unavailable"
+
+
+def api_view(view=None, *, query_ticket=False):
+    """
+    Authenticate and throttle a request the way ``TaskViewSet`` does and
+    turn DRF API exceptions into JSON error responses. With
+    ``query_ticket``, a single-use ``?ticket=`` from ``/api/events/ticket/``
+    is accepted when there is no ``Authorization`` header, for clients
+    such as ``EventSource`` that cannot send one.
+    """
+    if view is None:
+        return partial(api_view, query_ticket=query_ticket)
+
+    @csrf_exempt
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        try:
+            result = await authentication.aauthenticate(request)
+            if result is None and query_ticket and "ticket" in request.GET:
+                result = await authenticate_ticket(request.GET["ticket"])
+            if result is None:
+                raise exceptions.NotAuthenticated()
+            request.user, request.auth = result
+            # Counters live in the cache (file or Redis I/O), so they are
+            # bumped in a thread. The async cache API would not do: its
+            # default aincr() is a get and a set, which loses concurrent hits.
+            for throttle_class in THROTTLE_CLASSES:
+                throttle = throttle_class()
+                allowed = await sync_to_async(
+                    throttle.allow_request, thread_sensitive=False
+                )(request, None)
+                if not allowed:
+                    raise exceptions.Throttled(throttle.wait())
+            return await view(request, *args, **kwargs)
+        except exceptions.APIException as exc:
+            return error_response(exc, request)
+
+    return wrapper
+
+
+async def authenticate_ticket(ticket):
+    user_id = await events.aredeem_ticket(ticket)
+    try:
+        user = await User.objects.aget(pk=user_id, is_active=True)
+    except User.DoesNotExist:
+        raise exceptions.AuthenticationFailed(
+            "Invalid or expired stream ticket."
+        )
+    return AuthenticatedUser(user), None
+
+
+def error_response(exc, request):
+    if isinstance(exc.detail, (list, dict)):
+        data = exc.detail
+    else:
+        data = {"detail": exc.detail}
+    response = JsonResponse(data, status=exc.status_code, safe=False)
+    if isinstance(
+        exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)
+    ):
+        response.status_code = status.HTTP_401_UNAUTHORIZED
+        response["WWW-Authenticate"] = authentication.authenticate_header(
+            request
+        )
+    if getattr(exc, "wait", None) is not None:
+        response["Retry-After"] = str(int(exc.wait))
+    return response
+
+
+def task_rows():
+    return Task.objects.annotate(
+        assigned_to_username=F("assigned_to__username")
+    ).values_list(*EXPORT_FIELDS)
+
+
+@require_http_methods(["GET", "POST"])
+@api_view
+async def task_list(request):
+    if request.method == "POST":
+        return await create_task(request)
+
+    filterset = TaskFilter(request.GET, queryset=task_rows())
+    if not filterset.is_valid():
+        raise translate_validation(filterset.errors)
+    terms = [
+        term.strip() for term in request.GET.get("ordering", "").split(",")
+    ]
+    ordering = [term for term in terms if term in ORDERING_FIELDS]
+    queryset = search_tasks(filterset.qs, request.GET.get("search", ""))
+    if ordering or not queryset.query.order_by:
+        queryset = queryset.order_by(*ordering or ["created_at"])
+
+    page_size = settings.REST_FRAMEWORK["PAGE_SIZE"]
+    try:
+        page = int(request.GET.get("page", 1))
+    except ValueError:
+        raise exceptions.NotFound("Invalid page.")
+    count = await queryset.acount()
+    pages = max(1, -(-count // page_size))
+    if not 1 <= page <= pages:
+        raise exceptions.NotFound("Invalid page.")
+
+    start = (page - 1) * page_size
+    rows = queryset[start:][:page_size]
+    results = [_export_values(row) async for row in rows]
+    url = request.build_absolute_uri()
+    if page < pages:
+        next_url = replace_query_param(url, "page", page + 1)
+    else:
+        next_url = None
+    if page == 1:
+        previous_url = None
+    elif page == 2:
+        previous_url = remove_query_param(url, "page")
+    else:
+        previous_url = replace_query_param(url, "page", page - 1)
+    return JsonResponse(
+        {
+            "count": count,
+            "next": next_url,
+            "previous": previous_url,
+            "results": results,
+        }
+    )
+
+
+async def create_task(request):
+    if request.content_type == "application/json":
+        try:
+            data = json.loads(request.body)
+        except ValueError as exc:
+            raise exceptions.ParseError(f"JSON parse error - {exc}")
+    else:
+        data = request.POST.dict()
+
+    serializer = TaskSerializer(data=data)
+    # Resolved here so that validation itself runs no queries.
+    serializer.assignees = await User.objects.only("id", "username").ain_bulk(
+        _int_values([data], "assigned_to")
+    )
+    serializer.is_valid(raise_exception=True)
+    serializer.instance = await Task.objects.acreate(
+        **serializer.validated_data
+    )
+    return JsonResponse(serializer.data, status=status.HTTP_201_CREATED)
+
+
+@require_http_methods(["GET"])
+@api_view
+async def task_detail(request, pk):
+    try:
+        row = await task_rows().aget(pk=pk)
+    except Task.DoesNotExist:
+        raise exceptions.NotFound("No Task matches the given query.")
+    return JsonResponse(_export_values(row))
+
+
+@require_http_methods(["POST"])
+@api_view
+async def task_events_ticket(request):
+    """
+    Issue a single-use ticket for opening ``/api/events/?ticket=`` with
+    ``EventSource``, which cannot send the ``Authorization`` header.
+    """
+    return JsonResponse(
+        {
+            "ticket": await events.aissue_ticket(request.user.pk),
+            "expires_in": settings.TASK_EVENTS_TICKET_SECONDS,
+        },
+        status=status.HTTP_201_CREATED,
+    )
+
+
+@require_http_methods(["GET"])
+@api_view(query_ticket=True)
+async def task_events(request):
+    """
+    Server-Sent Events stream of ``created``, ``updated``, ``unassigned``
+    and ``deleted`` events for the tasks assigned to the user.
+    """
+    if not isinstance(request, ASGIRequest):
+        # Under WSGI the stream would hold a worker thread for its lifetime.
+        raise StreamingUnavailable()
+    response = StreamingHttpResponse(
+        event_stream(request.user.pk), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+async def event_stream(user_id):
+    broker = events.get_broker()
+    subscription = broker.subscribe(user_id)
+    try:
+        yield f"retry: {settings.TASK_EVENTS_RETRY_MS}\n\n"
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    subscription.queue.get(),
+                    settings.TASK_EVENTS_KEEPALIVE_SECONDS,
+                )
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if message is events.OVERFLOW:
+                # Events were dropped; the client must catch up through
+                # /api/tasks/changes/ before it reconnects.
+                yield "event: overflow\ndata: {}\n\n"
+                return
+            yield message
+    finally:
+        broker.unsubscribe(subscription)
@@ -0,0 +1,50 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_KEY = "tasks:version"
+
+
+def get_version(key):
+    """
+    Return the current generation of the data counted under ``key``.
+
+    Cached views embed this number in their keys, so bumping it
+    invalidates every cached entry at once without tracking individual keys.
+    """
+    version = cache.get(key)
+    if version is None:
+        # Seed from the clock so an evicted counter never restarts at a
+        # value that older, still cached entries were keyed with.
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+def get_tasks_version():
+    """Return the current generation of task data."""
+    return get_version(VERSION_KEY)
+
+
+def bump_tasks_version():
+    bump_version(VERSION_KEY)
+
+
+def invalidate_task_caches():
+    """
+    Invalidate all cached task data after a write.
+
+    The version is bumped straight away and again once the surrounding
+    transaction commits, so a response cached by a concurrent request while
+    the write was still uncommitted does not outlive it.
+    """
+    bump_tasks_version()
+    transaction.on_commit(bump_tasks_version)
@@ -0,0 +1,137 @@
+import base64
+import binascii
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+
+from .models import Task, TaskTombstone
+
+
+class CursorExpired(APIException):
+    status_code = status.HTTP_410_GONE
+    default_detail = (
+        "Deletions since this cursor are no longer known; "
+        "sync again without 'since'."
+    )
+    default_code = "cursor_expired"
+
+
+def get_changes(since, fields):
+    """
+    Return the tasks written and the ids of tasks deleted after the
+    ``since`` token, plus the token to pass next time.
+
+    Both logs are read in ``(timestamp, id)`` order with a keyset
+    condition. Only rows older than ``TASKS_CHANGES_SETTLE_SECONDS`` are
+    returned, so a write that commits late, with an earlier timestamp than
+    rows already handed out, is still ahead of every cursor.
+    """
+    cutoff = timezone.now() - timedelta(
+        seconds=settings.TASKS_CHANGES_SETTLE_SECONDS
+    )
+    if since:
+        task_position, tombstone_position = decode_cursor(since)
+        horizon = timezone.now() - timedelta(
+            days=settings.TASKS_TOMBSTONE_RETENTION_DAYS
+        )
+        if tombstone_position[0] < horizon:
+            raise CursorExpired()
+    else:
+        # A new replica needs every task but no past deletions.
+        task_position, tombstone_position = None, (cutoff, None)
+
+    limit = settings.TASKS_CHANGES_PAGE_SIZE
+    rows = _after(
+        Task.objects.filter(updated_at__lte=cutoff)
+        .annotate(assigned_to_username=F("assigned_to__username"))
+        .order_by("updated_at", "id"),
+        "updated_at",
+        task_position,
+    ).values_list(*fields)[: limit + 1]
+    tombstones = _after(
+        TaskTombstone.objects.filter(deleted_at__lte=cutoff).order_by(
+            "deleted_at", "id"
+        ),
+        "deleted_at",
+        tombstone_position,
+    ).values_list("deleted_at", "id", "task_id")[: limit + 1]
+    rows, tombstones = [*rows], [*tombstones]
+
+    has_more = len(rows) > limit or len(tombstones) > limit
+    rows, tombstones = rows[:limit], tombstones[:limit]
+    position = dict(zip(fields, rows[-1])) if rows else None
+    return {
+        "changed": rows,
+        "deleted": [task_id for _, _, task_id in tombstones],
+        "cursor": encode_cursor(
+            _next_position(
+                task_position,
+                position and (position["updated_at"], position["id"]),
+                len(rows) < limit,
+                cutoff,
+            ),
+            _next_position(
+                tombstone_position,
+                tombstones[-1][:2] if tombstones else None,
+                len(tombstones) < limit,
+                cutoff,
+            ),
+        ),
+        "has_more": has_more,
+    }
+
+
+def _after(queryset, field, position):
+    """Keep the rows after ``position``; ``(time, None)`` means ``> time``."""
+    if position is None:
+        return queryset
+    moment, pk = position
+    if pk is None:
+        return queryset.filter(**{f"{field}__gt": moment})
+    return queryset.filter(
+        Q(**{f"{field}__gt": moment}) | Q(**{field: moment, "id__gt": pk})
+    )
+
+
+def _next_position(current, last, exhausted, cutoff):
+    # Once a log is read up to the cutoff, everything before the cutoff has
+    # been seen and the position can move there even without new rows.
+    if exhausted:
+        return (cutoff, None)
+    return last or current
+
+
+def encode_cursor(task_position, tombstone_position):
+    values = [
+        part
+        for moment, pk in (task_position, tombstone_position)
+        for part in (moment.isoformat(), pk)
+    ]
+    data = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    try:
+        data = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        task_time, task_id, tombstone_time, tombstone_id = json.loads(data)
+        positions = [
+            (parse_datetime(task_time), task_id),
+            (parse_datetime(tombstone_time), tombstone_id),
+        ]
+    except (TypeError, ValueError, binascii.Error):
+        raise ValidationError({"since": ["Invalid cursor."]})
+    for moment, pk in positions:
+        if (
+            moment is None
+            or timezone.is_naive(moment)
+            or not (pk is None or type(pk) is int)
+        ):
+            raise ValidationError({"since": ["Invalid cursor."]})
+    return positions
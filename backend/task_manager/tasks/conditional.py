@@ -0,0 +1,68 @@
+import hashlib
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+
+from .cache import get_tasks_version
+
+
+def make_etag(*parts):
+    """Return a strong ETag derived from the given values."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16)
+    return f'"{digest.hexdigest()}"'
+
+
+def validators(etag, last_modified):
+    """
+    Bundle the validators of a representation. ``last_modified`` is stored
+    as a whole-second timestamp, the resolution of HTTP dates.
+    """
+    return {
+        "etag": etag,
+        "last_modified": (
+            int(last_modified.timestamp()) if last_modified else None
+        ),
+    }
+
+
+def not_modified(request, entry):
+    """
+    Return a 304 (or 412) response if the request's conditional headers
+    match ``entry``, otherwise ``None``.
+    """
+    response = get_conditional_response(
+        request, etag=entry["etag"], last_modified=entry["last_modified"]
+    )
+    if response is not None:
+        set_validator_headers(response, entry)
+    return response
+
+
+def set_validator_headers(response, entry):
+    response["ETag"] = entry["etag"]
+    if entry["last_modified"] is not None:
+        response["Last-Modified"] = http_date(entry["last_modified"])
+    # Let clients store the representation but always revalidate it.
+    response["Cache-Control"] = "private, no-cache"
+    patch_vary_headers(response, ["Authorization"])
+    return response
+
+
+def response_cache_key(request):
+    """
+    Key for the server-side cache of serialized task responses, or ``None``
+    when that cache is disabled. Keys embed the task data version, so any
+    task write invalidates every cached page.
+    """
+    if not settings.TASKS_RESPONSE_CACHE_TIMEOUT:
+        return None
+    query = urlencode(sorted(request.query_params.lists()), doseq=True)
+    path = hashlib.blake2b(
+        f"{request.path}?{query}".encode(), digest_size=16
+    ).hexdigest()
+    return (
+        f"tasks:response:{get_tasks_version()}:{request.user.pk}:"
+        f"{request.accepted_renderer.format}:{path}"
+    )
@@ -0,0 +1,225 @@
+import asyncio
+import json
+import logging
+import secrets
+import threading
+import time
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from .serializers import TaskSerializer
+
+logger = logging.getLogger(__name__)
+
+# Queued in place of the pending events when a subscriber falls behind.
+OVERFLOW = object()
+
+
+class Subscription:
+    """
+    One open event stream: a bounded queue filled on the stream's event
+    loop. A consumer that lets ``TASK_EVENTS_QUEUE_SIZE`` events pile up
+    is cut off instead of growing the queue without limit.
+    """
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=settings.TASK_EVENTS_QUEUE_SIZE)
+        self.overflowed = False
+
+    def put(self, message):
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(OVERFLOW)
+
+
+class InProcessBroker:
+    """
+    Fans events out to the streams open in this process. Enough for a
+    single worker; with several, each only sees its own writes.
+    """
+
+    def __init__(self):
+        self._subscriptions = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id):
+        """Open a subscription; must be called on the stream's loop."""
+        subscription = Subscription(user_id)
+        with self._lock:
+            self._subscriptions.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.user_id]
+
+    def has_subscribers(self, user_ids):
+        """Whether an event for ``user_ids`` would reach anyone."""
+        with self._lock:
+            return any(user_id in self._subscriptions for user_id in user_ids)
+
+    def publish(self, user_ids, message):
+        self.deliver(user_ids, message)
+
+    def deliver(self, user_ids, message):
+        """Queue ``message`` for the local streams of ``user_ids``."""
+        with self._lock:
+            subscriptions = [
+                subscription
+                for user_id in user_ids
+                for subscription in self._subscriptions.get(user_id, ())
+            ]
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(
+                    subscription.put, message
+                )
+            except RuntimeError:
+                # The stream's loop is closed; it is going away anyway.
+                pass
+
+
+class RedisBroker(InProcessBroker):
+    """
+    Publishes events on a Redis channel that every worker listens to, so a
+    write in one process reaches streams open in the others.
+    """
+
+    channel = "tasks:events"
+
+    def __init__(self):
+        super().__init__()
+        try:
+            import redis
+        except ImportError:
+            raise ImproperlyConfigured(
+                "RedisBroker requires the redis package."
+            )
+        self._redis = redis.Redis.from_url(settings.TASK_EVENTS_REDIS_URL)
+        self._listener = None
+
+    def has_subscribers(self, user_ids):
+        # Subscribers may be in another process.
+        return True
+
+    def publish(self, user_ids, message):
+        self._redis.publish(
+            self.channel,
+            json.dumps({"users": [*user_ids], "message": message}),
+        )
+
+    def subscribe(self, user_id):
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(
+                    target=self._listen, name="task-events", daemon=True
+                )
+                self._listener.start()
+        return super().subscribe(user_id)
+
+    def _listen(self):
+        while True:
+            try:
+                pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                for item in pubsub.listen():
+                    data = json.loads(item["data"])
+                    self.deliver(data["users"], data["message"])
+            except Exception:
+                logger.exception("Task event listener failed; reconnecting")
+                time.sleep(1)
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    return import_string(settings.TASK_EVENTS_BROKER)()
+
+
+async def aissue_ticket(user_id):
+    """
+    Return a ticket that opens one event stream for ``user_id`` within
+    ``TASK_EVENTS_TICKET_SECONDS``. ``EventSource`` can only pass
+    credentials in the URL, which ends up in access logs; a ticket logged
+    there is already used or about to expire, unlike an access token.
+    """
+    ticket = secrets.token_urlsafe(32)
+    await cache.aset(
+        f"tasks:events:ticket:{ticket}",
+        user_id,
+        settings.TASK_EVENTS_TICKET_SECONDS,
+    )
+    return ticket
+
+
+async def aredeem_ticket(ticket):
+    """Return the user id of ``ticket`` and invalidate it, or ``None``."""
+    key = f"tasks:events:ticket:{ticket}"
+    user_id = await cache.aget(key)
+    # Of concurrent uses of one ticket, only the one that deletes it wins.
+    if user_id is None or not await cache.adelete(key):
+        return None
+    return user_id
+
+
+def format_event(kind, data):
+    """Encode one Server-Sent Events frame."""
+    return f"event: {kind}\ndata: {json.dumps(data)}\n\n"
+
+
+def task_saved(task, created):
+    """
+    Queue ``created``/``updated`` for the task's assignee, and
+    ``unassigned`` for the previous assignee after a reassignment. Events
+    are published once the transaction commits.
+    """
+    events = [("created" if created else "updated", task.assigned_to_id)]
+    if not created and task.previous_assignee_id is not None:
+        events.append(("unassigned", task.previous_assignee_id))
+    _publish_on_commit(task, events)
+
+
+def task_deleted(task):
+    _publish_on_commit(task, [("deleted", task.assigned_to_id)])
+
+
+def _publish_on_commit(task, events):
+    broker = get_broker()
+    if not broker.has_subscribers([user_id for _, user_id in events]):
+        return
+    messages = [
+        (
+            user_id,
+            format_event(
+                kind,
+                (
+                    TaskSerializer(task).data
+                    if kind in ("created", "updated")
+                    else {"id": task.pk}
+                ),
+            ),
+        )
+        for kind, user_id in events
+    ]
+
+    def publish():
+        for user_id, message in messages:
+            broker.publish([user_id], message)
+
+    transaction.on_commit(publish)
@@ -0,0 +1,33 @@
+from django_filters import rest_framework as filters
+
+from .models import Task
+
+
+class TaskFilter(filters.FilterSet):
+    """
+    Filters of the task list: exact ``status``, exact or ranged
+    ``due_date`` (``due_date__gte``/``due_date__lte``, served by the
+    due-date index), ``assigned_to`` and ``overdue``.
+    """
+
+    # Compared on the column, so no query validates the user id.
+    assigned_to = filters.NumberFilter(field_name="assigned_to_id")
+    # A choice rather than a BooleanFilter, whose widget ignores values
+    # other than true/false instead of rejecting them.
+    overdue = filters.TypedChoiceFilter(
+        choices=[("true", "true"), ("false", "false")],
+        coerce=lambda value: value == "true",
+        method="filter_overdue",
+        label="Open tasks whose due date has passed (or, if false, not).",
+    )
+
+    class Meta:
+        model = Task
+        fields = {
+            "status": ["exact"],
+            "due_date": ["exact", "gte", "lte"],
+        }
+
+    def filter_overdue(self, queryset, name, value):
+        # Kept current by Task.save() and ``manage.py sweep_overdue``.
+        return queryset.filter(is_overdue=value)
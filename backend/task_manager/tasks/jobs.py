@@ -0,0 +1,248 @@
+import logging
+import random
+import traceback
+import uuid
+from collections import defaultdict
+from collections.abc import Callable
+from datetime import timedelta
+from itertools import groupby
+
+from django.conf import settings
+from django.core.mail import send_mass_mail
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Job, Task, TaskTombstone
+from .stats import get_task_stats
+
+logger = logging.getLogger(__name__)
+
+# kind -> (function, batch). A batch handler gets the payloads of every
+# claimed job of its kind in one call; the others get one payload per call.
+HANDLERS: dict[str, tuple[Callable[..., None], bool]] = {}
+
+
+def handler(kind, batch=False):
+    """Register the function that runs jobs of ``kind``."""
+
+    def register(func):
+        HANDLERS[kind] = (func, batch)
+        return func
+
+    return register
+
+
+def enqueue(kind, payload=None):
+    """
+    Queue a ``kind`` job once the current transaction commits, so workers
+    never see work for rows that were rolled back. With ``JOBS_EAGER`` the
+    job runs at that point instead, in the calling thread.
+    """
+    enqueue_many([(kind, payload or {})])
+
+
+def enqueue_many(jobs):
+    """Queue ``(kind, payload)`` pairs on commit with one INSERT."""
+
+    def add():
+        if settings.JOBS_EAGER:
+            for kind, group in groupby(jobs, key=lambda job: job[0]):
+                func, batch = HANDLERS[kind]
+                payloads = [payload for _, payload in group]
+                if batch:
+                    func(payloads)
+                else:
+                    for payload in payloads:
+                        func(payload)
+        else:
+            Job.objects.bulk_create(
+                Job(kind=kind, payload=payload) for kind, payload in jobs
+            )
+
+    transaction.on_commit(add)
+
+
+def task_saved(task, created):
+    tasks_saved([task], created)
+
+
+def tasks_saved(tasks, created):
+    """
+    Queue the follow-up work of saving ``tasks``: stats are recomputed, and
+    new or reassigned tasks (see ``Task.track_assignee()``) are notified
+    to their assignee.
+    """
+    enqueue_many(
+        [
+            ("recalculate_stats", {}),
+            *(
+                ("notify", {"task_id": task.pk})
+                for task in tasks
+                if created or task.assignee_changed
+            ),
+        ]
+    )
+
+
+def task_deleted(task):
+    enqueue_many([("recalculate_stats", {}), ("purge_tombstones", {})])
+
+
+def backoff(attempts):
+    """
+    Delay before retry number ``attempts``: exponential from
+    ``JOBS_RETRY_BASE_SECONDS``, capped at ``JOBS_RETRY_MAX_SECONDS``, with
+    jitter so jobs that failed together do not retry together.
+    """
+    delay = min(
+        settings.JOBS_RETRY_MAX_SECONDS,
+        settings.JOBS_RETRY_BASE_SECONDS * 2 ** (attempts - 1),
+    )
+    return timedelta(seconds=random.uniform(delay / 2, delay))
+
+
+class Worker:
+    """
+    Claims due jobs in batches and runs them until ``stop`` is set. Any
+    number of workers, in threads or processes, can share the queue: a
+    claim is a conditional UPDATE, so each job is leased to one worker.
+    """
+
+    def __init__(self, stop, batch_size=None, poll_interval=None):
+        self.stop = stop
+        self.batch_size = batch_size or settings.JOBS_BATCH_SIZE
+        self.poll_interval = poll_interval or settings.JOBS_POLL_SECONDS
+        self.name = uuid.uuid4().hex
+        self.processed = self.failed = 0
+
+    def run(self, until_empty=False):
+        while not self.stop.is_set():
+            if not self.run_once():
+                if until_empty:
+                    break
+                self.stop.wait(self.poll_interval)
+
+    def run_once(self):
+        """Claim and run one batch; return how many jobs it held."""
+        jobs = self.claim()
+        for kind, group in groupby(jobs, key=lambda job: job.kind):
+            self.run_kind(kind, [*group])
+        return len(jobs)
+
+    def claim(self):
+        now = timezone.now()
+        free = Q(locked_until__isnull=True) | Q(locked_until__lt=now)
+        due = Job.objects.filter(free, state=Job.QUEUED, run_after__lte=now)
+        ids = [
+            *due.order_by("run_after", "id").values_list("id", flat=True)[
+                : self.batch_size
+            ]
+        ]
+        if not ids:
+            return []
+        lease = now + timedelta(seconds=settings.JOBS_LEASE_SECONDS)
+        # Another worker may have leased some of them since; keep the rest.
+        Job.objects.filter(free, id__in=ids).update(
+            locked_until=lease, locked_by=self.name
+        )
+        return [
+            *Job.objects.filter(
+                id__in=ids, locked_by=self.name, locked_until=lease
+            ).order_by("kind", "id")
+        ]
+
+    def run_kind(self, kind, jobs):
+        func, batch = HANDLERS.get(kind, (None, False))
+        if func is None:
+            self.give_up(jobs, f"Unknown job kind {kind!r}.")
+            return
+        for unit in [jobs] if batch else [[job] for job in jobs]:
+            try:
+                if batch:
+                    func([job.payload for job in unit])
+                else:
+                    func(unit[0].payload)
+            except Exception:
+                logger.exception("%s job failed", kind)
+                self.retry(unit, traceback.format_exc())
+            else:
+                Job.objects.filter(id__in=[job.id for job in unit]).delete()
+                self.processed += len(unit)
+
+    def retry(self, jobs, error):
+        now = timezone.now()
+        for job in jobs:
+            job.attempts += 1
+            job.last_error = error
+            job.locked_until, job.locked_by = None, ""
+            if job.attempts >= settings.JOBS_MAX_ATTEMPTS:
+                job.state = Job.FAILED
+                self.failed += 1
+            else:
+                job.run_after = now + backoff(job.attempts)
+        Job.objects.bulk_update(
+            jobs,
+            [
+                "attempts",
+                "last_error",
+                "locked_until",
+                "locked_by",
+                "state",
+                "run_after",
+            ],
+        )
+
+    def give_up(self, jobs, error):
+        Job.objects.filter(id__in=[job.id for job in jobs]).update(
+            state=Job.FAILED, last_error=error, locked_until=None, locked_by=""
+        )
+        self.failed += len(jobs)
+
+
+@handler("notify", batch=True)
+def notify_assignees(payloads):
+    """Email each assignee once about all of their newly assigned tasks."""
+    tasks = Task.objects.filter(
+        id__in={payload["task_id"] for payload in payloads}
+    ).select_related("assigned_to")
+    by_user = defaultdict(list)
+    for task in tasks.order_by("due_date", "id"):
+        if task.assigned_to.email:
+            by_user[task.assigned_to].append(task)
+    send_mass_mail(
+        [
+            (
+                (
+                    f"Task assigned to you: {user_tasks[0].title}"
+                    if len(user_tasks) == 1
+                    else f"{len(user_tasks)} tasks assigned to you"
+                ),
+                "\n".join(
+                    f"- {task.title} (due {task.due_date.isoformat()})"
+                    for task in user_tasks
+                ),
+                None,
+                [user.email],
+            )
+            for user, user_tasks in by_user.items()
+        ]
+    )
+
+
+@handler("recalculate_stats", batch=True)
+def recalculate_stats(payloads):
+    """
+    Recompute and cache /api/tasks/stats/ for the default window after
+    writes, so the next request for it is a cache hit.
+    """
+    get_task_stats(timezone.localdate(), settings.TASKS_DUE_SOON_DAYS)
+
+
+@handler("purge_tombstones", batch=True)
+def purge_tombstones(payloads):
+    """Drop tombstones older than ``TASKS_TOMBSTONE_RETENTION_DAYS``."""
+    horizon = timezone.now() - timedelta(
+        days=settings.TASKS_TOMBSTONE_RETENTION_DAYS
+    )
+    TaskTombstone.objects.filter(deleted_at__lt=horizon).delete()
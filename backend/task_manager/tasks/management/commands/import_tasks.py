@@ -0,0 +1,203 @@
+import csv
+import json
+import time
+from itertools import islice
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from tasks.cache import invalidate_task_caches
+from tasks.models import ImportCheckpoint, Task
+
+FORMATS = ("ndjson", "csv")
+
+# Columns produced by /api/tasks/export/ that the database assigns itself.
+IGNORED_COLUMNS = {"id", "created_at", "updated_at"}
+
+
+class Command(BaseCommand):
+    help = (
+        "Import tasks from an NDJSON or CSV file in bulk_create batches. "
+        "Each batch is committed together with a checkpoint, so an "
+        "interrupted import can be continued with --resume."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="NDJSON or CSV file to import.")
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            help="Input format (default: inferred from the file extension).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows inserted per transaction (default: 1000).",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Skip the rows committed by a previous run of this source.",
+        )
+        parser.add_argument(
+            "--source",
+            help="Checkpoint name (default: the absolute file path).",
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.is_file():
+            raise CommandError(f"File not found: {path}")
+        input_format = options["format"] or path.suffix.lstrip(".").lower()
+        if input_format == "jsonl":
+            input_format = "ndjson"
+        if input_format not in FORMATS:
+            raise CommandError(
+                "Cannot infer the input format; pass --format ndjson|csv."
+            )
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+
+        source = options["source"] or str(path.resolve())
+        checkpoint, _ = ImportCheckpoint.objects.get_or_create(source=source)
+        start = checkpoint.position if options["resume"] else 0
+        if start:
+            self.stdout.write(f"Resuming {source} after row {start}.")
+
+        self.user_ids = {}
+        imported = skipped = 0
+        started = time.monotonic()
+
+        with path.open(newline="", encoding="utf-8") as handle:
+            rows = islice(read_rows(handle, input_format), start, None)
+            for batch in batched(rows, batch_size):
+                tasks, errors = self.build_tasks(batch)
+                for position, message in errors:
+                    self.stderr.write(f"Row {position}: {message}")
+                with transaction.atomic():
+                    Task.objects.bulk_create(tasks)
+                    invalidate_task_caches()
+                    checkpoint.position = batch[-1][0]
+                    checkpoint.save(update_fields=["position", "updated_at"])
+                imported += len(tasks)
+                skipped += len(errors)
+                if options["verbosity"] >= 2:
+                    self.stdout.write(
+                        f"Committed through row {checkpoint.position} "
+                        f"({rate(imported, started)} rows/s)"
+                    )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {imported} tasks, skipped {skipped} invalid rows "
+                f"in {time.monotonic() - started:.1f}s "
+                f"({rate(imported, started)} rows/s)."
+            )
+        )
+
+    def build_tasks(self, batch):
+        """
+        Turn a batch of ``(position, row)`` pairs into unsaved tasks,
+        resolving assignee usernames with one query per batch. Names that
+        match no user are remembered as ``None``, so they are looked up once.
+        """
+        usernames = {username_of(row) for _, row in batch} - set(self.user_ids)
+        usernames.discard(None)
+        if usernames:
+            self.user_ids.update(
+                User.objects.filter(username__in=usernames).values_list(
+                    "username", "id"
+                )
+            )
+            for username in usernames:
+                self.user_ids.setdefault(username, None)
+
+        tasks, errors = [], []
+        for position, row in batch:
+            try:
+                tasks.append(self.build_task(row))
+            except ValidationError as exc:
+                errors.append((position, format_error(exc)))
+        return tasks, errors
+
+    def build_task(self, row):
+        if isinstance(row, json.JSONDecodeError):
+            raise ValidationError(f"Invalid JSON: {row.msg}.")
+        if not isinstance(row, dict):
+            raise ValidationError("Expected an object.")
+        username = username_of(row)
+        user_id = self.user_ids.get(username)
+        if user_id is None:
+            raise ValidationError(
+                {"assigned_to": [f"Unknown user {username!r}."]}
+            )
+        fields = {
+            name: value
+            for name, value in row.items()
+            if name not in IGNORED_COLUMNS
+            and name not in ("assigned_to", "assigned_to_username")
+        }
+        unknown = {str(name) for name in fields} - {
+            "title",
+            "description",
+            "due_date",
+            "status",
+        }
+        if unknown:
+            raise ValidationError(
+                f"Unknown columns: {', '.join(sorted(unknown))}."
+            )
+        if not fields.get("status"):
+            fields.pop("status", None)
+        task = Task(assigned_to_id=user_id, **fields)
+        task.clean_fields(exclude=["assigned_to"])
+        task.set_overdue()
+        return task
+
+
+def read_rows(handle, input_format):
+    """Yield ``(position, row)`` for every record, numbered from 1."""
+    if input_format == "csv":
+        records = csv.DictReader(handle)
+    else:
+        records = (parse_json_line(line) for line in handle if line.strip())
+    return enumerate(records, start=1)
+
+
+def parse_json_line(line):
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as exc:
+        return exc
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def username_of(row):
+    if not isinstance(row, dict):
+        return None
+    username = row.get("assigned_to_username") or row.get("assigned_to")
+    return str(username) if username not in (None, "") else None
+
+
+def format_error(exc):
+    if hasattr(exc, "message_dict"):
+        return "; ".join(
+            f"{field}: {' '.join(messages)}"
+            for field, messages in exc.message_dict.items()
+        )
+    return " ".join(exc.messages)
+
+
+def rate(count, started):
+    elapsed = time.monotonic() - started
+    return int(count / elapsed) if elapsed else count
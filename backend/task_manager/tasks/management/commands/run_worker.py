@@ -0,0 +1,86 @@
+import signal
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from tasks.jobs import Worker
+
+
+class Command(BaseCommand):
+    help = (
+        "Run queued background jobs (notifications, stats recalculation, "
+        "tombstone cleanup) in a pool of worker threads. Start several "
+        "processes for more throughput; they share the queue safely."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=settings.JOBS_WORKER_THREADS,
+            help="Worker threads (default: JOBS_WORKER_THREADS).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.JOBS_BATCH_SIZE,
+            help="Jobs claimed at a time (default: JOBS_BATCH_SIZE).",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once no due jobs are left instead of polling.",
+        )
+
+    def handle(self, *args, **options):
+        if options["threads"] < 1 or options["batch_size"] < 1:
+            raise CommandError(
+                "--threads and --batch-size must be positive integers."
+            )
+        stop = threading.Event()
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda *args: stop.set())
+
+        workers = [
+            Worker(stop, batch_size=options["batch_size"])
+            for _ in range(options["threads"])
+        ]
+        threads = [
+            threading.Thread(
+                target=run_worker,
+                args=(worker, options["once"]),
+                name=f"job-worker-{number}",
+            )
+            for number, worker in enumerate(workers, start=1)
+        ]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                # A timeout keeps the main thread responsive to Ctrl+C.
+                while thread.is_alive():
+                    thread.join(timeout=0.5)
+        except KeyboardInterrupt:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Ran {sum(worker.processed for worker in workers)} jobs, "
+                f"{sum(worker.failed for worker in workers)} failed for good, "
+                f"in {time.monotonic() - started:.1f}s."
+            )
+        )
+
+
+def run_worker(worker, until_empty):
+    try:
+        worker.run(until_empty)
+    finally:
+        # Each thread has its own database connection.
+        connections.close_all()
@@ -0,0 +1,72 @@
+import signal
+import threading
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.overdue import Sweeper
+
+
+class Command(BaseCommand):
+    help = (
+        "Flag the open tasks whose due date has passed (Task.is_overdue) "
+        "and clear the flag on tasks completed or rescheduled, in batches. "
+        "Run it once a day after midnight, or keep it running with --loop."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.TASKS_OVERDUE_BATCH_SIZE,
+            help="Tasks updated per transaction "
+            "(default: TASKS_OVERDUE_BATCH_SIZE).",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Sweep again every --interval seconds until stopped.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.TASKS_OVERDUE_SWEEP_SECONDS,
+            help="Seconds between sweeps with --loop "
+            "(default: TASKS_OVERDUE_SWEEP_SECONDS).",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1 or options["interval"] <= 0:
+            raise CommandError("--batch-size and --interval must be positive.")
+        stop = threading.Event()
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda *args: stop.set())
+
+        verbose = options["verbosity"] >= 2
+        try:
+            while not stop.is_set():
+                metrics = Sweeper(
+                    batch_size=options["batch_size"],
+                    progress=self.write_progress if verbose else None,
+                ).run()
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Flagged {metrics['flagged']} overdue tasks and "
+                        f"cleared {metrics['cleared']} in "
+                        f"{metrics['batches']} batches, "
+                        f"{metrics['seconds']:.1f}s "
+                        f"({metrics['rows_per_second']:.0f} rows/s)."
+                    )
+                )
+                if not options["loop"]:
+                    break
+                stop.wait(options["interval"])
+        except KeyboardInterrupt:
+            pass
+
+    def write_progress(self, metrics):
+        if metrics["batches"] and metrics["finished_at"] is None:
+            self.stdout.write(
+                f"Batch {metrics['batches']}: {metrics['flagged']} flagged, "
+                f"{metrics['cleared']} cleared so far."
+            )
@@ -0,0 +1,49 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+from tasks.search import create_search_index, drop_search_index
+
+
+def create_index(apps, schema_editor):
+    create_search_index(schema_editor, apps.get_model("tasks", "Task"))
+
+
+def drop_index(apps, schema_editor):
+    drop_search_index(schema_editor, apps.get_model("tasks", "Task"))
+
+
+class Migration(migrations.Migration):
+    """
+    Full-text index for ``?search=``: an FTS5 table with sync triggers on
+    SQLite, a GIN tsvector index on PostgreSQL, nothing elsewhere.
+    """
+
+    dependencies = [
+        ("tasks", "0003_importcheckpoint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskSearchEntry",
+            fields=[
+                (
+                    "task",
+                    models.OneToOneField(
+                        db_column="rowid",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        primary_key=True,
+                        related_name="search_entry",
+                        serialize=False,
+                        to="tasks.task",
+                    ),
+                ),
+                ("query", models.TextField(db_column="tasks_task_fts")),
+                ("rank", models.FloatField()),
+            ],
+            options={
+                "db_table": "tasks_task_fts",
+                "managed": False,
+            },
+        ),
+        migrations.RunPython(create_index, drop_index, elidable=False),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.1.6 on 2026-10-18 18:40
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def flag_overdue_tasks(apps, schema_editor):
+    Task = apps.get_model("tasks", "Task")
+    Task.objects.filter(due_date__lt=timezone.localdate()).exclude(
+        status="completed"
+    ).update(is_overdue=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0006_job"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="is_overdue",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(
+            flag_overdue_tasks, migrations.RunPython.noop, elidable=True
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["is_overdue", "status", "due_date"],
+                name="task_overdue_status_due_idx",
+            ),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from django.contrib.auth.models import User
 
 
@@ -20,6 +21,172 @@ class Task(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Open and past its due date. Kept by save() and the bulk write paths
+    # (see set_overdue()); "manage.py sweep_overdue" flags the tasks whose
+    # due date passes without a write.
+    is_overdue = models.BooleanField(default=False)
+
+    class Meta:
+        indexes = [
+            # Status filter with the default created_at ordering
+            models.Index(
+                fields=["status", "created_at"], name="task_status_created_idx"
+            ),
+            # ?ordering=due_date, with id as the keyset tie-breaker
+            models.Index(
+                fields=["due_date", "id"], name="task_due_date_id_idx"
+            ),
+            # Per-assignee listings filtered by status and due date
+            models.Index(
+                fields=["assigned_to", "status", "due_date"],
+                name="task_assignee_status_due_idx",
+            ),
+            # /api/tasks/changes/ keyset over (updated_at, id)
+            models.Index(
+                fields=["updated_at", "id"], name="task_updated_id_idx"
+            ),
+            # ?overdue= lookups, and the sweeper's search for open tasks
+            # whose flag is out of date
+            models.Index(
+                fields=["is_overdue", "status", "due_date"],
+                name="task_overdue_status_due_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
+
+    def save(self, *args, update_fields=None, **kwargs):
+        if update_fields is None:
+            self.set_overdue()
+        elif {"status", "due_date"} & set(update_fields):
+            self.set_overdue()
+            update_fields = {*update_fields, "is_overdue"}
+        self.track_assignee()
+        super().save(*args, update_fields=update_fields, **kwargs)
+        self.assignee_saved()
+
+    def track_assignee(self):
+        """
+        Record, ahead of a write, whether it changes the assignee the task
+        was loaded with: ``assignee_changed`` (also true when that is not
+        known) and ``previous_assignee_id`` (``None`` unless known and
+        changed). post_save receivers read them; none should change them.
+        """
+        loaded = getattr(self, "_loaded_assigned_to_id", None)
+        self.assignee_changed = loaded != self.assigned_to_id
+        self.previous_assignee_id = loaded if self.assignee_changed else None
+
+    def assignee_saved(self):
+        """Take the assignee just written as the loaded one."""
+        self._loaded_assigned_to_id = self.assigned_to_id
+
+    def set_overdue(self, today=None):
+        """Recompute ``is_overdue`` from the status and due date."""
+        due_date = self._meta.get_field("due_date").to_python(self.due_date)
+        self.is_overdue = (
+            self.status != "completed"
+            and due_date is not None
+            and due_date < (today or timezone.localdate())
+        )
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        task = super().from_db(db, field_names, values)
+        # The assignee as loaded, so a reassignment can notify the new and
+        # the previous one (see track_assignee()).
+        task._loaded_assigned_to_id = task.__dict__.get("assigned_to_id")
+        return task
+
+
+class TaskSearchEntry(models.Model):
+    """
+    Row of the SQLite FTS5 index behind ``?search=`` (see ``tasks.search``),
+    maintained by triggers on the task table. Filtering on ``query`` runs a
+    full-text match; ``rank`` is its bm25 score, lower is better.
+    """
+
+    task = models.OneToOneField(
+        Task,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_column="rowid",
+        related_name="search_entry",
+    )
+    query = models.TextField(db_column="tasks_task_fts")
+    rank = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = "tasks_task_fts"
+
+
+class TaskTombstone(models.Model):
+    """
+    Record of a deleted task, so ``/api/tasks/changes/`` can report the
+    deletion to clients that hold a copy.
+    """
+
+    task_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["deleted_at", "id"], name="tombstone_deleted_id_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"Task {self.task_id} deleted at {self.deleted_at}"
+
+
+class ImportCheckpoint(models.Model):
+    """
+    Progress of a ``manage.py import_tasks`` run, committed in the same
+    transaction as each batch so a failed import resumes exactly after the
+    last batch that reached the database.
+    """
+
+    source = models.CharField(max_length=255, unique=True)
+    position = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.source} @ {self.position}"
+
+
+class Job(models.Model):
+    """
+    Deferred work queued by ``tasks.jobs.enqueue()`` and run by
+    ``manage.py run_worker``. A worker leases a job until ``locked_until``;
+    finished jobs are deleted, and jobs that fail ``JOBS_MAX_ATTEMPTS``
+    times are kept as ``failed``.
+    """
+
+    QUEUED = "queued"
+    FAILED = "failed"
+    STATE_CHOICES = [(QUEUED, "Queued"), (FAILED, "Failed")]
+
+    kind = models.CharField(max_length=50)
+    payload = models.JSONField(default=dict)
+    state = models.CharField(
+        max_length=10, choices=STATE_CHOICES, default=QUEUED
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=64, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # Workers claim due jobs oldest first
+            models.Index(
+                fields=["state", "run_after", "id"], name="job_state_due_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} job {self.pk} ({self.state})"
@@ -0,0 +1,98 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .cache import invalidate_task_caches
+from .models import Task
+
+SWEEP_KEY = "tasks:overdue_sweep"
+
+
+def stale_flags(today):
+    """
+    Filters matching the tasks whose ``is_overdue`` is wrong as of
+    ``today``, mapped to the value that corrects them.
+    """
+    return {
+        True: Q(is_overdue=False, due_date__lt=today) & ~Q(status="completed"),
+        False: Q(is_overdue=True)
+        & (Q(status="completed") | Q(due_date__gte=today)),
+    }
+
+
+def last_sweep():
+    """Progress of the running sweep, or totals of the last one."""
+    return cache.get(SWEEP_KEY)
+
+
+class Sweeper:
+    """
+    Brings ``Task.is_overdue`` up to date for ``today``, mostly flagging
+    the tasks whose due date has passed since they were last saved.
+
+    Tasks are walked in primary key order, ``batch_size`` ids at a time,
+    and each batch is updated in its own short transaction, so the sweep
+    never holds locks on more than one batch of rows.
+    """
+
+    def __init__(self, batch_size=None, today=None, progress=None):
+        self.batch_size = batch_size or settings.TASKS_OVERDUE_BATCH_SIZE
+        self.today = today or timezone.localdate()
+        self.progress = progress
+        self.batches = self.flagged = self.cleared = 0
+
+    def run(self):
+        started = time.monotonic()
+        self.report(started, finished_at=None)
+        for value, stale in stale_flags(self.today).items():
+            for updated in self.sweep(stale, value):
+                if value:
+                    self.flagged += updated
+                else:
+                    self.cleared += updated
+                self.report(started, finished_at=None)
+        return self.report(started, finished_at=timezone.now().isoformat())
+
+    def sweep(self, stale, value):
+        """Set ``is_overdue`` to ``value`` on ``stale`` tasks, per batch."""
+        last_id = 0
+        while True:
+            ids = [
+                *Task.objects.filter(stale, id__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[: self.batch_size]
+            ]
+            if not ids:
+                return
+            last_id = ids[-1]
+            with transaction.atomic():
+                # Tasks saved since the ids were read are left alone.
+                updated = Task.objects.filter(stale, id__in=ids).update(
+                    is_overdue=value
+                )
+                if updated:
+                    invalidate_task_caches()
+            self.batches += 1
+            yield updated
+
+    def report(self, started, finished_at):
+        elapsed = time.monotonic() - started
+        metrics = {
+            "as_of": self.today.isoformat(),
+            "batches": self.batches,
+            "flagged": self.flagged,
+            "cleared": self.cleared,
+            "seconds": round(elapsed, 3),
+            "rows_per_second": round(
+                (self.flagged + self.cleared) / elapsed if elapsed else 0, 1
+            ),
+            "finished_at": finished_at,
+        }
+        cache.set(SWEEP_KEY, metrics, timeout=None)
+        if self.progress:
+            self.progress(metrics)
+        return metrics
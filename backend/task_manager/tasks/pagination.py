@@ -0,0 +1,145 @@
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    Cursor,
+    CursorPagination,
+    PageNumberPagination,
+)
+
+
+class TaskPageNumberPagination(PageNumberPagination):
+    """
+    Page-number pagination that can reuse a row count the view has already
+    computed (set ``known_count``), saving the paginator's own ``COUNT(*)``.
+    """
+
+    known_count = None
+
+    def django_paginator_class(self, object_list, per_page):
+        paginator = Paginator(object_list, per_page)
+        if self.known_count is not None:
+            paginator.count = self.known_count
+        return paginator
+
+
+class TaskCursorPagination(CursorPagination):
+    """
+    Keyset pagination for tasks.
+
+    Pages are fetched with ``WHERE (key, id) > (last_key, last_id)`` instead
+    of ``OFFSET``, and no ``COUNT(*)`` is issued, so every page costs the same
+    regardless of how deep the client has paged. Ties on the ordering key are
+    broken by ``id`` so rows sharing a timestamp or due date are never
+    skipped or repeated.
+    """
+
+    ordering = "created_at"
+    page_size_query_param = "page_size"
+
+    def __init__(self):
+        self.max_page_size = settings.TASKS_MAX_PAGE_SIZE
+
+    def get_ordering(self, request, queryset, view):
+        field = super().get_ordering(request, queryset, view)[0]
+        tiebreak = "-id" if field.startswith("-") else "id"
+        return (field, tiebreak)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor.reverse
+
+        if reverse:
+            ordering = tuple(_flip(field) for field in self.ordering)
+        else:
+            ordering = self.ordering
+        queryset = queryset.order_by(*ordering)
+
+        if self.cursor is not None and self.cursor.position is not None:
+            queryset = queryset.filter(
+                self._after_position(queryset, ordering, self.cursor.position)
+            )
+
+        # Fetch one extra row to learn whether another page follows.
+        results = list(queryset[: self.page_size + 1])
+        has_following = len(results) > self.page_size
+        self.page = results[: self.page_size]
+
+        has_cursor = self.cursor is not None
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = has_cursor, has_following
+        else:
+            self.has_next, self.has_previous = has_following, has_cursor
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        position = self._get_position_from_instance(
+            self.page[-1], self.ordering
+        )
+        return self.encode_cursor(
+            Cursor(offset=0, reverse=False, position=position)
+        )
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        position = self._get_position_from_instance(
+            self.page[0], self.ordering
+        )
+        return self.encode_cursor(
+            Cursor(offset=0, reverse=True, position=position)
+        )
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = []
+        for field in ordering:
+            name = field.lstrip("-")
+            if isinstance(instance, dict):
+                value = instance[name]
+            else:
+                value = getattr(instance, name)
+            values.append(value.isoformat() if name != "id" else value)
+        return json.dumps(values, separators=(",", ":"))
+
+    def _after_position(self, queryset, ordering, position):
+        """
+        Build the lexicographic ``(key, id)`` comparison for a position.
+        """
+        try:
+            raw_key, raw_id = json.loads(position)
+            key_name = ordering[0].lstrip("-")
+            key_field = queryset.model._meta.get_field(key_name)
+            key = key_field.to_python(raw_key)
+            pk = int(raw_id)
+        except (TypeError, ValueError, LookupError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        if key is None:
+            raise NotFound(self.invalid_cursor_message)
+
+        key_op = "lt" if ordering[0].startswith("-") else "gt"
+        id_op = "lt" if ordering[1].startswith("-") else "gt"
+        return Q(**{f"{key_name}__{key_op}": key}) | Q(
+            **{key_name: key, f"id__{id_op}": pk}
+        )
+
+
+def _flip(field):
+    return field[1:] if field.startswith("-") else f"-{field}"
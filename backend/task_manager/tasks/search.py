@@ -0,0 +1,170 @@
+import re
+
+from django.db import connections
+from django.db.models import Q
+from rest_framework.filters import BaseFilterBackend
+
+# Full-text index over Task.title and Task.description.
+#
+# SQLite: an external-content FTS5 table holding only the index (the text
+# stays in tasks_task), kept in sync by triggers, so bulk_create(),
+# update() and raw SQL writes are indexed too. It is joined to tasks
+# through the unmanaged TaskSearchEntry model.
+# PostgreSQL: a GIN index on the tsvector expression that queries repeat.
+# Other databases fall back to unindexed substring matching.
+FTS_TABLE = "tasks_task_fts"
+FTS_TRIGGERS = [
+    f"{FTS_TABLE}_{event}" for event in ("insert", "delete", "update")
+]
+TS_CONFIG = "english"
+# Title matches outweigh description matches in the ranking.
+TITLE_WEIGHT = 2.0
+
+SQLITE_INDEX = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, description,
+        content='tasks_task', content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    INSERT INTO {FTS_TABLE}({FTS_TABLE}, rank)
+    VALUES ('rank', 'bm25({TITLE_WEIGHT}, 1.0)')
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_insert
+    AFTER INSERT ON tasks_task BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_delete
+    AFTER DELETE ON tasks_task BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_update
+    AFTER UPDATE OF title, description ON tasks_task BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+
+def postgresql_vector(weighted=False):
+    from django.contrib.postgres.search import SearchVector
+
+    if weighted:
+        return SearchVector(
+            "title", weight="A", config=TS_CONFIG
+        ) + SearchVector("description", weight="B", config=TS_CONFIG)
+    return SearchVector("title", "description", config=TS_CONFIG)
+
+
+def postgresql_index():
+    from django.contrib.postgres.indexes import GinIndex
+
+    # Same expression as the one search_tasks() filters on, or the planner
+    # would not use it.
+    return GinIndex(postgresql_vector(), name="task_search_idx")
+
+
+def create_search_index(schema_editor, model):
+    """
+    Create the full-text index of ``model`` (``Task``). On SQLite this is
+    idempotent: a table rebuild by a later migration drops the triggers,
+    so it also runs after every ``migrate``.
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        names = [FTS_TABLE, *FTS_TRIGGERS]
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT count(*) FROM sqlite_master WHERE name IN (%s)"
+                % ", ".join(["%s"] * len(names)),
+                names,
+            )
+            existing = cursor.fetchone()[0]
+        for statement in SQLITE_INDEX:
+            schema_editor.execute(statement)
+        if existing < len(names):
+            # New index, or rows may have changed while a trigger was
+            # missing: index the table's current content.
+            schema_editor.execute(
+                f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+            )
+    elif vendor == "postgresql":
+        schema_editor.add_index(model, postgresql_index())
+
+
+def drop_search_index(schema_editor, model):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        for trigger in FTS_TRIGGERS:
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    elif vendor == "postgresql":
+        schema_editor.remove_index(model, postgresql_index())
+
+
+def search_terms(query):
+    """
+    Split a user's query into words. Only word characters are kept, so no
+    input can inject full-text query syntax.
+    """
+    return re.findall(r"\w+", query)
+
+
+def search_tasks(queryset, query):
+    """
+    Narrow a ``Task`` queryset to rows whose title or description contain
+    every word of ``query``, best matches first. A query without words
+    leaves the queryset unchanged.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return queryset
+    vendor = connections[queryset.db].vendor
+    if vendor == "sqlite":
+        match = " ".join(f'"{term}"' for term in terms)
+        return queryset.filter(search_entry__query=match).order_by(
+            "search_entry__rank", "id"
+        )
+    if vendor == "postgresql":
+        from django.contrib.postgres.search import SearchQuery, SearchRank
+
+        search_query = SearchQuery(" ".join(terms), config=TS_CONFIG)
+        return (
+            queryset.alias(search_vector=postgresql_vector())
+            .filter(search_vector=search_query)
+            .order_by(
+                SearchRank(
+                    postgresql_vector(weighted=True), search_query
+                ).desc(),
+                "id",
+            )
+        )
+    # No full-text index on other databases: unranked substring matches.
+    for term in terms:
+        queryset = queryset.filter(
+            Q(title__icontains=term) | Q(description__icontains=term)
+        )
+    return queryset
+
+
+class TaskSearchFilter(BaseFilterBackend):
+    """``?search=`` over task titles and descriptions, ranked."""
+
+    search_param = "search"
+
+    def filter_queryset(self, request, queryset, view):
+        return search_tasks(
+            queryset, request.query_params.get(self.search_param, "")
+        )
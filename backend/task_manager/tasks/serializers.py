@@ -1,12 +1,198 @@
+from django.contrib.auth.models import User
+from django.utils import timezone
 from rest_framework import serializers
+from task_manager.metrics import timed
 from .models import Task
 
 
+class AssigneeField(serializers.PrimaryKeyRelatedField):
+    """
+    ``assigned_to`` field that resolves users preloaded by
+    ``TaskListSerializer`` instead of issuing one lookup per row.
+    """
+
+    def to_internal_value(self, data):
+        assignees = getattr(self.root, "assignees", None)
+        if assignees is None:
+            return super().to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            user = assignees.get(int(data))
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        if user is None:
+            self.fail("does_not_exist", pk_value=data)
+        return user
+
+
+class TaskListSerializer(serializers.ListSerializer):
+    """
+    Validates a batch of tasks and writes it with ``bulk_create`` /
+    ``bulk_update``.
+
+    For updates ``instance`` is a dict of tasks keyed by id and every item
+    must carry the ``id`` of the task it changes, at most once. Validation
+    errors are reported per item, in the order the items were sent.
+    """
+
+    def to_internal_value(self, data):
+        self.seen_ids = set()
+        if isinstance(data, list):
+            self.assignees = User.objects.only("id", "username").in_bulk(
+                _int_values(data, "assigned_to")
+            )
+        return super().to_internal_value(data)
+
+    def run_child_validation(self, data):
+        if self.instance is None:
+            return super().run_child_validation(data)
+
+        task_id = data.get("id") if isinstance(data, dict) else None
+        task = self.instance.get(task_id) if type(task_id) is int else None
+        if task is None:
+            raise serializers.ValidationError({"id": ["Task not found."]})
+        if task_id in self.seen_ids:
+            raise serializers.ValidationError(
+                {"id": ["Duplicate task id in this batch."]}
+            )
+        self.seen_ids.add(task_id)
+        self.child.instance = task
+        self.child.initial_data = data
+        try:
+            validated = super().run_child_validation(data)
+        finally:
+            self.child.instance = None
+        validated["id"] = task.id
+        return validated
+
+    def to_representation(self, data):
+        with timed("serialize"):
+            return super().to_representation(data)
+
+    def create(self, validated_data):
+        tasks = [Task(**attrs) for attrs in validated_data]
+        # bulk_create() and bulk_update() skip Task.save().
+        for task in tasks:
+            task.set_overdue()
+            task.track_assignee()
+        Task.objects.bulk_create(tasks)
+        for task in tasks:
+            task.assignee_saved()
+        return tasks
+
+    def update(self, instance, validated_data):
+        # bulk_update() bypasses auto_now, so stamp updated_at ourselves.
+        now = timezone.now()
+        fields = {"updated_at"}
+        tasks = []
+        for attrs in validated_data:
+            task = instance[attrs.pop("id")]
+            for name, value in attrs.items():
+                setattr(task, name, value)
+            task.updated_at = now
+            task.set_overdue()
+            task.track_assignee()
+            fields.update(attrs)
+            tasks.append(task)
+        fields.add("is_overdue")
+        Task.objects.bulk_update(tasks, sorted(fields))
+        for task in tasks:
+            task.assignee_saved()
+        return tasks
+
+
 class TaskSerializer(serializers.ModelSerializer):
+    assigned_to = AssigneeField(queryset=User.objects.all())
     assigned_to_username = serializers.CharField(
         source="assigned_to.username", read_only=True
     )
 
     class Meta:
         model = Task
-        fields = "__all__"
+        # is_overdue is kept for indexed lookups, not part of the API.
+        exclude = ["is_overdue"]
+        list_serializer_class = TaskListSerializer
+
+    def to_representation(self, instance):
+        with timed("serialize"):
+            return super().to_representation(instance)
+
+
+# Output order of TaskSerializer, which TaskReadSerializer reproduces.
+TASK_FIELDS = (
+    "id",
+    "assigned_to",
+    "assigned_to_username",
+    "title",
+    "description",
+    "due_date",
+    "status",
+    "created_at",
+    "updated_at",
+)
+
+_date = serializers.DateField().to_representation
+_datetime = serializers.DateTimeField().to_representation
+
+
+class TaskReadListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        with timed("serialize"):
+            return super().to_representation(data)
+
+
+class TaskReadSerializer(serializers.BaseSerializer):
+    """
+    Read-only ``TaskSerializer`` for the list and detail endpoints.
+
+    It builds the same output with one plain getter per attribute instead
+    of a bound DRF field, and can be limited to a subset of ``fields``, in
+    which case the other attributes may be deferred on the instances.
+    """
+
+    getters = {
+        "id": lambda task: task.id,
+        "assigned_to": lambda task: task.assigned_to_id,
+        "assigned_to_username": lambda task: task.assigned_to.username,
+        "title": lambda task: task.title,
+        "description": lambda task: task.description,
+        "due_date": lambda task: _date(task.due_date),
+        "status": lambda task: task.status,
+        "created_at": lambda task: _datetime(task.created_at),
+        "updated_at": lambda task: _datetime(task.updated_at),
+    }
+
+    class Meta:
+        list_serializer_class = TaskReadListSerializer
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._getters = [
+            (name, self.getters[name])
+            for name in TASK_FIELDS
+            if fields is None or name in fields
+        ]
+
+    def to_representation(self, instance):
+        return {name: get(instance) for name, get in self._getters}
+
+    @property
+    def data(self):
+        with timed("serialize"):
+            return super().data
+
+
+def _int_values(items, key):
+    values = set()
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        value = item.get(key)
+        if isinstance(value, bool):
+            continue
+        try:
+            values.add(int(value))
+        except (TypeError, ValueError):
+            continue
+    return values
@@ -0,0 +1,59 @@
+from django.db import connections
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+
+from . import events, jobs
+from .cache import invalidate_task_caches
+from .models import Task, TaskTombstone
+from .search import FTS_TABLE, create_search_index
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def task_changed(sender, **kwargs):
+    invalidate_task_caches()
+
+
+@receiver(post_delete, sender=Task)
+def record_tombstone(sender, instance, **kwargs):
+    TaskTombstone.objects.create(task_id=instance.pk)
+
+
+@receiver(post_save, sender=Task)
+def queue_saved_jobs(sender, instance, created, raw, **kwargs):
+    # Fixture loads save raw, bypassing Task.save() and its assignee
+    # tracking; they are not task changes to act on.
+    if raw:
+        return
+    jobs.task_saved(instance, created)
+
+
+@receiver(post_delete, sender=Task)
+def queue_deleted_jobs(sender, instance, **kwargs):
+    jobs.task_deleted(instance)
+
+
+@receiver(post_save, sender=Task)
+def publish_saved(sender, instance, created, raw, **kwargs):
+    if raw:
+        return
+    events.task_saved(instance, created)
+
+
+@receiver(post_delete, sender=Task)
+def publish_deleted(sender, instance, **kwargs):
+    events.task_deleted(instance)
+
+
+@receiver(post_migrate)
+def restore_search_triggers(sender, using, **kwargs):
+    """
+    SQLite migrations that rebuild ``tasks_task`` drop its triggers; put
+    the full-text index's triggers back once the index exists.
+    """
+    connection = connections[using]
+    if sender.name != "tasks" or connection.vendor != "sqlite":
+        return
+    if FTS_TABLE in connection.introspection.table_names():
+        with connection.schema_editor() as schema_editor:
+            create_search_index(schema_editor, Task)
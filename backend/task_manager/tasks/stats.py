@@ -0,0 +1,95 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max, Q
+
+from .cache import get_tasks_version
+from .models import Task
+
+STATUSES = [value for value, _ in Task.STATUS_CHOICES]
+
+
+def get_task_stats(today, due_soon_days):
+    """
+    Return task counts overall and per assignee, served from the cache.
+
+    Cache entries are keyed by the task data version, so any task write
+    invalidates them, and by date, since overdue/due-soon shift daily.
+    """
+    key = (
+        f"tasks:stats:{get_tasks_version()}:{today.isoformat()}:"
+        f"{due_soon_days}"
+    )
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute_task_stats(today, due_soon_days)
+        cache.set(key, stats, settings.TASKS_STATS_CACHE_TIMEOUT)
+    return stats
+
+
+def compute_task_stats(today, due_soon_days):
+    """Compute every counter with a single grouped aggregate query."""
+    open_tasks = ~Q(status="completed")
+    counters = {
+        "total": Count("id"),
+        **{
+            status: Count("id", filter=Q(status=status)) for status in STATUSES
+        },
+        "overdue": Count("id", filter=Q(is_overdue=True)),
+        "due_soon": Count(
+            "id",
+            filter=open_tasks
+            & Q(
+                due_date__gte=today,
+                due_date__lte=today + timedelta(days=due_soon_days),
+            ),
+        ),
+    }
+    rows = (
+        Task.objects.values("assigned_to", "assigned_to__username")
+        .annotate(**counters)
+        .order_by("assigned_to")
+    )
+
+    overall = dict.fromkeys(counters, 0)
+    by_assignee = []
+    for row in rows:
+        counts = {name: row[name] for name in counters}
+        for name, value in counts.items():
+            overall[name] += value
+        by_assignee.append(
+            {
+                "assigned_to": row["assigned_to"],
+                "assigned_to_username": row["assigned_to__username"],
+                **counts,
+            }
+        )
+
+    return {
+        "as_of": today.isoformat(),
+        "due_soon_days": due_soon_days,
+        "overall": overall,
+        "by_assignee": by_assignee,
+    }
+
+
+def get_assignee_counts(user_id):
+    """
+    Return the per-status counts of one user's tasks and when any of them
+    last changed, from one grouped query over the assignee index.
+    """
+    rows = (
+        Task.objects.filter(assigned_to_id=user_id)
+        .values("status")
+        .annotate(count=Count("id"), last_modified=Max("updated_at"))
+        .order_by()
+    )
+    counts = {"total": 0, **dict.fromkeys(STATUSES, 0)}
+    last_modified = None
+    for row in rows:
+        counts[row["status"]] = row["count"]
+        counts["total"] += row["count"]
+        if last_modified is None or row["last_modified"] > last_modified:
+            last_modified = row["last_modified"]
+    return counts, last_modified
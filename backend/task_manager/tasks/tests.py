@@ -1,10 +1,46 @@
+import asyncio
+import csv
+import io
+import json
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.models.signals import post_save
+from django.core import mail
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from django.utils.http import http_date
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APITestCase
+from rest_framework.pagination import PageNumberPagination
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.throttling import UserRateThrottle
-from django.core.cache import cache
-from .models import Task
+from django.core.cache import cache, caches
+from swaggers.schema import get_schema
+from task_manager.authentication import token_cache
+from task_manager.cache_backends import LockingFileBasedCache
+from task_manager.metrics import registry
+from task_manager.warmup import warm_up
+from task_manager.throttling import AtomicUserRateThrottle
+from . import signals
+from .events import InProcessBroker
+from .jobs import HANDLERS, Worker
+from .models import ImportCheckpoint, Job, Task, TaskTombstone
+from .serializers import TaskReadSerializer, TaskSerializer
 
 
 def create_tasks_for_test(user, n):
@@ -207,3 +243,2224 @@ class TaskThrottleTests(APITestCase):
 
         response = self.client.get("/api/tasks/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class TaskQueryCountTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass"
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.token = str(refresh.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+        # Warm up once so one-time setup queries do not skew the counts
+        self.client.get("/api/tasks/")
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, ctx.captured_queries
+
+    def test_list_query_count_independent_of_task_count(self):
+        create_tasks_for_test(self.user, 1)
+        _, baseline = self.count_queries("/api/tasks/")
+
+        create_tasks_for_test(self.user, 30)
+        response, queries = self.count_queries("/api/tasks/")
+        self.assertEqual(len(response.data["results"]), 5)
+        self.assertEqual(len(queries), len(baseline))
+
+    def test_list_query_count_independent_of_page_size(self):
+        other = User.objects.create_user(username="other", password="pass")
+        create_tasks_for_test(self.user, 10)
+        create_tasks_for_test(other, 10)
+
+        counts = []
+        for page_size in (1, 5, 20):
+            with mock.patch.object(
+                PageNumberPagination, "page_size", page_size
+            ):
+                response, queries = self.count_queries("/api/tasks/")
+            self.assertEqual(len(response.data["results"]), page_size)
+            counts.append(len(queries))
+        self.assertEqual(len(set(counts)), 1)
+
+    def test_list_loads_assignee_in_same_query(self):
+        other = User.objects.create_user(username="other", password="pass")
+        create_tasks_for_test(other, 5)
+        response, queries = self.count_queries("/api/tasks/")
+        self.assertEqual(
+            {
+                task["assigned_to_username"]
+                for task in response.data["results"]
+            },
+            {"other"},
+        )
+        task_queries = [
+            q["sql"] for q in queries if '"tasks_task"' in q["sql"]
+        ]
+        user_only_queries = [
+            q["sql"]
+            for q in queries
+            if '"auth_user"' in q["sql"] and '"tasks_task"' not in q["sql"]
+        ]
+        self.assertTrue(any("JOIN" in sql for sql in task_queries))
+        # The only standalone auth_user lookup left is authentication
+        self.assertLessEqual(len(user_only_queries), 1)
+
+    def test_list_defers_unused_user_columns(self):
+        create_tasks_for_test(self.user, 2)
+        _, queries = self.count_queries("/api/tasks/")
+        select = next(q["sql"] for q in queries if "JOIN" in q["sql"])
+        self.assertIn('"auth_user"."username"', select)
+        self.assertNotIn('"auth_user"."password"', select)
+
+    def test_retrieve_query_count(self):
+        create_tasks_for_test(self.user, 1)
+        task = Task.objects.get()
+        response, queries = self.count_queries(f"/api/tasks/{task.id}/")
+        self.assertEqual(response.data["assigned_to_username"], "testuser")
+        task_queries = [q for q in queries if '"tasks_task"' in q["sql"]]
+        self.assertEqual(len(task_queries), 1)
+
+
+class CachedJWTAuthenticationTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass"
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.token = str(refresh.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+
+    def user_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        queries = [
+            q for q in ctx.captured_queries if 'FROM "auth_user"' in q["sql"]
+        ]
+        return response, queries
+
+    def test_repeat_requests_skip_user_lookup(self):
+        response, queries = self.user_queries("/api/tasks/stats/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(queries), 1)
+
+        response, queries = self.user_queries("/api/tasks/stats/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(queries, [])
+
+    def test_deactivated_user_is_rejected(self):
+        self.client.get("/api/tasks/")
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get("/api/tasks/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_tampered_token_with_cached_jti_is_rejected(self):
+        self.client.get("/api/tasks/")
+        header, payload, signature = self.token.split(".")
+        forged = f"{header}.{payload}.{signature[::-1]}"
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {forged}")
+        response = self.client.get("/api/tasks/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(AUTH_TOKEN_CACHE_SIZE=1)
+    def test_cache_is_bounded(self):
+        other = User.objects.create_user(username="other", password="x")
+        other_token = str(RefreshToken.for_user(other).access_token)
+        self.client.get("/api/tasks/")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {other_token}")
+        self.client.get("/api/tasks/")
+        self.assertEqual(len(token_cache), 1)
+
+
+class AsyncTaskViewTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass"
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.token = str(refresh.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+
+    def test_list_matches_sync_view(self):
+        create_tasks_for_test(self.user, 7)
+        for query in ("", "?page=2", "?ordering=-due_date&status=pending"):
+            response = self.client.get(f"/api/async/tasks/{query}")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            expected = self.client.get(f"/api/tasks/{query}").json()
+            for key in ("count", "results"):
+                self.assertEqual(response.json()[key], expected[key])
+        self.assertEqual(
+            response.json()["next"],
+            "http://testserver/api/async/tasks/"
+            "?ordering=-due_date&page=2&status=pending",
+        )
+
+    def test_list_rejects_invalid_filter_and_page(self):
+        response = self.client.get("/api/async/tasks/?status=unknown")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("status", response.json())
+        response = self.client.get("/api/async/tasks/?page=9")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_retrieve_matches_sync_view(self):
+        create_tasks_for_test(self.user, 1)
+        task = Task.objects.get()
+        response = self.client.get(f"/api/async/tasks/{task.id}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(), self.client.get(f"/api/tasks/{task.id}/").json()
+        )
+        response = self.client.get(f"/api/async/tasks/{task.id + 1}/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_create_task(self):
+        data = {
+            "title": "Async Task",
+            "due_date": "2025-12-31",
+            "assigned_to": self.user.id,
+        }
+        response = self.client.post("/api/async/tasks/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        task = Task.objects.get()
+        self.assertEqual(response.json()["id"], task.id)
+        self.assertEqual(response.json()["assigned_to_username"], "testuser")
+        self.assertEqual(response.json()["status"], "pending")
+
+    def test_create_rejects_unknown_assignee(self):
+        data = {
+            "title": "Async Task",
+            "due_date": "2025-12-31",
+            "assigned_to": self.user.id + 1,
+        }
+        response = self.client.post("/api/async/tasks/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("assigned_to", response.json())
+        self.assertFalse(Task.objects.exists())
+
+    def test_requires_valid_token(self):
+        self.client.credentials()
+        response = self.client.get("/api/async/tasks/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn("WWW-Authenticate", response)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer invalid_token")
+        response = self.client.get("/api/async/tasks/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_served_by_async_client(self):
+        response = await self.async_client.get(
+            "/api/async/tasks/",
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 0)
+
+    async def test_throttle_runs_off_the_event_loop(self):
+        loop_thread = threading.current_thread()
+        threads = []
+        original = AtomicUserRateThrottle.allow_request
+
+        def allow_request(throttle, request, view):
+            threads.append(threading.current_thread())
+            return original(throttle, request, view)
+
+        with mock.patch.object(
+            AtomicUserRateThrottle, "allow_request", allow_request
+        ):
+            response = await self.async_client.get(
+                "/api/async/tasks/",
+                headers={"Authorization": f"Bearer {self.token}"},
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], loop_thread)
+
+
+class RequestMetricsTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        registry.reset()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass"
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.token = str(refresh.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+        create_tasks_for_test(self.user, 2)
+
+    def server_timing(self, response):
+        return {
+            entry.split(";")[0]: entry
+            for entry in response["Server-Timing"].split(", ")
+        }
+
+    def test_server_timing_header(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/tasks/")
+        timing = self.server_timing(response)
+        self.assertEqual(set(timing), {"total", "db", "auth", "serialize"})
+        self.assertIn(
+            f'desc="{len(ctx.captured_queries)} queries"', timing["db"]
+        )
+
+    async def test_server_timing_on_async_view(self):
+        response = await self.async_client.get(
+            "/api/async/tasks/",
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn(
+            'desc="0 queries"', self.server_timing(response)["db"]
+        )
+
+    def test_metrics_endpoint_requires_staff(self):
+        response = self.client.get("/api/metrics/")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_metrics_endpoint_reports_routes(self):
+        self.client.get("/api/tasks/")
+        self.client.get("/api/tasks/")
+        staff = User.objects.create_user(
+            username="staff", password="x", is_staff=True
+        )
+        token = RefreshToken.for_user(staff).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        response = self.client.get("/api/metrics/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        stats = response.data["GET task-list"]
+        self.assertEqual(stats["count"], 2)
+        self.assertGreater(stats["avg_queries"], 0)
+        self.assertEqual(sum(stats["histogram_ms"].values()), 2)
+        self.assertIn("serialize", stats["avg_timings_ms"])
+
+        response = self.client.delete("/api/metrics/")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertNotIn("GET task-list", registry.snapshot())
+
+    @override_settings(REQUEST_METRICS_SLOW_MS=0)
+    def test_slow_requests_are_logged(self):
+        with self.assertLogs("task_manager.requests", "WARNING") as logs:
+            self.client.get("/api/tasks/")
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record["route"], "task-list")
+        self.assertEqual(record["status"], 200)
+        self.assertTrue(record["slow"])
+        self.assertGreater(record["queries"], 0)
+
+    @override_settings(
+        REQUEST_METRICS_SLOW_MS=60000, REQUEST_METRICS_SAMPLE_RATE=0
+    )
+    def test_fast_requests_are_sampled(self):
+        with self.assertNoLogs("task_manager.requests"):
+            self.client.get("/api/tasks/")
+        with override_settings(REQUEST_METRICS_SAMPLE_RATE=1):
+            with self.assertLogs("task_manager.requests", "INFO") as logs:
+                self.client.get("/api/tasks/")
+        self.assertFalse(json.loads(logs.records[0].getMessage())["slow"])
+
+
+class TaskCursorPaginationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass"
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.token = str(refresh.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+
+    def collect_pages(self, url):
+        ids, pages = [], 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            ids.extend(task["id"] for task in response.data["results"])
+            url = response.data["next"]
+            pages += 1
+        return ids, pages
+
+    def test_walks_every_task_once_in_created_order(self):
+        create_tasks_for_test(self.user, 12)
+        ids, pages = self.collect_pages("/api/tasks/?pagination=cursor")
+        expected = list(
+            Task.objects.order_by("created_at", "id").values_list(
+                "id", flat=True
+            )
+        )
+        self.assertEqual(ids, expected)
+        self.assertEqual(pages, 3)
+
+    def test_ties_on_ordering_key_are_broken_by_id(self):
+        create_tasks_for_test(self.user, 7)
+        Task.objects.update(due_date="2025-06-01")
+        Task.objects.filter(id__in=Task.objects.values("id")[:2]).update(
+            due_date="2025-01-01"
+        )
+        ids, _ = self.collect_pages(
+            "/api/tasks/?pagination=cursor&ordering=-due_date&page_size=2"
+        )
+        expected = list(
+            Task.objects.order_by("-due_date", "-id").values_list(
+                "id", flat=True
+            )
+        )
+        self.assertEqual(ids, expected)
+
+    def test_previous_link_returns_preceding_page(self):
+        create_tasks_for_test(self.user, 10)
+        first = self.client.get("/api/tasks/?pagination=cursor")
+        self.assertIsNone(first.data["previous"])
+        second = self.client.get(first.data["next"])
+        back = self.client.get(second.data["previous"])
+        self.assertEqual(back.data["results"], first.data["results"])
+
+    def test_page_size_is_capped(self):
+        create_tasks_for_test(self.user, 8)
+        with self.settings(TASKS_MAX_PAGE_SIZE=6):
+            response = self.client.get(
+                "/api/tasks/?pagination=cursor&page_size=50"
+            )
+        self.assertEqual(len(response.data["results"]), 6)
+
+    def test_filters_apply_in_cursor_mode(self):
+        create_tasks_for_test(self.user, 4)
+        Task.objects.filter(id=Task.objects.first().id).update(
+            status="completed"
+        )
+        response = self.client.get(
+            "/api/tasks/?pagination=cursor&status=completed"
+        )
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_no_count_or_offset_query(self):
+        create_tasks_for_test(self.user, 10)
+        first = self.client.get("/api/tasks/?pagination=cursor")
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(first.data["next"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        sql = " ".join(q["sql"] for q in ctx.captured_queries)
+        self.assertNotIn("COUNT(", sql)
+        self.assertNotIn("OFFSET", sql)
+
+    def test_invalid_cursor(self):
+        # Decodes to "p=garbage": a position that is not a (key, id) pair
+        response = self.client.get("/api/tasks/?cursor=cD1nYXJiYWdl")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_number_pagination_remains_default(self):
+        create_tasks_for_test(self.user, 6)
+        response = self.client.get("/api/tasks/")
+        self.assertEqual(response.data["count"], 6)
+
+
+class TaskSearchTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass"
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}"
+        )
+        self.fix = Task.objects.create(
+            title="Fix login bug",
+            description="Users cannot sign in.",
+            due_date="2025-03-01",
+            assigned_to=self.user,
+        )
+        self.docs = Task.objects.create(
+            title="Write docs",
+            description="Document the login flow.",
+            due_date="2025-02-01",
+            assigned_to=self.user,
+        )
+        Task.objects.bulk_create(
+            [
+                Task(
+                    title="Deploy release",
+                    description="Ship the fixed build.",
+                    due_date="2025-01-01",
+                    assigned_to=self.user,
+                )
+            ]
+        )
+
+    def search(self, query, path="/api/tasks/"):
+        response = self.client.get(path, {"search": query})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [task["title"] for task in response.json()["results"]]
+
+    def test_ranks_title_matches_first(self):
+        self.assertEqual(self.search("login"), ["Fix login bug", "Write docs"])
+        self.assertEqual(self.search("LOGIN flow"), ["Write docs"])
+
+    def test_matches_word_stems(self):
+        self.assertEqual(
+            self.search("fixing"), ["Fix login bug", "Deploy release"]
+        )
+
+    def test_explicit_ordering_overrides_rank(self):
+        response = self.client.get(
+            "/api/tasks/", {"search": "login", "ordering": "due_date"}
+        )
+        titles = [task["title"] for task in response.json()["results"]]
+        self.assertEqual(titles, ["Write docs", "Fix login bug"])
+
+    def test_index_follows_updates_and_deletes(self):
+        self.docs.title = "Write guide"
+        self.docs.description = "Explain the setup."
+        self.docs.save()
+        self.fix.delete()
+        Task.objects.filter(title="Deploy release").update(title="Login page")
+        self.assertEqual(self.search("login"), ["Login page"])
+        self.assertEqual(self.search("guide"), ["Write guide"])
+
+    def test_query_syntax_is_not_interpreted(self):
+        self.assertEqual(self.search('login" OR *'), [])
+        self.assertEqual(len(self.search('"(*')), 3)
+
+    def test_async_list_searches(self):
+        self.assertEqual(
+            self.search("login", path="/api/async/tasks/"),
+            ["Fix login bug", "Write docs"],
+        )
+
+
+class TaskAssigneeTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass"
+        )
+        self.other = User.objects.create_user(
+            username="other", password="testpass"
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}"
+        )
+        create_tasks_for_test(self.user, 3)
+        create_tasks_for_test(self.other, 2)
+        Task.objects.filter(title="Task 0", assigned_to=self.user).update(
+            status="completed"
+        )
+
+    def titles(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [task["title"] for task in response.json()["results"]]
+
+    def test_assigned_to_filter(self):
+        response = self.client.get(
+            "/api/tasks/", {"assigned_to": self.other.id}
+        )
+        self.assertEqual(self.titles(response), ["Task 0", "Task 1"])
+        response = self.client.get("/api/tasks/", {"assigned_to": 0})
+        self.assertEqual(self.titles(response), [])
+        response = self.client.get("/api/tasks/", {"assigned_to": "x"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_mine(self):
+        response = self.client.get("/api/tasks/mine/")
+        self.assertEqual(self.titles(response), ["Task 0", "Task 1", "Task 2"])
+        self.assertEqual(
+            response.json()["counts"],
+            {"total": 3, "pending": 2, "in_progress": 0, "completed": 1},
+        )
+        response = self.client.get(
+            "/api/tasks/mine/", {"status": "pending", "fields": "title"}
+        )
+        self.assertEqual(
+            response.json()["results"],
+            [{"title": "Task 1"}, {"title": "Task 2"}],
+        )
+        self.assertEqual(response.json()["counts"]["total"], 3)
+
+    def test_user_tasks(self):
+        url = f"/api/users/{self.other.id}/tasks/"
+        response = self.client.get(url, {"pagination": "cursor"})
+        self.assertEqual(self.titles(response), ["Task 0", "Task 1"])
+        self.assertEqual(response.json()["counts"]["pending"], 2)
+
+        nobody = User.objects.create_user(username="nobody", password="x")
+        response = self.client.get(f"/api/users/{nobody.id}/tasks/")
+        self.assertEqual(self.titles(response), [])
+        response = self.client.get("/api/users/999999/tasks/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_unchanged_listing_costs_two_queries(self):
+        url = "/api/tasks/mine/"
+        etag = self.client.get(url)["ETag"]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(len(queries), 2)
+
+        task = Task.objects.filter(assigned_to=self.user).last()
+        self.client.patch(f"/api/tasks/{task.id}/", {"status": "in_progress"})
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["counts"]["in_progress"], 1)
+
+    def test_listing_validated_by_etag_only(self):
+        url = f"/api/users/{self.other.id}/tasks/"
+        response = self.client.get(url)
+        self.assertNotIn("Last-Modified", response)
+        since = http_date(time.time())
+        Task.objects.filter(assigned_to=self.other).first().delete()
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=since)
+        self.assertEqual(self.titles(response), ["Task 1"])
+
+        etag = response["ETag"]
+        Task.objects.filter(assigned_to=self.other).update(
+            assigned_to=self.user
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(self.titles(response), [])
+
+    def test_unknown_user_is_404_before_conditional_check(self):
+        nobody = User.objects.create_user(username="nobody", password="x")
+        url = f"/api/users/{nobody.id}/tasks/"
+        etag = self.client.get(url)["ETag"]
+        nobody.delete()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TaskAgendaTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass"
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.token = str(refresh.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+        # Mon 2025-03-03 .. Tue 2025-04-01
+        for title, due_date, task_status in [
+            ("Review", "2025-03-04", "pending"),
+            ("Plan", "2025-03-03", "completed"),
+            ("Ship", "2025-03-04", "in_progress"),
+            ("Retro", "2025-03-12", "pending"),
+            ("Close", "2025-04-01", "pending"),
+        ]:
+            Task.objects.create(
+                title=title,
+                due_date=date.fromisoformat(due_date),
+                status=task_status,
+                assigned_to=self.user,
+            )
+
+    def agenda(self, **params):
+        response = self.client.get("/api/tasks/agenda/", params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = json.loads(b"".join(response.streaming_content))
+        return data, {
+            bucket["date"]: [task["title"] for task in bucket["tasks"]]
+            for bucket in data["buckets"]
+        }
+
+    def test_groups_by_day_in_due_date_order(self):
+        data, buckets = self.agenda(
+            **{"from": "2025-03-03", "to": "2025-03-31"}
+        )
+        self.assertEqual(
+            (data["from"], data["to"], data["bucket"]),
+            ("2025-03-03", "2025-03-31", "day"),
+        )
+        self.assertEqual(
+            [*buckets.items()],
+            [
+                ("2025-03-03", ["Plan"]),
+                ("2025-03-04", ["Review", "Ship"]),
+                ("2025-03-12", ["Retro"]),
+            ],
+        )
+        task = data["buckets"][0]["tasks"][0]
+        self.assertEqual(task["assigned_to_username"], "testuser")
+
+    def test_week_and_month_buckets(self):
+        params = {"from": "2025-03-01", "to": "2025-04-30"}
+        _, buckets = self.agenda(bucket="week", **params)
+        self.assertEqual(
+            [*buckets],
+            ["2025-03-03", "2025-03-10", "2025-03-31"],
+        )
+        _, buckets = self.agenda(bucket="month", **params)
+        self.assertEqual(
+            buckets,
+            {
+                "2025-03-01": ["Plan", "Review", "Ship", "Retro"],
+                "2025-04-01": ["Close"],
+            },
+        )
+
+    def test_filters_and_empty_range(self):
+        _, buckets = self.agenda(
+            **{"from": "2025-03-01", "to": "2025-03-31", "status": "pending"}
+        )
+        self.assertEqual(
+            buckets, {"2025-03-04": ["Review"], "2025-03-12": ["Retro"]}
+        )
+        data, _ = self.agenda(**{"from": "2026-01-01", "to": "2026-01-02"})
+        self.assertEqual(data["buckets"], [])
+
+    async def test_streams_asynchronously_under_asgi(self):
+        params = {"from": "2025-03-03", "to": "2025-03-31", "bucket": "week"}
+        with self.settings(TASKS_EXPORT_CHUNK_SIZE=1):
+            response = await self.async_client.get(
+                "/api/tasks/agenda/",
+                params,
+                headers={"Authorization": f"Bearer {self.token}"},
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.is_async)
+        body = b"".join([chunk async for chunk in response.streaming_content])
+        expected, _ = await sync_to_async(self.agenda)(**params)
+        self.assertEqual(json.loads(body), expected)
+
+    def test_invalid_range(self):
+        for params, field in [
+            ({"from": "March"}, "from"),
+            ({"from": "2025-03-02", "to": "2025-03-01"}, "to"),
+            ({"from": "2025-01-01", "to": "2027-01-01"}, "to"),
+            ({"bucket": "year"}, "bucket"),
+        ]:
+            response = self.client.get("/api/tasks/agenda/", params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn(field, response.json())
+
+    def test_due_date_range_and_overdue_filters(self):
+        response = self.client.get(
+            "/api/tasks/",
+            {"due_date__gte": "2025-03-04", "due_date__lte": "2025-03-12"},
+        )
+        titles = [task["title"] for task in response.json()["results"]]
+        self.assertEqual(titles, ["Review", "Ship", "Retro"])
+
+        response = self.client.get("/api/tasks/", {"overdue": "true"})
+        titles = [task["title"] for task in response.json()["results"]]
+        self.assertEqual(titles, ["Review", "Ship", "Retro", "Close"])
+        response = self.client.get("/api/tasks/", {"overdue": "false"})
+        titles = [task["title"] for task in response.json()["results"]]
+        self.assertEqual(titles, ["Plan"])
+
+        response = self.client.get(
+            "/api/async/tasks/", {"due_date__gte": "2025-03-12"}
+        )
+        titles = [task["title"] for task in response.json()["results"]]
+        self.assertEqual(titles, ["Retro", "Close"])
+
+    def test_invalid_filter_values(self):
+        for url in ["/api/tasks/", "/api/async/tasks/"]:
+            for params, field in [
+                ({"overdue": "maybe"}, "overdue"),
+                ({"due_date__gte": "March"}, "due_date__gte"),
+            ]:
+                response = self.client.get(url, params)
+                self.assertEqual(
+                    response.status_code, status.HTTP_400_BAD_REQUEST
+                )
+                self.assertIn(field, response.json())
+
+
+class JobQueueTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass", email="t@example.com"
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}"
+        )
+        self.worker = Worker(threading.Event())
+
+    def create_task(self, title):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/api/tasks/",
+                {
+                    "title": title,
+                    "due_date": "2025-12-31",
+                    "assigned_to": self.user.id,
+                },
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.json()["id"]
+
+    def test_writes_queue_jobs_on_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.client.post(
+                "/api/tasks/",
+                {
+                    "title": "Queued",
+                    "due_date": "2025-12-31",
+                    "assigned_to": self.user.id,
+                },
+            )
+        self.assertFalse(Job.objects.exists())
+        for callback in callbacks:
+            callback()
+        self.assertEqual(
+            sorted(Job.objects.values_list("kind", flat=True)),
+            ["notify", "recalculate_stats"],
+        )
+
+        task_id = Job.objects.get(kind="notify").payload["task_id"]
+        Job.objects.all().delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(
+                f"/api/tasks/{task_id}/", {"status": "completed"}
+            )
+            self.client.delete(f"/api/tasks/{task_id}/")
+        self.assertEqual(
+            sorted(Job.objects.values_list("kind", flat=True)),
+            ["purge_tombstones", "recalculate_stats", "recalculate_stats"],
+        )
+
+    def test_reassignment_jobs_do_not_depend_on_receiver_order(self):
+        other = User.objects.create_user(username="other", password="x")
+        task_id = self.create_task("Reassigned")
+        Job.objects.all().delete()
+        # Run the event publisher before the job receiver.
+        post_save.disconnect(signals.queue_saved_jobs, sender=Task)
+        post_save.connect(signals.queue_saved_jobs, sender=Task)
+        # Moving publish_saved to the end restores the original order.
+        self.addCleanup(post_save.connect, signals.publish_saved, sender=Task)
+        self.addCleanup(post_save.disconnect, signals.publish_saved, Task)
+
+        task = Task.objects.get(pk=task_id)
+        task.assigned_to = other
+        with self.captureOnCommitCallbacks(execute=True):
+            task.save()
+        self.assertEqual(
+            sorted(Job.objects.values_list("kind", flat=True)),
+            ["notify", "recalculate_stats"],
+        )
+        self.assertEqual(task.previous_assignee_id, self.user.id)
+
+        # A second save with the same assignee is not a reassignment.
+        Job.objects.all().delete()
+        task.title = "Renamed"
+        with self.captureOnCommitCallbacks(execute=True):
+            task.save()
+        self.assertEqual(
+            [*Job.objects.values_list("kind", flat=True)],
+            ["recalculate_stats"],
+        )
+
+    def test_worker_runs_similar_jobs_as_one_batch(self):
+        self.create_task("Write docs")
+        self.create_task("Fix bug")
+        self.assertEqual(self.worker.run_once(), 4)
+        self.assertFalse(Job.objects.exists())
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, "2 tasks assigned to you")
+        self.assertEqual(mail.outbox[0].to, ["t@example.com"])
+        # The stats were cached for the next request.
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get("/api/tasks/stats/")
+        self.assertEqual(len(queries), 0)
+
+    def test_failed_jobs_back_off_then_give_up(self):
+        failing = mock.Mock(side_effect=RuntimeError("boom"))
+        with mock.patch.dict(HANDLERS, {"flaky": (failing, False)}):
+            job = Job.objects.create(kind="flaky", payload={"n": 1})
+            self.worker.run_once()
+            job.refresh_from_db()
+            self.assertEqual((job.state, job.attempts), (Job.QUEUED, 1))
+            self.assertIn("RuntimeError: boom", job.last_error)
+            self.assertGreater(job.run_after, timezone.now())
+            self.assertEqual(self.worker.run_once(), 0)
+
+            Job.objects.filter(pk=job.pk).update(
+                run_after=timezone.now(),
+                attempts=settings.JOBS_MAX_ATTEMPTS - 1,
+            )
+            self.worker.run_once()
+            job.refresh_from_db()
+            self.assertEqual(job.state, Job.FAILED)
+        failing.assert_called_with({"n": 1})
+
+        Job.objects.create(kind="unknown")
+        self.worker.run_once()
+        self.assertEqual(Job.objects.filter(state=Job.FAILED).count(), 2)
+
+    def test_claimed_jobs_are_not_handed_out_twice(self):
+        Job.objects.create(kind="purge_tombstones")
+        other = Worker(threading.Event())
+        self.assertEqual(len(self.worker.claim()), 1)
+        self.assertEqual(other.claim(), [])
+        # An expired lease frees the job for another worker.
+        Job.objects.update(locked_until=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(len(other.claim()), 1)
+
+    def test_purge_tombstones(self):
+        old = TaskTombstone.objects.create(task_id=1)
+        TaskTombstone.objects.filter(pk=old.pk).update(
+            deleted_at=timezone.now() - timedelta(days=31)
+        )
+        recent = TaskTombstone.objects.create(task_id=2)
+        Job.objects.create(kind="purge_tombstones")
+        self.worker.run_once()
+        self.assertEqual([*TaskTombstone.objects.all()], [recent])
+
+    @override_settings(JOBS_EAGER=True)
+    def test_eager_mode_runs_jobs_in_the_request(self):
+        self.create_task("Eager")
+        self.assertFalse(Job.objects.exists())
+        self.assertEqual(mail.outbox[0].subject, "Task assigned to you: Eager")
+
+
+class FixtureLoadTests(TestCase):
+    def test_fixture_loads_twice(self):
+        # setup_db.sh loads it on every container start.
+        fixture = settings.BASE_DIR / "fixtures" / "db_fixture.json"
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("loaddata", fixture, verbosity=0)
+            call_command("loaddata", fixture, verbosity=0)
+        self.assertTrue(Task.objects.exists())
+        self.assertFalse(Job.objects.exists())
+
+
+class RunWorkerCommandTests(TransactionTestCase):
+    def test_runs_queue_until_empty(self):
+        for _ in range(3):
+            Job.objects.create(kind="purge_tombstones")
+        out = io.StringIO()
+        call_command("run_worker", "--once", "--threads", "2", stdout=out)
+        self.assertFalse(Job.objects.exists())
+        self.assertIn("Ran 3 jobs, 0 failed", out.getvalue())
+
+
+class OverdueSweepTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass"
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}"
+        )
+        self.today = timezone.localdate()
+
+    def add(self, status, days, **fields):
+        return Task.objects.create(
+            title=f"{status} {days}",
+            due_date=self.today + timedelta(days=days),
+            status=status,
+            assigned_to=self.user,
+            **fields,
+        )
+
+    def test_save_maintains_flag(self):
+        task = self.add("pending", -1)
+        self.assertTrue(task.is_overdue)
+        task.status = "completed"
+        task.save(update_fields=["status"])
+        task.refresh_from_db()
+        self.assertFalse(task.is_overdue)
+        task.status = "in_progress"
+        task.due_date = self.today
+        task.save()
+        task.refresh_from_db()
+        self.assertFalse(task.is_overdue)
+
+    def test_bulk_writes_maintain_flag(self):
+        response = self.client.post(
+            "/api/tasks/bulk/",
+            [
+                {
+                    "title": "Late",
+                    "due_date": str(self.today - timedelta(days=1)),
+                    "assigned_to": self.user.id,
+                }
+            ],
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        task = Task.objects.get()
+        self.assertTrue(task.is_overdue)
+        response = self.client.patch(
+            "/api/tasks/bulk/",
+            [{"id": task.id, "status": "completed"}],
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        task.refresh_from_db()
+        self.assertFalse(task.is_overdue)
+
+    def test_sweep_flags_and_clears_in_batches(self):
+        late = [self.add("pending", -days) for days in range(1, 6)]
+        self.add("completed", -1)
+        self.add("pending", 3)
+        # Made stale the way the passing of a day (or a raw UPDATE) does.
+        Task.objects.filter(id__in=[task.id for task in late]).update(
+            is_overdue=False
+        )
+        rescheduled = self.add("pending", -1)
+        Task.objects.filter(id=rescheduled.id).update(
+            due_date=self.today + timedelta(days=1)
+        )
+
+        out = io.StringIO()
+        call_command(
+            "sweep_overdue", "--batch-size", "2", "-v", "2", stdout=out
+        )
+        self.assertEqual(
+            set(
+                Task.objects.filter(is_overdue=True).values_list(
+                    "id", flat=True
+                )
+            ),
+            {task.id for task in late},
+        )
+        self.assertIn("Batch 1:", out.getvalue())
+        self.assertIn(
+            "Flagged 5 overdue tasks and cleared 1 in 4 batches",
+            out.getvalue(),
+        )
+        sweep = self.client.get("/api/tasks/stats/").json()["overdue_sweep"]
+        self.assertEqual(
+            {key: sweep[key] for key in ("batches", "flagged", "cleared")},
+            {"batches": 4, "flagged": 5, "cleared": 1},
+        )
+        self.assertIsNotNone(sweep["finished_at"])
+
+        out = io.StringIO()
+        call_command("sweep_overdue", stdout=out)
+        self.assertIn("Flagged 0 overdue tasks and cleared 0", out.getvalue())
+
+    def test_sweep_invalidates_cached_responses(self):
+        task = self.add("pending", -1)
+        Task.objects.filter(id=task.id).update(is_overdue=False)
+        response = self.client.get("/api/tasks/stats/")
+        self.assertEqual(response.json()["overall"]["overdue"], 0)
+        call_command("sweep_overdue", stdout=io.StringIO())
+        response = self.client.get("/api/tasks/stats/")
+        self.assertEqual(response.json()["overall"]["overdue"], 1)
+
+    def test_sweep_changes_assignee_listing_etags(self):
+        late = [self.add("pending", -days) for days in (1, 2)]
+        Task.objects.filter(id__in=[task.id for task in late]).update(
+            is_overdue=False
+        )
+        for url in (
+            "/api/tasks/mine/",
+            f"/api/users/{self.user.id}/tasks/",
+        ):
+            with self.subTest(url=url):
+                response = self.client.get(url, {"overdue": "true"})
+                self.assertEqual(response.json()["count"], 0)
+                etag = response["ETag"]
+                call_command("sweep_overdue", stdout=io.StringIO())
+                response = self.client.get(
+                    url, {"overdue": "true"}, HTTP_IF_NONE_MATCH=etag
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.json()["count"], 2)
+                Task.objects.update(is_overdue=False)
+
+    def test_overdue_filter_is_equality_lookup(self):
+        self.add("pending", -1)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/tasks/", {"overdue": "true"})
+        self.assertEqual(response.json()["count"], 1)
+        sql = queries.captured_queries[-1]["sql"]
+        self.assertIn('"is_overdue"', sql)
+        self.assertNotIn('"due_date" <', sql)
+
+    def test_rejects_invalid_options(self):
+        with self.assertRaises(CommandError):
+            call_command("sweep_overdue", "--batch-size", "0")
+
+
+class TaskFieldsTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass"
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}"
+        )
+        create_tasks_for_test(self.user, 3)
+        self.task = Task.objects.first()
+
+    def test_read_serializer_matches_task_serializer(self):
+        tasks = Task.objects.select_related("assigned_to")
+        self.assertEqual(
+            TaskReadSerializer(tasks, many=True).data,
+            TaskSerializer(tasks, many=True).data,
+        )
+        response = self.client.get(f"/api/tasks/{self.task.id}/")
+        self.assertEqual(response.json(), TaskSerializer(self.task).data)
+
+    def test_fields_and_exclude(self):
+        response = self.client.get("/api/tasks/", {"fields": "id, title"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["results"][0],
+            {"id": self.task.id, "title": "Task 0"},
+        )
+        response = self.client.get(
+            f"/api/tasks/{self.task.id}/",
+            {"exclude": "description,assigned_to_username"},
+        )
+        self.assertEqual(
+            [*response.json()],
+            [
+                "id",
+                "assigned_to",
+                "title",
+                "due_date",
+                "status",
+                "created_at",
+                "updated_at",
+            ],
+        )
+
+    def test_unselected_columns_are_not_read(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/tasks/", {"fields": "id,status"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        select = queries.captured_queries[-1]["sql"]
+        self.assertNotIn("description", select)
+        self.assertNotIn("JOIN", select)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(
+                "/api/tasks/", {"fields": "title,assigned_to_username"}
+            )
+        select = queries.captured_queries[-1]["sql"]
+        self.assertNotIn("description", select)
+        self.assertIn("JOIN", select)
+
+    def test_detail_etag_depends_on_fields(self):
+        url = f"/api/tasks/{self.task.id}/"
+        full = self.client.get(url)["ETag"]
+        narrowed = self.client.get(url, {"fields": "id"})["ETag"]
+        self.assertNotEqual(full, narrowed)
+        response = self.client.get(
+            url, {"fields": "id"}, HTTP_IF_NONE_MATCH=narrowed
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_unknown_field(self):
+        response = self.client.get("/api/tasks/", {"fields": "id,secret"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json(), {"fields": ["Unknown field(s): secret."]}
+        )
+        response = self.client.get(
+            f"/api/tasks/{self.task.id}/", {"exclude": "nope"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@override_settings(TASKS_CHANGES_SETTLE_SECONDS=0, TASKS_CHANGES_PAGE_SIZE=3)
+class TaskChangesTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass"
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}"
+        )
+
+    def changes(self, since=None):
+        params = {"since": since} if since else {}
+        response = self.client.get("/api/tasks/changes/", params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def test_initial_sync_pages_through_every_task(self):
+        create_tasks_for_test(self.user, 5)
+        TaskTombstone.objects.create(task_id=999)
+        first = self.changes()
+        self.assertTrue(first["has_more"])
+        self.assertEqual(first["deleted"], [])
+        second = self.changes(first["cursor"])
+        self.assertFalse(second["has_more"])
+        titles = [task["title"] for task in first["changed"]]
+        titles += [task["title"] for task in second["changed"]]
+        self.assertEqual(titles, [f"Task {i}" for i in range(5)])
+        self.assertEqual(
+            second["changed"][0],
+            self.client.get(
+                f"/api/tasks/{second['changed'][0]['id']}/"
+            ).json(),
+        )
+
+    def test_reports_only_changes_after_cursor(self):
+        create_tasks_for_test(self.user, 3)
+        cursor = self.changes()["cursor"]
+        self.assertEqual(self.changes(cursor)["changed"], [])
+
+        task = Task.objects.get(title="Task 1")
+        self.client.patch(f"/api/tasks/{task.id}/", {"status": "completed"})
+        deleted = Task.objects.get(title="Task 2")
+        self.client.delete(f"/api/tasks/{deleted.id}/")
+        self.client.delete(
+            "/api/tasks/bulk/",
+            [Task.objects.get(title="Task 0").id],
+            format="json",
+        )
+
+        changes = self.changes(cursor)
+        self.assertEqual(
+            [(t["id"], t["status"]) for t in changes["changed"]],
+            [(task.id, "completed")],
+        )
+        self.assertEqual(len(changes["deleted"]), 2)
+        self.assertIn(deleted.id, changes["deleted"])
+        self.assertEqual(self.changes(changes["cursor"])["changed"], [])
+
+    def test_recent_writes_wait_to_settle(self):
+        create_tasks_for_test(self.user, 1)
+        with override_settings(TASKS_CHANGES_SETTLE_SECONDS=60):
+            changes = self.changes()
+        self.assertEqual(changes["changed"], [])
+        # The cursor stops before the unsettled write, which comes later.
+        self.assertEqual(len(self.changes(changes["cursor"])["changed"]), 1)
+
+    def test_invalid_and_expired_cursors(self):
+        response = self.client.get("/api/tasks/changes/", {"since": "x!"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("since", response.json())
+
+        cursor = self.changes()["cursor"]
+        with mock.patch(
+            "django.utils.timezone.now",
+            return_value=timezone.now() + timedelta(days=31),
+        ):
+            response = self.client.get(
+                "/api/tasks/changes/", {"since": cursor}
+            )
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+
+class TaskEventTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass"
+        )
+        self.other = User.objects.create_user(
+            username="otheruser", password="testpass"
+        )
+        self.token = str(RefreshToken.for_user(self.user).access_token)
+        self.broker = InProcessBroker()
+        patcher = mock.patch(
+            "tasks.events.get_broker", return_value=self.broker
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def publish_calls(self, write):
+        with (
+            mock.patch.object(
+                self.broker, "has_subscribers", return_value=True
+            ),
+            mock.patch.object(self.broker, "publish") as publish,
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                write()
+        return [
+            (user_ids, message.split("\n")[0])
+            for (user_ids, message), _ in publish.call_args_list
+        ]
+
+    def test_writes_publish_events_to_assignees(self):
+        task = Task.objects.create(
+            title="Task",
+            due_date="2025-12-31",
+            assigned_to=self.user,
+        )
+        task = Task.objects.get(pk=task.pk)
+        task.assigned_to = self.other
+
+        self.assertEqual(
+            self.publish_calls(task.save),
+            [
+                ([self.other.id], "event: updated"),
+                ([self.user.id], "event: unassigned"),
+            ],
+        )
+        self.assertEqual(
+            self.publish_calls(task.delete),
+            [([self.other.id], "event: deleted")],
+        )
+
+    def test_bulk_writes_publish_events(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+        data = [
+            {
+                "title": "A",
+                "due_date": "2025-12-31",
+                "assigned_to": self.user.id,
+            }
+        ]
+        calls = self.publish_calls(
+            lambda: self.client.post("/api/tasks/bulk/", data, format="json")
+        )
+        self.assertEqual(calls, [([self.user.id], "event: created")])
+
+    def test_nothing_is_serialized_without_subscribers(self):
+        with mock.patch("tasks.events.TaskSerializer") as serializer:
+            Task.objects.create(
+                title="Task", due_date="2025-12-31", assigned_to=self.user
+            )
+        serializer.assert_not_called()
+
+    def test_stream_requires_asgi(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+        response = self.client.get("/api/events/")
+        self.assertEqual(
+            response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+
+    async def ticket(self):
+        response = await self.async_client.post(
+            "/api/events/ticket/",
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()["expires_in"], 30)
+        return response.json()["ticket"]
+
+    async def test_ticket_is_stored_off_the_event_loop(self):
+        loop_thread = threading.current_thread()
+        threads = []
+        backend = caches["default"]
+        original = backend.set
+
+        def set(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return original(*args, **kwargs)
+
+        with mock.patch.object(backend, "set", set):
+            await self.ticket()
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], loop_thread)
+
+    async def test_stream_delivers_events_with_ticket(self):
+        response = await self.async_client.get(
+            "/api/events/", {"ticket": await self.ticket()}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), b"retry: 5000\n\n")
+
+        self.assertTrue(self.broker.has_subscribers([self.user.id]))
+        self.assertFalse(self.broker.has_subscribers([self.other.id]))
+        self.broker.publish([self.user.id], "event: updated\ndata: {}\n\n")
+        self.assertEqual(await anext(stream), b"event: updated\ndata: {}\n\n")
+
+        # A client disconnect cancels the task reading the stream.
+        pending = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        pending.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await pending
+        self.assertFalse(self.broker.has_subscribers([self.user.id]))
+
+    async def test_stream_rejects_query_token_and_reused_ticket(self):
+        response = await self.async_client.get(
+            "/api/events/", {"token": self.token}
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        response = await self.async_client.get(
+            "/api/events/", {"ticket": "invalid"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        ticket = await self.ticket()
+        response = await self.async_client.get(
+            "/api/events/", {"ticket": ticket}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        await response.streaming_content.aclose()
+        response = await self.async_client.get(
+            "/api/events/", {"ticket": ticket}
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_ticket_requires_authentication(self):
+        response = await self.async_client.post("/api/events/ticket/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(TASK_EVENTS_QUEUE_SIZE=2)
+    async def test_slow_consumer_is_cut_off(self):
+        response = await self.async_client.get(
+            "/api/events/", headers={"Authorization": f"Bearer {self.token}"}
+        )
+        stream = aiter(response.streaming_content)
+        await anext(stream)
+        for i in range(3):
+            self.broker.publish(
+                [self.user.id], f"event: updated\ndata: {i}\n\n"
+            )
+        self.assertEqual(await anext(stream), b"event: overflow\ndata: {}\n\n")
+        with self.assertRaises(StopAsyncIteration):
+            await anext(stream)
+        self.assertFalse(self.broker.has_subscribers([self.user.id]))
+
+
+class TaskIndexTests(APITestCase):
+    """
+    The planner should pick the composite indexes for the hot query shapes.
+    Runs against whichever backend the suite is configured with (SQLite by
+    default, PostgreSQL when DATABASES points there).
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass"
+        )
+        create_tasks_for_test(self.user, 20)
+        if connection.vendor == "postgresql":
+            # Tiny test tables make a sequential scan look cheapest; force
+            # the planner to show which index it would use at scale.
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                cursor.execute("ANALYZE tasks_task")
+        elif connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE tasks_task")
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan)
+
+    def test_status_filter_with_default_ordering(self):
+        self.assertUsesIndex(
+            Task.objects.filter(status="completed").order_by("created_at"),
+            "task_status_created_idx",
+        )
+
+    def test_due_date_ordering(self):
+        self.assertUsesIndex(
+            Task.objects.order_by("due_date", "id")[:5],
+            "task_due_date_id_idx",
+        )
+
+    def test_assignee_status_due_date_filter(self):
+        self.assertUsesIndex(
+            Task.objects.filter(
+                assigned_to=self.user,
+                status="pending",
+                due_date__lte="2025-12-31",
+            ),
+            "task_assignee_status_due_idx",
+        )
+
+
+class TaskBulkTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass"
+        )
+        self.other = User.objects.create_user(
+            username="other", password="testpass"
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.token = str(refresh.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+
+    def task_data(self, i, user):
+        return {
+            "title": f"Bulk {i}",
+            "description": "",
+            "due_date": "2025-12-31",
+            "status": "pending",
+            "assigned_to": user.id,
+        }
+
+    def test_bulk_create(self):
+        data = [
+            self.task_data(i, self.user if i % 2 else self.other)
+            for i in range(50)
+        ]
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(
+                "/api/tasks/bulk/", data, format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 50)
+        self.assertEqual(Task.objects.count(), 50)
+        self.assertEqual(response.data[0]["assigned_to_username"], "other")
+        self.assertTrue(all(task["id"] for task in response.data))
+        inserts = [q for q in ctx.captured_queries if "INSERT" in q["sql"]]
+        self.assertEqual(len(inserts), 1)
+        # Assignees are resolved in one query, not one per item
+        self.assertLess(len(ctx.captured_queries), 10)
+
+    def test_bulk_create_reports_errors_per_item(self):
+        data = [
+            self.task_data(0, self.user),
+            {**self.task_data(1, self.user), "status": "unknown"},
+            {**self.task_data(2, self.user), "assigned_to": 999},
+        ]
+        response = self.client.post("/api/tasks/bulk/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn("status", response.data[1])
+        self.assertIn("assigned_to", response.data[2])
+        self.assertEqual(Task.objects.count(), 0)
+
+    def test_bulk_create_rejects_oversized_batch(self):
+        data = [self.task_data(i, self.user) for i in range(3)]
+        with self.settings(TASKS_BULK_MAX_ITEMS=2):
+            response = self.client.post(
+                "/api/tasks/bulk/", data, format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Task.objects.count(), 0)
+
+    def test_bulk_update(self):
+        create_tasks_for_test(self.user, 3)
+        tasks = list(Task.objects.order_by("id"))
+        before = tasks[0].updated_at
+        data = [
+            {"id": tasks[0].id, "status": "completed"},
+            {"id": tasks[1].id, "assigned_to": self.other.id},
+        ]
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.patch(
+                "/api/tasks/bulk/", data, format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["status"], "completed")
+        self.assertEqual(response.data[1]["assigned_to_username"], "other")
+        tasks[0].refresh_from_db()
+        tasks[1].refresh_from_db()
+        tasks[2].refresh_from_db()
+        self.assertEqual(tasks[0].status, "completed")
+        self.assertGreater(tasks[0].updated_at, before)
+        self.assertEqual(tasks[1].assigned_to, self.other)
+        self.assertEqual(tasks[2].status, "pending")
+        updates = [q for q in ctx.captured_queries if "UPDATE" in q["sql"]]
+        self.assertEqual(len(updates), 1)
+
+    def test_bulk_update_rejects_oversized_batch_before_locking(self):
+        create_tasks_for_test(self.user, 3)
+        data = [{"id": task.id} for task in Task.objects.all()]
+        with (
+            self.settings(TASKS_BULK_MAX_ITEMS=2),
+            CaptureQueriesContext(connection) as ctx,
+        ):
+            response = self.client.patch(
+                "/api/tasks/bulk/", data, format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(
+            [q for q in ctx.captured_queries if "tasks_task" in q["sql"]]
+        )
+
+    def test_bulk_update_unknown_id(self):
+        create_tasks_for_test(self.user, 1)
+        task = Task.objects.get()
+        data = [
+            {"id": task.id, "status": "completed"},
+            {"id": 999, "status": "completed"},
+            {"status": "completed"},
+        ]
+        response = self.client.patch("/api/tasks/bulk/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn("id", response.data[1])
+        self.assertIn("id", response.data[2])
+        task.refresh_from_db()
+        self.assertEqual(task.status, "pending")
+
+    def test_bulk_update_duplicate_id(self):
+        create_tasks_for_test(self.user, 1)
+        task = Task.objects.get()
+        data = [
+            {"id": task.id, "status": "completed"},
+            {"id": task.id, "status": "in_progress"},
+        ]
+        response = self.client.patch("/api/tasks/bulk/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data,
+            [{}, {"id": ["Duplicate task id in this batch."]}],
+        )
+        task.refresh_from_db()
+        self.assertEqual(task.status, "pending")
+
+    def test_bulk_delete(self):
+        create_tasks_for_test(self.user, 4)
+        ids = list(Task.objects.values_list("id", flat=True)[:3])
+        response = self.client.delete("/api/tasks/bulk/", ids, format="json")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(Task.objects.count(), 1)
+
+    def test_bulk_delete_unknown_id(self):
+        create_tasks_for_test(self.user, 2)
+        ids = list(Task.objects.values_list("id", flat=True)) + [999]
+        response = self.client.delete("/api/tasks/bulk/", ids, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, [{}, {}, {"id": ["Task not found."]}])
+        self.assertEqual(Task.objects.count(), 2)
+
+    def test_batch_counts_as_one_throttle_hit(self):
+        data = [self.task_data(i, self.user) for i in range(100)]
+        for _ in range(20):
+            response = self.client.post(
+                "/api/tasks/bulk/", data[:5], format="json"
+            )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response = self.client.post("/api/tasks/bulk/", data, format="json")
+        self.assertEqual(
+            response.status_code, status.HTTP_429_TOO_MANY_REQUESTS
+        )
+
+
+class TaskExportTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass"
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.token = str(refresh.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+
+    def export(self, query=""):
+        response = self.client.get(f"/api/tasks/export/{query}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return response, b"".join(response.streaming_content).decode()
+
+    def test_export_ndjson_matches_serializer_output(self):
+        create_tasks_for_test(self.user, 3)
+        response, body = self.export()
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(len(rows), 3)
+        detail = self.client.get(f"/api/tasks/{rows[0]['id']}/").json()
+        self.assertEqual(rows[0], detail)
+
+    def test_export_csv(self):
+        create_tasks_for_test(self.user, 2)
+        response, body = self.export("?export_format=csv")
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual([row["title"] for row in rows], ["Task 0", "Task 1"])
+        self.assertEqual(rows[0]["assigned_to_username"], "testuser")
+
+    def test_export_applies_filters(self):
+        create_tasks_for_test(self.user, 4)
+        Task.objects.filter(title="Task 2").update(status="completed")
+        _, body = self.export("?status=completed")
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([row["title"] for row in rows], ["Task 2"])
+
+    def test_export_reads_in_chunks(self):
+        create_tasks_for_test(self.user, 7)
+        with (
+            self.settings(TASKS_EXPORT_CHUNK_SIZE=3),
+            mock.patch(
+                "django.db.models.query.QuerySet.iterator",
+                autospec=True,
+                side_effect=lambda qs, chunk_size=None: iter(qs),
+            ) as iterator,
+        ):
+            _, body = self.export()
+        self.assertEqual(len(body.splitlines()), 7)
+        self.assertEqual(iterator.call_args.kwargs["chunk_size"], 3)
+
+    async def test_export_streams_asynchronously_under_asgi(self):
+        await Task.objects.acreate(
+            title="Task", due_date="2025-12-31", assigned_to=self.user
+        )
+        with self.settings(TASKS_EXPORT_CHUNK_SIZE=1):
+            for query, lines in (("", 1), ("?export_format=csv", 2)):
+                response = await self.async_client.get(
+                    f"/api/tasks/export/{query}",
+                    headers={"Authorization": f"Bearer {self.token}"},
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertTrue(response.is_async)
+                body = b"".join(
+                    [chunk async for chunk in response.streaming_content]
+                )
+                self.assertEqual(len(body.decode().splitlines()), lines)
+
+    def test_export_rejects_unknown_format(self):
+        response = self.client.get("/api/tasks/export/?export_format=xml")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ImportTasksCommandTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass"
+        )
+        self.other = User.objects.create_user(
+            username="other", password="testpass"
+        )
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def write(self, name, content):
+        path = Path(self.tmpdir.name) / name
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    def ndjson(self, rows):
+        return "".join(json.dumps(row) + "\n" for row in rows)
+
+    def row(self, i, username="testuser", **extra):
+        return {
+            "title": f"Imported {i}",
+            "due_date": "2025-12-31",
+            "assigned_to": username,
+            **extra,
+        }
+
+    def run_import(self, *args):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        call_command("import_tasks", *args, stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_import_ndjson_in_batches(self):
+        rows = [
+            self.row(i, "other" if i % 3 else "testuser") for i in range(10)
+        ]
+        path = self.write("tasks.ndjson", self.ndjson(rows))
+        with CaptureQueriesContext(connection) as ctx:
+            stdout, stderr = self.run_import(path, "--batch-size", "4")
+        self.assertEqual(Task.objects.count(), 10)
+        self.assertEqual(
+            Task.objects.filter(assigned_to=self.other).count(), 6
+        )
+        self.assertIn("Imported 10 tasks", stdout)
+        self.assertIn("rows/s", stdout)
+        self.assertEqual(stderr, "")
+        inserts = [
+            q
+            for q in ctx.captured_queries
+            if q["sql"].startswith('INSERT INTO "tasks_task"')
+        ]
+        self.assertEqual(len(inserts), 3)
+        user_lookups = [
+            q
+            for q in ctx.captured_queries
+            if q["sql"].startswith("SELECT") and '"auth_user"' in q["sql"]
+        ]
+        # Both usernames are resolved by the first batch and then cached
+        self.assertEqual(len(user_lookups), 1)
+
+    def test_import_csv_round_trips_export_columns(self):
+        path = self.write(
+            "tasks.csv",
+            "id,title,description,due_date,status,assigned_to,"
+            "assigned_to_username,created_at,updated_at\n"
+            "7,Exported,Body,2025-01-02,completed,1,other,"
+            "2025-01-01T00:00:00Z,2025-01-01T00:00:00Z\n",
+        )
+        self.run_import(path)
+        task = Task.objects.get()
+        self.assertEqual(task.title, "Exported")
+        self.assertEqual(task.status, "completed")
+        self.assertEqual(task.assigned_to, self.other)
+
+    def test_invalid_rows_are_reported_and_skipped(self):
+        rows = [
+            self.row(0),
+            self.row(1, status="archived"),
+            self.row(2, title="x" * 256),
+            self.row(3, username="nobody"),
+        ]
+        path = self.write("tasks.ndjson", self.ndjson(rows) + "{broken\n")
+        stdout, stderr = self.run_import(path)
+        self.assertEqual(Task.objects.count(), 1)
+        self.assertIn("skipped 4 invalid rows", stdout)
+        self.assertIn("Row 2: status", stderr)
+        self.assertIn("Row 3: title", stderr)
+        self.assertIn("Row 4: assigned_to", stderr)
+        self.assertIn("Row 5: Invalid JSON", stderr)
+
+    def test_unknown_usernames_are_looked_up_once(self):
+        rows = [self.row(i, username="nobody") for i in range(6)]
+        path = self.write("tasks.ndjson", self.ndjson(rows))
+        with CaptureQueriesContext(connection) as ctx:
+            stdout, stderr = self.run_import(path, "--batch-size", "2")
+        self.assertIn("skipped 6 invalid rows", stdout)
+        self.assertEqual(stderr.count("Unknown user 'nobody'"), 6)
+        user_lookups = [
+            q
+            for q in ctx.captured_queries
+            if q["sql"].startswith("SELECT") and '"auth_user"' in q["sql"]
+        ]
+        self.assertEqual(len(user_lookups), 1)
+
+    def test_resume_continues_after_last_committed_batch(self):
+        rows = [self.row(i) for i in range(6)]
+        path = self.write("tasks.ndjson", self.ndjson(rows))
+        original = Task.objects.bulk_create
+        calls = []
+
+        def fail_on_second_batch(tasks, *args, **kwargs):
+            calls.append(len(tasks))
+            if len(calls) == 2:
+                raise RuntimeError("connection lost")
+            return original(tasks, *args, **kwargs)
+
+        with mock.patch.object(
+            Task.objects, "bulk_create", side_effect=fail_on_second_batch
+        ):
+            with self.assertRaises(RuntimeError):
+                self.run_import(path, "--batch-size", "2")
+        self.assertEqual(Task.objects.count(), 2)
+        self.assertEqual(ImportCheckpoint.objects.get().position, 2)
+
+        stdout, _ = self.run_import(path, "--batch-size", "2", "--resume")
+        self.assertIn("Resuming", stdout)
+        self.assertEqual(
+            list(Task.objects.order_by("id").values_list("title", flat=True)),
+            [f"Imported {i}" for i in range(6)],
+        )
+        self.assertEqual(ImportCheckpoint.objects.get().position, 6)
+
+    def test_unknown_format(self):
+        path = self.write("tasks.txt", "")
+        with self.assertRaises(CommandError):
+            self.run_import(path)
+
+
+class TaskStatsTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass"
+        )
+        self.other = User.objects.create_user(
+            username="other", password="testpass"
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.token = str(refresh.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+        self.today = date(2025, 6, 15)
+        patcher = mock.patch(
+            "tasks.views.timezone.localdate", return_value=self.today
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def add(self, user, status_, days_from_today):
+        return Task.objects.create(
+            title="Task",
+            due_date=self.today + timedelta(days=days_from_today),
+            status=status_,
+            assigned_to=user,
+        )
+
+    def test_counts_overall_and_per_assignee(self):
+        self.add(self.user, "pending", -1)  # overdue
+        self.add(self.user, "in_progress", 3)  # due soon
+        self.add(self.user, "completed", -5)  # done, not overdue
+        self.add(self.other, "pending", 30)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/tasks/stats/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        task_queries = [
+            q for q in ctx.captured_queries if '"tasks_task"' in q["sql"]
+        ]
+        self.assertEqual(len(task_queries), 1)
+
+        self.assertEqual(
+            response.data["overall"],
+            {
+                "total": 4,
+                "pending": 2,
+                "in_progress": 1,
+                "completed": 1,
+                "overdue": 1,
+                "due_soon": 1,
+            },
+        )
+        by_user = {
+            row["assigned_to_username"]: row
+            for row in response.data["by_assignee"]
+        }
+        self.assertEqual(by_user["testuser"]["total"], 3)
+        self.assertEqual(by_user["testuser"]["overdue"], 1)
+        self.assertEqual(by_user["other"]["pending"], 1)
+        self.assertEqual(by_user["other"]["due_soon"], 0)
+
+    def test_due_soon_window(self):
+        self.add(self.other, "pending", 30)
+        response = self.client.get("/api/tasks/stats/?due_soon_days=30")
+        self.assertEqual(response.data["overall"]["due_soon"], 1)
+        response = self.client.get("/api/tasks/stats/?due_soon_days=-1")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_repeated_polls_are_served_from_cache(self):
+        self.add(self.user, "pending", 1)
+        self.client.get("/api/tasks/stats/")
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/tasks/stats/")
+        self.assertEqual(response.data["overall"]["total"], 1)
+        self.assertFalse(
+            any('"tasks_task"' in q["sql"] for q in ctx.captured_queries)
+        )
+
+    def test_cache_invalidated_by_writes(self):
+        task = self.add(self.user, "pending", 1)
+        self.assertEqual(
+            self.client.get("/api/tasks/stats/").data["overall"]["pending"], 1
+        )
+        task.status = "completed"
+        task.save()
+        stats = self.client.get("/api/tasks/stats/").data["overall"]
+        self.assertEqual((stats["pending"], stats["completed"]), (0, 1))
+
+        task.delete()
+        stats = self.client.get("/api/tasks/stats/").data["overall"]
+        self.assertEqual(stats["total"], 0)
+
+    def test_cache_invalidated_by_bulk_writes(self):
+        self.assertEqual(
+            self.client.get("/api/tasks/stats/").data["overall"]["total"], 0
+        )
+        data = [
+            {
+                "title": f"Bulk {i}",
+                "due_date": "2025-07-01",
+                "assigned_to": self.user.id,
+            }
+            for i in range(3)
+        ]
+        self.client.post("/api/tasks/bulk/", data, format="json")
+        self.assertEqual(
+            self.client.get("/api/tasks/stats/").data["overall"]["total"], 3
+        )
+
+
+class TaskConditionalGetTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass"
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.token = str(refresh.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+        create_tasks_for_test(self.user, 7)
+
+    def test_retrieve_etag_and_not_modified(self):
+        task = Task.objects.first()
+        response = self.client.get(f"/api/tasks/{task.id}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+        self.assertTrue(etag.startswith('"'))
+        self.assertIn("Last-Modified", response)
+
+        response = self.client.get(
+            f"/api/tasks/{task.id}/", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+        task.title = "Changed"
+        task.save()
+        response = self.client.get(
+            f"/api/tasks/{task.id}/", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_retrieve_if_modified_since(self):
+        task = Task.objects.first()
+        response = self.client.get(f"/api/tasks/{task.id}/")
+        response = self.client.get(
+            f"/api/tasks/{task.id}/",
+            HTTP_IF_MODIFIED_SINCE=response["Last-Modified"],
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_list_not_modified_skips_page_query(self):
+        etag = self.client.get("/api/tasks/?page=2")["ETag"]
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(
+                "/api/tasks/?page=2", HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        task_queries = [
+            q for q in ctx.captured_queries if '"tasks_task"' in q["sql"]
+        ]
+        self.assertEqual(len(task_queries), 1)
+
+    def test_list_etag_varies_by_page_and_changes_on_writes(self):
+        first = self.client.get("/api/tasks/")["ETag"]
+        second = self.client.get("/api/tasks/?page=2")["ETag"]
+        self.assertNotEqual(first, second)
+
+        Task.objects.last().delete()
+        response = self.client.get("/api/tasks/", HTTP_IF_NONE_MATCH=first)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 6)
+
+        etag = response["ETag"]
+        task = Task.objects.first()
+        task.status = "completed"
+        task.save()
+        response = self.client.get("/api/tasks/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_has_no_last_modified(self):
+        # A date cannot tell that a task was deleted or left the filter.
+        for url in ["/api/tasks/", "/api/tasks/?pagination=cursor"]:
+            response = self.client.get(url)
+            self.assertNotIn("Last-Modified", response)
+            Task.objects.first().delete()
+            response = self.client.get(
+                url, HTTP_IF_MODIFIED_SINCE=http_date(time.time())
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_etag_changes_on_username_rename(self):
+        for url in ["/api/tasks/", "/api/tasks/?pagination=cursor"]:
+            etag = self.client.get(url)["ETag"]
+            self.user.username = f"renamed-{len(url)}"
+            self.user.save()
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(
+                response.data["results"][0]["assigned_to_username"],
+                self.user.username,
+            )
+        etag = self.client.get("/api/tasks/?fields=id")["ETag"]
+        self.user.username = "renamed"
+        self.user.save()
+        response = self.client.get(
+            "/api/tasks/?fields=id", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_list_reuses_aggregate_count(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/tasks/")
+        self.assertEqual(response.data["count"], 7)
+        task_queries = [
+            q for q in ctx.captured_queries if '"tasks_task"' in q["sql"]
+        ]
+        self.assertEqual(len(task_queries), 2)
+
+    def test_cursor_page_etag(self):
+        url = "/api/tasks/?pagination=cursor"
+        etag = self.client.get(url)["ETag"]
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        Task.objects.filter(id=Task.objects.first().id).update(
+            title="Changed", updated_at=timezone.now()
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(TASKS_RESPONSE_CACHE_TIMEOUT=60)
+    def test_server_side_cache(self):
+        self.client.get("/api/tasks/?status=pending")
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/tasks/?status=pending")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 7)
+        self.assertFalse(
+            any('"tasks_task"' in q["sql"] for q in ctx.captured_queries)
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(
+                "/api/tasks/?status=pending",
+                HTTP_IF_NONE_MATCH=response["ETag"],
+            )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertFalse(
+            any('"tasks_task"' in q["sql"] for q in ctx.captured_queries)
+        )
+
+        Task.objects.first().delete()
+        response = self.client.get("/api/tasks/?status=pending")
+        self.assertEqual(response.data["count"], 6)
+
+
+THROTTLE_WORKER = """
+import sys, time
+from types import SimpleNamespace
+
+import django
+
+django.setup()
+from task_manager.throttling import AtomicUserRateThrottle
+
+
+class Throttle(AtomicUserRateThrottle):
+    rate = "10/min"
+
+
+request = SimpleNamespace(user=SimpleNamespace(is_authenticated=True, pk=1))
+start_at = float(sys.argv[1])
+while time.time() < start_at:
+    time.sleep(0.001)
+print(sum(Throttle().allow_request(request, None) for _ in range(10)))
+"""
+
+
+class SharedThrottleTests(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def file_cache(self):
+        return LockingFileBasedCache(self.tmpdir.name, {})
+
+    def test_workers_share_one_limit(self):
+        env = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": "task_manager.settings",
+            "DJANGO_CACHE_BACKEND": "file",
+            "DJANGO_CACHE_LOCATION": self.tmpdir.name,
+            "PYTHONPATH": str(settings.BASE_DIR),
+        }
+        start_at = str(time.time() + 2)
+        workers = [
+            subprocess.Popen(
+                [sys.executable, "-c", THROTTLE_WORKER, start_at],
+                env=env,
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            for _ in range(4)
+        ]
+        allowed = [
+            int(worker.communicate(timeout=60)[0]) for worker in workers
+        ]
+        # 40 attempts across 4 processes against a single 10/min budget
+        self.assertEqual(sum(allowed), 10)
+
+    def test_file_cache_incr_is_atomic_and_keeps_expiry(self):
+        shared = self.file_cache()
+        shared.add("counter", 0, timeout=60)
+        expiry_before = self.expiry(shared, "counter")
+        self.assertEqual(shared.incr("counter"), 1)
+        self.assertEqual(shared.incr("counter", 5), 6)
+        self.assertEqual(shared.get("counter"), 6)
+        self.assertAlmostEqual(
+            self.expiry(shared, "counter"), expiry_before, places=3
+        )
+        with self.assertRaises(ValueError):
+            shared.incr("missing")
+
+    def test_file_cache_add_does_not_overwrite(self):
+        shared = self.file_cache()
+        self.assertTrue(shared.add("key", "first"))
+        self.assertFalse(shared.add("key", "second"))
+        self.assertEqual(shared.get("key"), "first")
+
+    def expiry(self, shared, key):
+        with open(shared._key_to_file(key), "rb") as f:
+            return pickle.load(f)
+
+    def test_rejected_requests_do_not_use_up_the_limit(self):
+        class Throttle(AtomicUserRateThrottle):
+            rate = "2/min"
+
+        cache.clear()
+        request = SimpleNamespace(
+            user=SimpleNamespace(is_authenticated=True, pk=42)
+        )
+        results = [Throttle().allow_request(request, None) for _ in range(4)]
+        self.assertEqual(results, [True, True, False, False])
+        throttle = Throttle()
+        self.assertFalse(throttle.allow_request(request, None))
+        self.assertGreater(throttle.wait(), 0)
+        self.assertLessEqual(throttle.wait(), 60)
+        key = f"{throttle.key}:{int(throttle.now // 60)}"
+        self.assertEqual(cache.get(key), 2)
+
+
+class WarmUpTests(TestCase):
+    def test_warm_up_loads_schema(self):
+        get_schema.cache_clear()
+        warm_up()
+        self.assertEqual(get_schema.cache_info().currsize, 1)
+
+
+class DatabaseSettingsTests(TestCase):
+    def conn_max_age(self, **environ):
+        env = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": "task_manager.settings",
+            "DJANGO_DB_CONN_MAX_AGE": "60",
+            "PYTHONPATH": str(settings.BASE_DIR),
+        }
+        env.pop("SERVER_INTERFACE", None)
+        env.update(environ)
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "from django.conf import settings; "
+                "print(settings.DATABASES['default']['CONN_MAX_AGE'])",
+            ],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        return int(output)
+
+    def test_persistent_connections_disabled_under_asgi(self):
+        self.assertEqual(self.conn_max_age(), 60)
+        self.assertEqual(self.conn_max_age(SERVER_INTERFACE="asgi"), 0)
+
+
+class SecretKeySettingsTests(TestCase):
+    def load_settings(self, **environ):
+        env = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": "task_manager.settings",
+            "PYTHONPATH": str(settings.BASE_DIR),
+        }
+        env.pop("DJANGO_SECRET_KEY", None)
+        env.update(environ)
+        return subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "from django.conf import settings; print(settings.SECRET_KEY)",
+            ],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+
+    def test_development_key_requires_debug(self):
+        result = self.load_settings(DJANGO_DEBUG="0")
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn("Set DJANGO_SECRET_KEY", result.stderr)
+
+        result = self.load_settings(DJANGO_DEBUG="0", DJANGO_SECRET_KEY="k")
+        self.assertEqual(result.stdout.strip(), "k")
+        result = self.load_settings(DJANGO_DEBUG="1")
+        self.assertTrue(result.stdout.startswith("django-insecure-"))
@@ -1,5 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+from . import async_views
 from .views import TaskViewSet
 
 router = DefaultRouter()
@@ -7,4 +8,21 @@ router.register(r"tasks", TaskViewSet)
 
 urlpatterns = [
     path("", include(router.urls)),
+    path("async/tasks/", async_views.task_list, name="async-task-list"),
+    path(
+        "async/tasks/<int:pk>/",
+        async_views.task_detail,
+        name="async-task-detail",
+    ),
+    path(
+        "users/<int:user_pk>/tasks/",
+        TaskViewSet.as_view({"get": "user_tasks"}),
+        name="user-tasks",
+    ),
+    path("events/", async_views.task_events, name="task-events"),
+    path(
+        "events/ticket/",
+        async_views.task_events_ticket,
+        name="task-events-ticket",
+    ),
 ]
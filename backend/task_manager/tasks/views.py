@@ -1,23 +1,216 @@
-from rest_framework.throttling import UserRateThrottle, AnonRateThrottle
-from rest_framework import viewsets, filters
+import csv
+import json
+from datetime import timedelta
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Count, DateField, F, Max
+from django.db.models.functions import Trunc
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework import viewsets, filters, status
+from rest_framework import serializers
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from task_manager.authentication import CachedJWTAuthentication
+from users.cache import get_directory_version
+from task_manager.throttling import (
+    AtomicAnonRateThrottle,
+    AtomicUserRateThrottle,
+)
+from . import events, jobs
+from .cache import invalidate_task_caches
+from .changes import get_changes
+from .filters import TaskFilter
+from .conditional import (
+    make_etag,
+    not_modified,
+    response_cache_key,
+    set_validator_headers,
+    validators,
+)
 from .models import Task
-from .serializers import TaskSerializer
+from .overdue import last_sweep
+from .pagination import TaskCursorPagination, TaskPageNumberPagination
+from .search import TaskSearchFilter
+from .serializers import TASK_FIELDS, TaskReadSerializer, TaskSerializer
+from .stats import get_assignee_counts, get_task_stats
+
+EXPORT_FIELDS = [
+    "id",
+    "title",
+    "description",
+    "due_date",
+    "status",
+    "assigned_to",
+    "assigned_to_username",
+    "created_at",
+    "updated_at",
+]
+
+EXPORT_CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+AGENDA_BUCKETS = ["day", "week", "month"]
+
+# Columns always loaded for reads, whatever ?fields= selects: pagination
+# positions and validators are computed from them.
+READ_KEY_FIELDS = {"id", "due_date", "created_at", "updated_at"}
+
+FIELD_PARAMETERS = [
+    openapi.Parameter(
+        "fields",
+        openapi.IN_QUERY,
+        description=(
+            "Comma-separated fields to return (default: all). Fields left "
+            "out are not read from the database."
+        ),
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "exclude",
+        openapi.IN_QUERY,
+        description="Comma-separated fields to leave out.",
+        type=openapi.TYPE_STRING,
+    ),
+]
+
+LIST_PARAMETERS = [
+    openapi.Parameter(
+        "status",
+        openapi.IN_QUERY,
+        description="Filter tasks by status (e.g., pending, completed).",
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "due_date",
+        openapi.IN_QUERY,
+        description="Filter tasks by due date (YYYY-MM-DD).",
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "due_date__gte",
+        openapi.IN_QUERY,
+        description="Tasks due on or after this date (YYYY-MM-DD).",
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "due_date__lte",
+        openapi.IN_QUERY,
+        description="Tasks due on or before this date (YYYY-MM-DD).",
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "overdue",
+        openapi.IN_QUERY,
+        description=(
+            "true: only open tasks whose due date has passed; false: all "
+            "other tasks."
+        ),
+        type=openapi.TYPE_BOOLEAN,
+    ),
+    openapi.Parameter(
+        "search",
+        openapi.IN_QUERY,
+        description=(
+            "Full-text search: tasks whose title or description contain "
+            "every word, best matches first unless 'ordering' is given."
+        ),
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "pagination",
+        openapi.IN_QUERY,
+        description=(
+            "Set to 'cursor' for keyset pagination: no total count, "
+            "constant cost per page, and next/previous cursor links. Pages "
+            "are ordered by created_at (or 'ordering'), so 'search' results "
+            "are not ranked by relevance."
+        ),
+        type=openapi.TYPE_STRING,
+        enum=["cursor"],
+    ),
+    openapi.Parameter(
+        "page_size",
+        openapi.IN_QUERY,
+        description=(
+            "Rows per page in cursor mode, capped at TASKS_MAX_PAGE_SIZE."
+        ),
+        type=openapi.TYPE_INTEGER,
+    ),
+    *FIELD_PARAMETERS,
+]
+
+ASSIGNED_TO_PARAMETER = openapi.Parameter(
+    "assigned_to",
+    openapi.IN_QUERY,
+    description="Only tasks assigned to this user id.",
+    type=openapi.TYPE_INTEGER,
+)
 
 
 class TaskViewSet(viewsets.ModelViewSet):
-    queryset = Task.objects.all().order_by("created_at")
+    queryset = (
+        Task.objects.select_related("assigned_to")
+        .only(
+            "id",
+            "title",
+            "description",
+            "due_date",
+            "status",
+            "created_at",
+            "updated_at",
+            "assigned_to__username",
+        )
+        .order_by("created_at")
+    )
     serializer_class = TaskSerializer
-    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
-    filterset_fields = ["status", "due_date"]
+    pagination_class = TaskPageNumberPagination
+    filter_backends = [
+        DjangoFilterBackend,
+        TaskSearchFilter,
+        filters.OrderingFilter,
+    ]
+    filterset_class = TaskFilter
     ordering_fields = ["due_date"]
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAuthenticated]
-    throttle_classes = [UserRateThrottle, AnonRateThrottle]
+    throttle_classes = [AtomicUserRateThrottle, AtomicAnonRateThrottle]
+    # Actions answered with TaskReadSerializer, honouring ?fields=.
+    read_actions = {"list", "retrieve", "mine", "user_tasks"}
+
+    @property
+    def paginator(self):
+        """
+        Use keyset pagination when the client opts in with
+        ``?pagination=cursor`` (or follows a ``cursor`` link), otherwise keep
+        the default page-number pagination.
+        """
+        if not hasattr(self, "_paginator"):
+            request = getattr(self, "request", None)
+            params = request.query_params if request is not None else {}
+            if (
+                params.get("pagination") == "cursor"
+                or TaskCursorPagination.cursor_query_param in params
+            ):
+                self._paginator = TaskCursorPagination()
+            else:
+                self._paginator = super().paginator
+        return self._paginator
 
     @swagger_auto_schema(
         operation_description=(
@@ -25,25 +218,34 @@ class TaskViewSet(viewsets.ModelViewSet):
             "due_date."
         ),
         responses={200: TaskSerializer(many=True)},
-        manual_parameters=[
-            openapi.Parameter(
-                "status",
-                openapi.IN_QUERY,
-                description=(
-                    "Filter tasks by status (e.g., pending, completed)."
-                ),
-                type=openapi.TYPE_STRING,
-            ),
-            openapi.Parameter(
-                "due_date",
-                openapi.IN_QUERY,
-                description="Filter tasks by due date (YYYY-MM-DD).",
-                type=openapi.TYPE_STRING,
-            ),
-        ],
+        manual_parameters=[ASSIGNED_TO_PARAMETER, *LIST_PARAMETERS],
     )
     def list(self, request, *args, **kwargs):
-        return super().list(request, *args, **kwargs)
+        return self.conditional_response(request, self.build_list)
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Tasks assigned to the authenticated user, filtered and paginated "
+            "like the task list, with per-status counts in 'counts'."
+        ),
+        responses={200: TaskSerializer(many=True)},
+        manual_parameters=LIST_PARAMETERS,
+    )
+    @action(detail=False, methods=["get"])
+    def mine(self, request):
+        return self.conditional_response(request, self.build_assignee_list)
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Tasks assigned to a user, filtered and paginated like the task "
+            "list, with per-status counts in 'counts'."
+        ),
+        responses={200: TaskSerializer(many=True)},
+        manual_parameters=LIST_PARAMETERS,
+    )
+    def user_tasks(self, request, user_pk):
+        """Served at /api/users/{user_pk}/tasks/ (see tasks.urls)."""
+        return self.conditional_response(request, self.build_assignee_list)
 
     @swagger_auto_schema(
         operation_description="Create a new task.",
@@ -55,9 +257,10 @@ class TaskViewSet(viewsets.ModelViewSet):
     @swagger_auto_schema(
         operation_description="Retrieve a specific task by ID.",
         responses={200: TaskSerializer()},
+        manual_parameters=FIELD_PARAMETERS,
     )
     def retrieve(self, request, *args, **kwargs):
-        return super().retrieve(request, *args, **kwargs)
+        return self.conditional_response(request, self.build_detail)
 
     @swagger_auto_schema(
         operation_description="Update an existing task by ID.",
@@ -72,3 +275,640 @@ class TaskViewSet(viewsets.ModelViewSet):
     )
     def destroy(self, request, *args, **kwargs):
         return super().destroy(request, *args, **kwargs)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        assignee = self.assignee_id()
+        if assignee is not None:
+            queryset = queryset.filter(assigned_to_id=assignee)
+        fields = self.requested_fields()
+        if fields is None:
+            return queryset
+        columns = READ_KEY_FIELDS | (fields - {"assigned_to_username"})
+        if "assigned_to_username" in fields:
+            return queryset.only(*columns, "assigned_to__username")
+        return queryset.select_related(None).only(*columns)
+
+    def get_serializer(self, *args, **kwargs):
+        if self.action in self.read_actions:
+            return TaskReadSerializer(
+                *args,
+                fields=self.requested_fields(),
+                context=self.get_serializer_context(),
+                **kwargs,
+            )
+        return super().get_serializer(*args, **kwargs)
+
+    def assignee_id(self):
+        """The user whose tasks a per-assignee listing shows, or ``None``."""
+        if self.action == "mine":
+            return self.request.user.pk
+        return self.kwargs.get("user_pk")
+
+    def requested_fields(self):
+        """
+        The set of fields selected by ``?fields=`` and ``?exclude=`` on
+        list and detail reads, or ``None`` for every field.
+        """
+        if not hasattr(self, "_requested_fields"):
+            self._requested_fields = None
+            if self.action in self.read_actions and self.request:
+                params = self.request.query_params
+                fields = _field_names(params, "fields") or set(TASK_FIELDS)
+                fields -= _field_names(params, "exclude")
+                if fields != set(TASK_FIELDS):
+                    self._requested_fields = fields
+        return self._requested_fields
+
+    def conditional_response(self, request, build):
+        """
+        Serve a read with its validators (``ETag``, plus ``Last-Modified``
+        on details), answering ``If-None-Match``/``If-Modified-Since`` with
+        304. When ``TASKS_RESPONSE_CACHE_TIMEOUT`` is set, the serialized
+        body and its validators are cached per user and query until a task
+        changes.
+        """
+        key = response_cache_key(request)
+        entry = cache.get(key) if key else None
+        if entry is None:
+            entry = build(request)
+            if not isinstance(entry, dict):
+                # build() already answered the conditional request
+                return entry
+            if key:
+                cache.set(key, entry, settings.TASKS_RESPONSE_CACHE_TIMEOUT)
+        return not_modified(request, entry) or set_validator_headers(
+            Response(entry["data"]), entry
+        )
+
+    def usernames_version(self):
+        """
+        The part of a list ETag that covers assignee usernames: the user
+        directory's version, bumped by username changes, unless the
+        response leaves them out.
+        """
+        fields = self.requested_fields()
+        if fields is None or "assigned_to_username" in fields:
+            return get_directory_version()
+        return None
+
+    def build_list(self, request):
+        queryset = self.filter_queryset(self.get_queryset())
+        entry, page = self.validated_page(request, queryset)
+        if page is None:
+            return entry
+        serializer = self.get_serializer(page, many=True)
+        entry["data"] = self.get_paginated_response(serializer.data).data
+        return entry
+
+    def validated_page(self, request, queryset, *parts):
+        """
+        Return ``(entry, page)``: the list validators, covering ``parts``
+        too, and the requested page of ``queryset``. When the request's
+        ETag still matches, ``page`` is ``None`` and ``entry`` is the 304
+        response.
+        """
+        # Lists are validated by ETag only: a Last-Modified date would not
+        # change when a task is deleted or drops out of the filter.
+        paginator = self.paginator
+
+        if isinstance(paginator, TaskPageNumberPagination):
+            # One aggregate yields both the validators and the row count the
+            # paginator needs, so unchanged lists cost a single query.
+            summary = queryset.aggregate(
+                last_modified=Max("updated_at"), count=Count("id")
+            )
+            entry = validators(
+                make_etag(
+                    request.get_full_path(),
+                    summary["last_modified"],
+                    summary["count"],
+                    self.usernames_version(),
+                    *parts,
+                ),
+                None,
+            )
+            response = not_modified(request, entry)
+            if response is not None:
+                return response, None
+            paginator.known_count = summary["count"]
+            page = self.paginate_queryset(queryset)
+        else:
+            # Keyset pages never count the table; validate the page itself.
+            page = self.paginate_queryset(queryset)
+            entry = validators(
+                make_etag(
+                    request.get_full_path(),
+                    [(task.pk, task.updated_at) for task in page],
+                    paginator.has_next,
+                    paginator.has_previous,
+                    self.usernames_version(),
+                    *parts,
+                ),
+                None,
+            )
+        return entry, page
+
+    def build_assignee_list(self, request):
+        """
+        One user's tasks, filtered and paginated like the task list, with
+        their per-status counts. An unchanged listing costs the counts
+        query and the list's own validator query.
+        """
+        user_id = self.assignee_id()
+        counts, last_modified = get_assignee_counts(user_id)
+        if not counts["total"]:
+            get_object_or_404(User.objects.only("id"), pk=user_id)
+        # The filtered list's validators alone would miss count changes
+        # outside the filter, and the counts alone miss rows entering or
+        # leaving it without being saved (the overdue sweep), so the ETag
+        # covers both.
+        entry, page = self.validated_page(
+            request,
+            self.filter_queryset(self.get_queryset()),
+            user_id,
+            counts,
+            last_modified,
+        )
+        if page is None:
+            return entry
+        serializer = self.get_serializer(page, many=True)
+        data = self.get_paginated_response(serializer.data).data
+        data["counts"] = counts
+        entry["data"] = data
+        return entry
+
+    def build_detail(self, request):
+        task = self.get_object()
+        fields = self.requested_fields()
+        if fields is None:
+            etag = make_etag(
+                task.pk, task.updated_at, task.assigned_to.username
+            )
+        else:
+            etag = make_etag(
+                task.pk,
+                task.updated_at,
+                (
+                    task.assigned_to.username
+                    if "assigned_to_username" in fields
+                    else None
+                ),
+                sorted(fields),
+            )
+        entry = validators(etag, task.updated_at)
+        response = not_modified(request, entry)
+        if response is not None:
+            return response
+        entry["data"] = self.get_serializer(task).data
+        return entry
+
+    def get_bulk_serializer(self, *args, **kwargs):
+        return self.get_serializer(
+            *args,
+            many=True,
+            max_length=settings.TASKS_BULK_MAX_ITEMS,
+            **kwargs,
+        )
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Create a batch of tasks in one transaction. Validation errors "
+            "are returned per item, in request order, and nothing is saved "
+            "unless every item is valid."
+        ),
+        request_body=TaskSerializer(many=True),
+        responses={201: TaskSerializer(many=True)},
+    )
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request):
+        serializer = self.get_bulk_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            serializer.save()
+            invalidate_task_caches()
+            # bulk_create() sends no post_save signals.
+            jobs.tasks_saved(serializer.instance, created=True)
+            for task in serializer.instance:
+                events.task_saved(task, created=True)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Partially update a batch of tasks in one transaction. Every item "
+            "must include the task `id`, each id at most once; errors are "
+            "returned per item."
+        ),
+        request_body=TaskSerializer(many=True),
+        responses={200: TaskSerializer(many=True)},
+    )
+    @bulk_create.mapping.patch
+    def bulk_update(self, request):
+        if not isinstance(request.data, list):
+            raise ValidationError({"non_field_errors": ["Expected a list."]})
+        # Before the ids are locked, so an oversized batch locks nothing.
+        _check_bulk_size(request.data)
+        ids = {
+            item["id"]
+            for item in request.data
+            if isinstance(item, dict) and _is_id(item.get("id"))
+        }
+        with transaction.atomic():
+            tasks = (
+                self.get_queryset()
+                .select_for_update(of=("self",))
+                .in_bulk(ids)
+            )
+            serializer = self.get_bulk_serializer(
+                tasks, data=request.data, partial=True
+            )
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+            invalidate_task_caches()
+            jobs.tasks_saved(serializer.instance, created=False)
+            for task in serializer.instance:
+                events.task_saved(task, created=False)
+        return Response(serializer.data)
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Delete a batch of tasks by id in one statement. Unknown ids are "
+            "reported per item and nothing is deleted."
+        ),
+        request_body=openapi.Schema(
+            type=openapi.TYPE_ARRAY, items=openapi.Schema(type="integer")
+        ),
+        responses={204: "Tasks deleted successfully."},
+    )
+    @bulk_create.mapping.delete
+    def bulk_destroy(self, request):
+        ids = request.data
+        if not isinstance(ids, list) or not ids:
+            raise ValidationError(
+                {"non_field_errors": ["Expected a non-empty list of ids."]}
+            )
+        _check_bulk_size(ids)
+        with transaction.atomic():
+            queryset = self.get_queryset().filter(
+                id__in=[i for i in ids if _is_id(i)]
+            )
+            found = set(queryset.values_list("id", flat=True))
+            errors = [
+                (
+                    {}
+                    if _is_id(i) and i in found
+                    else {"id": ["Task not found."]}
+                )
+                for i in ids
+            ]
+            if any(errors):
+                raise ValidationError(errors)
+            queryset.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Stream every task matching the status/due_date filters as NDJSON "
+            "(one object per line) or CSV. Rows are read from the database "
+            "in chunks, so memory use does not grow with the result size."
+        ),
+        manual_parameters=[
+            openapi.Parameter(
+                "export_format",
+                openapi.IN_QUERY,
+                description="Output format (default: ndjson).",
+                type=openapi.TYPE_STRING,
+                enum=[*EXPORT_CONTENT_TYPES],
+            ),
+            openapi.Parameter(
+                "status",
+                openapi.IN_QUERY,
+                description="Filter tasks by status.",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "due_date",
+                openapi.IN_QUERY,
+                description="Filter tasks by due date (YYYY-MM-DD).",
+                type=openapi.TYPE_STRING,
+            ),
+        ],
+        responses={200: "NDJSON or CSV stream of tasks."},
+    )
+    @action(detail=False, methods=["get"], pagination_class=None)
+    def export(self, request):
+        export_format = request.query_params.get("export_format", "ndjson")
+        if export_format not in EXPORT_CONTENT_TYPES:
+            raise ValidationError(
+                {
+                    "export_format": [
+                        "Expected one of: "
+                        + ", ".join(EXPORT_CONTENT_TYPES)
+                        + "."
+                    ]
+                }
+            )
+
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = (
+            queryset.order_by(*queryset.query.order_by, "id")
+            .annotate(assigned_to_username=F("assigned_to__username"))
+            .values_list(*EXPORT_FIELDS)
+        )
+        encoder = _CSVEncoder() if export_format == "csv" else _RowEncoder()
+
+        response = StreamingHttpResponse(
+            _stream_rows(request, rows, encoder),
+            content_type=EXPORT_CONTENT_TYPES[export_format],
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="tasks.{export_format}"'
+        )
+        return response
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Tasks due between 'from' and 'to' (inclusive) grouped by due "
+            "day, week or month, in due-date order, in one streamed "
+            "response. The list filters (status, assigned_to, overdue, "
+            "search) apply. Buckets without tasks are left out; a week "
+            "bucket is named after its Monday, a month after its first day."
+        ),
+        manual_parameters=[
+            openapi.Parameter(
+                "from",
+                openapi.IN_QUERY,
+                description="First due date (YYYY-MM-DD, default: today).",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "to",
+                openapi.IN_QUERY,
+                description=(
+                    "Last due date (YYYY-MM-DD, default: six days after "
+                    "'from'), at most TASKS_AGENDA_MAX_DAYS after 'from'."
+                ),
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "bucket",
+                openapi.IN_QUERY,
+                description="Grouping (default: day).",
+                type=openapi.TYPE_STRING,
+                enum=AGENDA_BUCKETS,
+            ),
+        ],
+        responses={200: "Tasks grouped by due date."},
+    )
+    @action(detail=False, methods=["get"], pagination_class=None)
+    def agenda(self, request):
+        start, end, bucket = _agenda_range(request.query_params)
+        queryset = self.filter_queryset(self.get_queryset())
+        # One range scan of the due-date index; the database names each
+        # row's bucket, and rows arrive grouped because they are sorted.
+        rows = (
+            queryset.filter(due_date__gte=start, due_date__lte=end)
+            .order_by("due_date", "id")
+            .annotate(
+                assigned_to_username=F("assigned_to__username"),
+                bucket=Trunc("due_date", bucket, output_field=DateField()),
+            )
+            .values_list(*EXPORT_FIELDS, "bucket")
+        )
+        header = {"from": start, "to": end, "bucket": bucket}
+        return StreamingHttpResponse(
+            _stream_rows(request, rows, _AgendaEncoder(header)),
+            content_type="application/json",
+        )
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Tasks created or updated, and ids of tasks deleted, after the "
+            "'since' cursor, oldest first, with the cursor for the next "
+            "call. Without 'since' every task is returned, page by page. "
+            "Keep calling while 'has_more' is true. Writes show up once "
+            "they are TASKS_CHANGES_SETTLE_SECONDS old; a cursor older "
+            "than the tombstone retention gets 410 and needs a full sync."
+        ),
+        manual_parameters=[
+            openapi.Parameter(
+                "since",
+                openapi.IN_QUERY,
+                description="Cursor returned by the previous call.",
+                type=openapi.TYPE_STRING,
+            ),
+        ],
+        responses={200: "Changed tasks, deleted ids and the next cursor."},
+    )
+    @action(detail=False, methods=["get"], pagination_class=None)
+    def changes(self, request):
+        changes = get_changes(request.query_params.get("since"), EXPORT_FIELDS)
+        changes["changed"] = [
+            _export_values(row) for row in changes["changed"]
+        ]
+        return Response(changes)
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Task counts per status plus overdue and due-soon counts, overall "
+            "and per assignee. Served from the cache until a task changes. "
+            "overdue_sweep reports the last run of the overdue sweeper."
+        ),
+        manual_parameters=[
+            openapi.Parameter(
+                "due_soon_days",
+                openapi.IN_QUERY,
+                description=(
+                    "Count open tasks due within this many days as due soon "
+                    "(default: TASKS_DUE_SOON_DAYS)."
+                ),
+                type=openapi.TYPE_INTEGER,
+            ),
+        ],
+        responses={200: "Task counters."},
+    )
+    @action(detail=False, methods=["get"], pagination_class=None)
+    def stats(self, request):
+        days = request.query_params.get(
+            "due_soon_days", settings.TASKS_DUE_SOON_DAYS
+        )
+        try:
+            days = int(days)
+        except (TypeError, ValueError):
+            days = -1
+        if not 0 <= days <= settings.TASKS_MAX_DUE_SOON_DAYS:
+            raise ValidationError(
+                {
+                    "due_soon_days": [
+                        "Expected an integer between 0 and "
+                        f"{settings.TASKS_MAX_DUE_SOON_DAYS}."
+                    ]
+                }
+            )
+        return Response(
+            {
+                **get_task_stats(timezone.localdate(), days),
+                "overdue_sweep": last_sweep(),
+            }
+        )
+
+
+class _Echo:
+    """File-like object whose ``write`` hands the line back to csv.writer."""
+
+    def write(self, value):
+        return value
+
+
+_datetime_field = serializers.DateTimeField()
+
+
+def _export_values(row):
+    values = dict(zip(EXPORT_FIELDS, row))
+    values["due_date"] = values["due_date"].isoformat()
+    for name in ("created_at", "updated_at"):
+        values[name] = _datetime_field.to_representation(values[name])
+    return values
+
+
+class _RowEncoder:
+    """
+    Turns streamed rows into response chunks: ``head()``, ``row(row)`` per
+    row, then ``tail()``. This one writes NDJSON.
+    """
+
+    def head(self):
+        return ""
+
+    def row(self, row):
+        return json.dumps(_export_values(row)) + "\n"
+
+    def tail(self):
+        return ""
+
+
+class _CSVEncoder(_RowEncoder):
+    def __init__(self):
+        self.writer = csv.writer(_Echo())
+
+    def head(self):
+        return self.writer.writerow(EXPORT_FIELDS)
+
+    def row(self, row):
+        return self.writer.writerow(_export_values(row).values())
+
+
+def _stream_rows(request, rows, encoder):
+    """
+    Encode the ``rows`` queryset with ``encoder``, reading it in
+    ``TASKS_EXPORT_CHUNK_SIZE`` chunks. Under ASGI the content is an async
+    iterator, since Django would read a sync one into a list before
+    sending the first byte. Each chunk is fetched in the sync thread, as
+    ``aiterator()`` does; that one is not used because it starts
+    ``values_list()`` queries on the event loop.
+    """
+    chunk_size = settings.TASKS_EXPORT_CHUNK_SIZE
+    iterator = rows.iterator(chunk_size=chunk_size)
+    if isinstance(request._request, ASGIRequest):
+        next_chunk = sync_to_async(lambda: [*islice(iterator, chunk_size)])
+
+        async def content():
+            yield encoder.head()
+            while chunk := await next_chunk():
+                for row in chunk:
+                    yield encoder.row(row)
+            yield encoder.tail()
+
+    else:
+
+        def content():
+            yield encoder.head()
+            for row in iterator:
+                yield encoder.row(row)
+            yield encoder.tail()
+
+    return content()
+
+
+def _agenda_range(params):
+    dates = {}
+    for name in ("from", "to"):
+        value = params.get(name)
+        dates[name] = parse_date(value) if value else None
+        if value and dates[name] is None:
+            raise ValidationError({name: ["Expected a date (YYYY-MM-DD)."]})
+    start = dates["from"] or timezone.localdate()
+    end = dates["to"] or start + timedelta(days=6)
+    if end < start:
+        raise ValidationError({"to": ["Must not be before 'from'."]})
+    if (end - start).days > settings.TASKS_AGENDA_MAX_DAYS:
+        raise ValidationError(
+            {
+                "to": [
+                    "At most "
+                    f"{settings.TASKS_AGENDA_MAX_DAYS} days after 'from'."
+                ]
+            }
+        )
+    bucket = params.get("bucket", "day")
+    if bucket not in AGENDA_BUCKETS:
+        raise ValidationError(
+            {"bucket": [f"Expected one of: {', '.join(AGENDA_BUCKETS)}."]}
+        )
+    return start.isoformat(), end.isoformat(), bucket
+
+
+class _AgendaEncoder(_RowEncoder):
+    """
+    Writes the agenda document piece by piece: ``header`` plus
+    ``buckets``, a list of ``{"date", "tasks"}`` built from rows sorted by
+    bucket.
+    """
+
+    def __init__(self, header):
+        self.header = header
+        self.current = None
+
+    def head(self):
+        return json.dumps(self.header)[:-1] + ', "buckets": ['
+
+    def row(self, row):
+        task = json.dumps(_export_values(row))
+        if row[-1] == self.current:
+            return f", {task}"
+        opening = "" if self.current is None else "]}, "
+        self.current = row[-1]
+        return f'{opening}{{"date": "{self.current}", "tasks": [{task}'
+
+    def tail(self):
+        return "]}" if self.current is None else "]}]}"
+
+
+def _field_names(params, name):
+    names = {
+        value.strip()
+        for value in params.get(name, "").split(",")
+        if value.strip()
+    }
+    unknown = names.difference(TASK_FIELDS)
+    if unknown:
+        raise ValidationError(
+            {name: [f"Unknown field(s): {', '.join(sorted(unknown))}."]}
+        )
+    return names
+
+
+def _check_bulk_size(items):
+    if len(items) > settings.TASKS_BULK_MAX_ITEMS:
+        raise ValidationError(
+            {
+                "non_field_errors": [
+                    "Ensure this field has no more than "
+                    f"{settings.TASKS_BULK_MAX_ITEMS} elements."
+                ]
+            }
+        )
+
+
+def _is_id(value):
+    return isinstance(value, int) and not isinstance(value, bool)
@@ -0,0 +1,49 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
+
+from tasks.cache import bump_version, get_version
+from tasks.conditional import make_etag
+
+DIRECTORY_VERSION_KEY = "users:directory:version"
+
+
+def get_directory_version():
+    return get_version(DIRECTORY_VERSION_KEY)
+
+
+def directory_etag(version):
+    """The directory's ETag, known from its version without loading it."""
+    return make_etag("users:directory", version)
+
+
+def get_directory(version):
+    """
+    Return the ``id``/``username`` list of every user, cached under
+    ``version`` for ``USERS_DIRECTORY_CACHE_TIMEOUT`` seconds.
+    """
+    key = f"users:directory:{version}"
+    data = cache.get(key)
+    if data is None:
+        data = [
+            {"id": pk, "username": username}
+            for pk, username in User.objects.order_by("username").values_list(
+                "id", "username"
+            )
+        ]
+        cache.set(key, data, settings.USERS_DIRECTORY_CACHE_TIMEOUT)
+    return data
+
+
+def bump_directory_version():
+    bump_version(DIRECTORY_VERSION_KEY)
+
+
+def invalidate_directory():
+    """
+    Invalidate the cached directory after a user write, now and again on
+    commit, like ``tasks.cache.invalidate_task_caches()``.
+    """
+    bump_directory_version()
+    transaction.on_commit(bump_directory_version)
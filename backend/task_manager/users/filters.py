@@ -0,0 +1,29 @@
+from rest_framework.filters import BaseFilterBackend
+
+
+def username_prefix(queryset, prefix):
+    """
+    Narrow a ``User`` queryset to usernames starting with ``prefix``
+    (case-sensitive, as usernames are).
+
+    The range condition lets the unique username index serve the lookup;
+    SQLite's ``LIKE`` is case-insensitive and cannot use it on its own.
+    """
+    if not prefix:
+        return queryset
+    return queryset.filter(
+        username__gte=prefix,
+        username__lt=prefix + "\U0010ffff",
+        username__startswith=prefix,
+    )
+
+
+class UsernamePrefixFilter(BaseFilterBackend):
+    """``?search=`` matching the start of usernames."""
+
+    search_param = "search"
+
+    def filter_queryset(self, request, queryset, view):
+        return username_prefix(
+            queryset, request.query_params.get(self.search_param, "")
+        )
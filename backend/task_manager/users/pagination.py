@@ -0,0 +1,16 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class UserCursorPagination(CursorPagination):
+    """
+    Keyset pagination in username order. Each page is a range scan of the
+    unique username index: no ``COUNT(*)`` and no ``OFFSET``.
+    """
+
+    ordering = "username"
+    page_size_query_param = "page_size"
+
+    def __init__(self):
+        self.page_size = settings.USERS_PAGE_SIZE
+        self.max_page_size = settings.USERS_MAX_PAGE_SIZE
@@ -0,0 +1,23 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from task_manager.authentication import invalidate_user
+from tasks.cache import invalidate_task_caches
+
+from .cache import invalidate_directory
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(
+    sender, instance, update_fields=None, created=False, **kwargs
+):
+    invalidate_user(instance.pk)
+    # The directory only lists ids and usernames, so saves of other fields
+    # alone (e.g. last_login at sign-in) keep it.
+    if update_fields is None or "username" in update_fields:
+        invalidate_directory()
+        if not created:
+            # Cached task responses and stats embed assignee usernames.
+            invalidate_task_caches()
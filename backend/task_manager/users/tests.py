@@ -1,3 +1,104 @@
-# from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
 
-# Create your tests here.
+
+@override_settings(USERS_PAGE_SIZE=2)
+class UserListTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="carol", password="testpass"
+        )
+        User.objects.bulk_create(
+            User(username=name, password="!")
+            for name in ["alice", "albert", "Alex", "bob"]
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}"
+        )
+
+    def usernames(self, url, params=None):
+        names = []
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            names += [user["username"] for user in response.json()["results"]]
+            url, params = response.json()["next"], None
+        return names
+
+    def test_pages_in_username_order(self):
+        response = self.client.get("/api/users/")
+        self.assertEqual(len(response.json()["results"]), 2)
+        self.assertEqual(
+            self.usernames("/api/users/"),
+            ["Alex", "albert", "alice", "bob", "carol"],
+        )
+
+    def test_page_size(self):
+        response = self.client.get("/api/users/", {"page_size": 4})
+        self.assertEqual(len(response.json()["results"]), 4)
+
+    def test_prefix_search(self):
+        self.assertEqual(
+            self.usernames("/api/users/", {"search": "al"}),
+            ["albert", "alice"],
+        )
+        self.assertEqual(self.usernames("/api/users/", {"search": "z"}), [])
+
+
+class UserDirectoryTests(APITestCase):
+    url = "/api/users/directory/"
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="carol", password="testpass"
+        )
+        User.objects.create_user(username="alice", password="testpass")
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}"
+        )
+
+    def test_lists_every_user(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [user["username"] for user in response.json()],
+            ["alice", "carol"],
+        )
+        self.assertEqual(
+            response.json()[1], {"id": self.user.id, "username": "carol"}
+        )
+
+    def test_served_from_cache_until_a_user_changes(self):
+        etag = self.client.get(self.url)["ETag"]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(response["ETag"], etag)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        User.objects.create_user(username="dave", password="testpass")
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()), 3)
+
+    def test_other_field_updates_keep_directory(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.user.first_name = "Carol"
+        self.user.save(update_fields=["first_name"])
+        self.assertEqual(self.client.get(self.url)["ETag"], etag)
+        self.user.username = "caroline"
+        self.user.save()
+        response = self.client.get(self.url)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertIn("caroline", [u["username"] for u in response.json()])
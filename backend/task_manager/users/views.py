@@ -1,15 +1,74 @@
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
-from rest_framework_simplejwt.authentication import JWTAuthentication
-from rest_framework.throttling import UserRateThrottle, AnonRateThrottle
+from rest_framework.response import Response
 from django.contrib.auth.models import User
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from task_manager.authentication import CachedJWTAuthentication
+from task_manager.throttling import (
+    AtomicAnonRateThrottle,
+    AtomicUserRateThrottle,
+)
+from tasks.conditional import not_modified, set_validator_headers
+from .cache import directory_etag, get_directory, get_directory_version
+from .filters import UsernamePrefixFilter
+from .pagination import UserCursorPagination
 from .serializers import UserSerializer
 
 
 class UserViewSet(viewsets.ModelViewSet):
-    queryset = User.objects.all()
+    queryset = User.objects.only("id", "username").order_by("username")
     serializer_class = UserSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAuthenticated]
-    throttle_classes = [UserRateThrottle, AnonRateThrottle]
-    pagination_class = None
+    throttle_classes = [AtomicUserRateThrottle, AtomicAnonRateThrottle]
+    pagination_class = UserCursorPagination
+    filter_backends = [UsernamePrefixFilter]
+
+    @swagger_auto_schema(
+        operation_description=(
+            "List users in username order, a page at a time. Follow the "
+            "`next`/`previous` links to page."
+        ),
+        manual_parameters=[
+            openapi.Parameter(
+                "search",
+                openapi.IN_QUERY,
+                description="Only usernames starting with this text.",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "page_size",
+                openapi.IN_QUERY,
+                description="Rows per page, capped at USERS_MAX_PAGE_SIZE.",
+                type=openapi.TYPE_INTEGER,
+            ),
+        ],
+    )
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Every user's id and username in one unpaginated response, "
+            "served from a cache that any user change invalidates. Send the "
+            "returned `ETag` as `If-None-Match` to get 304 while it is "
+            "unchanged."
+        ),
+        responses={200: UserSerializer(many=True)},
+    )
+    @action(
+        detail=False,
+        methods=["get"],
+        pagination_class=None,
+        filter_backends=[],
+    )
+    def directory(self, request):
+        version = get_directory_version()
+        entry = {"etag": directory_etag(version), "last_modified": None}
+        # Answered from the version alone, without loading the directory.
+        response = not_modified(request, entry)
+        if response is not None:
+            return response
+        return set_validator_headers(Response(get_directory(version)), entry)
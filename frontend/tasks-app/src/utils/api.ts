@@ -131,6 +131,11 @@ export async function deleteTask(id: number) {
   return apiRequest<void>("delete", `${API_URL_BASE}tasks/${id}/`);
 }
 
+// Every user's id and username, for assignee pickers. The response carries
+// an ETag, so the browser revalidates it instead of downloading it again.
 export async function getUsers() {
-  return apiRequest<UserApiResponse>("get", `${API_URL_BASE}users/`);
+  return apiRequest<UserApiResponse>(
+    "get",
+    `${API_URL_BASE}users/directory/`,
+  );
 }